@@ -0,0 +1,255 @@
+"""
+Benchmarks for the drafting hot paths on generated data of realistic size.
+
+    python benchmarks/run_benchmarks.py                    # run, write results, compare with the baseline
+    python benchmarks/run_benchmarks.py --update-baseline  # accept the current numbers as the new baseline
+
+Exits with status 1 when a case is slower or uses more memory than the baseline allows.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# ✅ Ensure src directory is in sys.path so benchmarks can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# The generated data fixtures live with the tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../tests')))
+
+import ban
+import draft
+import load_data
+import pick
+import synthetic_data
+import utils
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, "../src"))
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, "baseline.json")
+RESULTS_FILE = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+DEFAULT_TOLERANCE = 1.0  # Allowed slowdown / memory growth over the baseline, as a fraction; sub-ms minimums still vary by ±40%
+GATED_METRICS = ("min_ms", "peak_memory_kb")
+REPORT_ONLY_CASES = ("import_draft",)  # Cold imports swing with the disk cache far past any tolerance
+MID_DRAFT_SLOTS = 9  # Slots played before the suggestion benchmarks run, so synergy and counter are non-zero
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+
+def calibration_workload():
+    """A fixed pure Python workload, timed alongside every case as a yardstick of the machine's current speed."""
+    table = {}
+    for i in range(5000):
+        table[i % 997] = table.get(i % 997, 0) + i * 0.5
+    return sorted(table.values())
+
+
+def measure(operation, iterations, setup=None, warmup=3):
+    """
+    Times `operation` over `iterations` runs and measures its peak traced memory in one extra run.
+
+    `setup`, when given, is called untimed before every run and its result is passed to `operation`.
+    Every run is followed by a timed calibration_workload, so both minimums come from the same
+    stretch of machine load.
+    """
+    def run_once():
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        operation(argument) if setup else operation()
+        middle = time.perf_counter()
+        calibration_workload()
+        return middle - start, time.perf_counter() - middle
+
+    for _ in range(warmup):
+        run_once()
+    runs = [run_once() for _ in range(iterations)]
+    latencies = sorted(latency for latency, _ in runs)
+
+    argument = setup() if setup else None
+    tracemalloc.start()
+    operation(argument) if setup else operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / total, 2),
+        "min_ms": round(latencies[0] * 1000, 4),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "calibration_ms": round(min(calibration for _, calibration in runs) * 1000, 4),
+    }
+
+
+def import_time(module):
+    """Imports `module` in a fresh interpreter and returns the cumulative import time it reports with -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    for line in reversed(completed.stderr.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise RuntimeError(f"No -X importtime entry for {module}")
+
+
+def measure_startup(module, iterations):
+    """
+    Like `measure`, for the import of `module` in `iterations` fresh interpreters: latencies are the
+    interpreter's own -X importtime numbers (excluding interpreter startup), of which the gate only
+    compares the minimum, and the peak traced memory comes from one extra traced import.
+    """
+    latencies = sorted(import_time(module) for _ in range(iterations))
+    traced = subprocess.run(
+        [sys.executable, "-c", f"import tracemalloc; tracemalloc.start(); import {module}; print(tracemalloc.get_traced_memory()[1])"],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+
+    total = sum(latencies)
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / total, 2),
+        "min_ms": round(latencies[0] * 1000, 4),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+        "peak_memory_kb": round(int(traced.stdout) / 1024, 1),
+    }
+
+
+def play_slots(draft_data, count):
+    """Plays the first `count` greedy slots of a draft silently."""
+    for draft_type, order, team_name in draft.get_draft_slots(draft_data)[:count]:
+        if draft_type == "Ban":
+            ban.execute_ban_phase(order, team_name, False, draft_data)
+        else:
+            pick.execute_pick_phase(order, team_name, False, draft_data)
+
+
+def run_cases(iterations, seed=0):
+    """Runs every benchmark case against a warm synthetic cache and returns {case: result}."""
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(synthetic_data.synthetic_environment(seed))
+        devnull = stack.enter_context(open(os.devnull, "w"))
+        stack.enter_context(contextlib.redirect_stdout(devnull))
+
+        # ✅ The first load builds the snapshot, every timed load after it is fully warm
+        draft_data = load_data.load_and_initialize_draft()
+        team_1_name = draft_data["team_1_name"]
+        play_slots(draft_data, MID_DRAFT_SLOTS)
+        _, next_order, next_team = draft.get_draft_slots(draft_data)[MID_DRAFT_SLOTS]
+
+        patch_data = load_data.load_patch_data()
+        team_data = load_data.load_team_data(synthetic_data.TEAM_1_TAGS, synthetic_data.TEAM_2_TAGS)
+        scoring_engine = draft_data["scoring_engine"]
+
+        def fresh_draft():
+            return load_data.initialize_draft(
+                patch_data, team_data, draft_data["map_name"], synthetic_data.TEAM_1_NAME, synthetic_data.TEAM_2_NAME, scoring_engine
+            )
+
+        return {
+            "select_best_pick_with_reason": measure(
+                lambda: pick.select_best_pick_with_reason(draft_data, team_1_name, next_order + 1, num_suggestions=5), iterations
+            ),
+            "get_ban_suggestions": measure(lambda: ban.get_ban_suggestions(draft_data, next_team, num_suggestions=5), iterations),
+            "get_hero_player_pool_sizes": measure(lambda: utils.get_hero_player_pool_sizes(draft_data, team_1_name), iterations),
+            "execute_draft_phase": measure(
+                lambda fresh: draft.execute_draft_phase(fresh, user_input_enabled=False), max(1, iterations // 10), setup=fresh_draft
+            ),
+            "load_and_initialize_draft": measure(load_data.load_and_initialize_draft, max(1, iterations // 10)),
+            # ✅ Startup budget: batch jobs start many short-lived processes that each pay this
+            "import_draft": measure_startup("draft", max(1, iterations // 20)),
+        }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns a list of regression messages for results whose minimum latency or peak memory exceed the
+    baseline by more than `tolerance`. Noise from the machine (other processes, a cold disk cache)
+    only ever adds time, so the fastest run is the stable measure of the code itself; p50 and p99 of
+    few runs, and cold imports in particular, vary by half between runs and are only reported.
+    Latency limits are scaled by how much slower the case's calibration workload ran than in the
+    baseline, as load on a shared machine slows the code and the yardstick alike.
+    """
+    regressions = []
+    for case, result in results.items():
+        expected = baseline.get(case)
+        if expected is None or case in REPORT_ONLY_CASES:
+            continue
+        for metric in GATED_METRICS:
+            if metric not in expected:
+                continue  # ✅ Baselines recorded before the metric existed
+            limit = expected[metric] * (1 + tolerance)
+            if metric.endswith("_ms") and expected.get("calibration_ms") and result.get("calibration_ms"):
+                limit *= result["calibration_ms"] / expected["calibration_ms"]
+            if result[metric] > limit:
+                regressions.append(f"{case}: {metric} {result[metric]} > {limit:.4g} (baseline {expected[metric]})")
+    return regressions
+
+
+def print_table(results, baseline):
+    print(f"{'Case':<30} {'ops/sec':>12} {'min ms':>10} {'p50 ms':>10} {'p99 ms':>10} {'peak KiB':>10} {'min vs base':>12}")
+    print("=" * 101)
+    for case, result in results.items():
+        expected = baseline.get(case)
+        change = f"{result['min_ms'] / expected['min_ms'] - 1:+.0%}" if expected and expected.get("min_ms") else "-"
+        print(f"{case:<30} {result['ops_per_sec']:>12.1f} {result['min_ms']:>10.3f} {result['p50_ms']:>10.3f} {result['p99_ms']:>10.3f} "
+              f"{result['peak_memory_kb']:>10.1f} {change:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the drafting hot paths against a stored baseline.")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed runs per case (full drafts and loads run a tenth of it)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated data")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed regression over the baseline, as a fraction")
+    parser.add_argument("--output", default=RESULTS_FILE, help="Where to write the results JSON")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.iterations, args.seed)
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "results": results,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print_table(results, {})
+        print(f"\n✅ Baseline written to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    print_table(results, baseline)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ PERFORMANCE REGRESSION against the baseline:\n  " + "\n  ".join(regressions))
+        return 1
+    print(f"\n✅ No regressions (tolerance {args.tolerance:.0%}). Results: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
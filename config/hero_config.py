@@ -15,6 +15,26 @@ additional_hero_roles = {
     "Zeratul": ["Offlaner"]
 }
 
+# Short names accepted when typing a hero during a live draft
+hero_aliases = {
+    "Anub": "Anub'arak",
+    "Butcher": "The Butcher",
+    "Deckard Cain": "Deckard",
+    "Guldan": "Gul'dan",
+    "Hammer": "Sgt. Hammer",
+    "KT": "Kel'Thuzad",
+    "Kael": "Kael'thas",
+    "LiLi": "Li Li",
+    "Morales": "Lt. Morales",
+    "Malf": "Malfurion",
+    "Mal": "Mal'Ganis",
+    "Ming": "Li-Ming",
+    "TLV": "The Lost Vikings",
+    "Vikings": "The Lost Vikings",
+    "Whitey": "Whitemane",
+    "Zul": "Zul'jin",
+}
+
 forbidden_heroes = ["Cho", "Gall"]
 required_roles = ["Tank", "Healer", "Offlaner"]
 
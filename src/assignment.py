@@ -0,0 +1,212 @@
+"""
+Joint player-to-hero assignment for pick slots.
+
+The greedy picks rank every player's best hero on its own. This backend instead solves the best
+completion of the team: one hero for each remaining player, each hero used once, within the role
+limits, covering the missing required roles when possible, and with every middle/late hero
+fitting into one of the team's remaining middle/late pick slots. The suggested pick is the
+(player, hero) of that completion that is allowed now and that loses the most if the enemy takes
+the hero first; alternatives are ranked by how much they lose against the best completion.
+
+Scores are the greedy pick scores at the current slot (MMR, map bonus, synergy and counter with
+the heroes already picked). The timing limits cut across the role limits, so the assignment is not
+a network flow; it is solved exactly by branch and bound. Within one role and timing class heroes
+are interchangeable for the constraints, so at most one per remaining player of each class can be
+in an optimal completion, and the per-player candidate lists are cut to that.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+import instrumentation
+import scoring
+import search
+
+ALTERNATIVES_PER_PLAYER = 3  # Heroes per player, besides the completion's, evaluated as the pick now
+
+# `candidates[i]` are (score, hero index, role code, timing) of `players[i]`, best first;
+# timing is 0 for any slot, 1 for middle or later slots, 2 for late slots
+Completion = namedtuple("Completion", ["players", "candidates", "role_room", "role_used", "missing_roles", "orders"])
+
+
+class Suggestion(namedtuple("Suggestion", ["loss", "score", "player", "hero", "role", "reason"])):
+    """
+    A pick suggestion shaped like the greedy ones. `missed_roles` is how many more required roles the
+    best completion after this pick leaves uncovered; the loss is None then, as the scores of
+    completions covering different roles don't compare.
+    """
+
+    def __new__(cls, loss, score, player, hero, role, reason, missed_roles=0):
+        suggestion = super().__new__(cls, loss, score, player, hero, role, reason)
+        suggestion.missed_roles = missed_roles
+        return suggestion
+
+
+def _timing_classes(engine):
+    return np.where(engine.needs_late, 2, np.where(engine.needs_middle, 1, 0))
+
+
+def _allowed_at(timing, order):
+    return timing == 0 or (timing == 1 and order >= scoring.MIDDLE_PICK_ORDER) or order >= scoring.LATE_PICK_ORDER
+
+
+def completion_problem(state, team_name, orders):
+    """Builds the assignment problem of `team_name`'s remaining players over its remaining pick `orders`."""
+    engine = state.scoring_engine
+    side = "team_1" if team_name == state["team_1_name"] else "team_2"
+    tables = engine.teams[side]
+    role_counts = state["team_roles"][team_name]
+
+    hero_mask = engine.hero_mask(state, "available_heroes") & ~engine.forbidden_mask
+    hero_mask &= ~engine.hero_mask(state, "picked_heroes") & ~engine.hero_mask(state, "banned_heroes")
+    role_room = {}
+    for role, limit in state.get("role_limits", {}).items():
+        if role in engine.roles:
+            role_room[engine.roles.index(role)] = limit
+            if role_counts.get(role, 0) >= limit:
+                hero_mask &= engine.role_codes != engine.roles.index(role)
+    missing_roles = frozenset(engine.roles.index(r) for r in state["required_roles"] if r in engine.roles and role_counts.get(r, 0) == 0)
+
+    players = [player for player in state[f"available_players_{side}"] if player in tables.player_index]
+    rows = [tables.player_index[player] for player in players]
+    _, synergy, counter = engine.hero_scores(state, team_name)
+    scores = engine.base_scores(side, state["map_name"])[rows] + (synergy * 25) + (counter * 25)
+    valid = tables.played[rows] & hero_mask
+    timing = _timing_classes(engine)
+    group = engine.role_codes.astype(np.int64) * 3 + timing
+
+    candidates = []
+    for position in range(len(players)):
+        heroes = np.flatnonzero(valid[position])
+        # ✅ Best first, then at most len(players) heroes per (role, timing) group
+        heroes = heroes[np.lexsort((-scores[position, heroes], group[heroes]))]
+        first = np.searchsorted(group[heroes], group[heroes], side="left")
+        heroes = heroes[np.arange(len(heroes)) - first < len(players)]
+        heroes = heroes[np.argsort(-scores[position, heroes], kind="stable")]
+        candidates.append([(scores[position, hero].item(), hero.item(), engine.role_codes[hero].item(), timing[hero].item()) for hero in heroes])
+
+    used = {code: role_counts.get(engine.roles[code], 0) for code in role_room}
+    return Completion(players, candidates, role_room, used, missing_roles, sorted(orders))
+
+
+def solve(problem, player_ids=None, orders=None, taken=frozenset(), role_used=None, covered=frozenset()):
+    """
+    Returns ((roles covered, total score), [(player id, candidate)]) of the best completion for
+    `player_ids` (default: all) over the pick `orders`, with the `taken` heroes unavailable. A
+    player without any assignable hero is left out with a score of 0.
+    """
+    player_ids = list(range(len(problem.players)) if player_ids is None else player_ids)
+    orders = problem.orders if orders is None else orders
+    role_used = dict(problem.role_used if role_used is None else role_used)
+    late_slots = sum(order >= scoring.LATE_PICK_ORDER for order in orders)
+    middle_slots = sum(order >= scoring.MIDDLE_PICK_ORDER for order in orders)
+
+    # ✅ Players with the best top score first: the first leaf is the greedy completion
+    player_ids.sort(key=lambda pid: -problem.candidates[pid][0][0] if problem.candidates[pid] else 0.0)
+    suffix = [0.0] * (len(player_ids) + 1)
+    for k in range(len(player_ids) - 1, -1, -1):
+        candidates = problem.candidates[player_ids[k]]
+        suffix[k] = suffix[k + 1] + (candidates[0][0] if candidates else 0.0)
+
+    missing = problem.missing_roles
+    best = [(-1, -np.inf), None]
+    chosen = []
+    taken = set(taken)
+
+    def search_from(k, total, late, middle, covered):
+        if k == len(player_ids):
+            if (len(covered), total) > best[0]:
+                best[0], best[1] = (len(covered), total), list(chosen)
+            return
+        reachable = len(covered) + min(len(missing - covered), len(player_ids) - k)
+        if (reachable, total + suffix[k]) <= best[0]:
+            return
+
+        pid = player_ids[k]
+        for candidate in problem.candidates[pid]:
+            score, hero, role, timing = candidate
+            if (reachable, total + score + suffix[k + 1]) <= best[0]:
+                break  # ✅ Candidates are sorted, no later one can do better
+            if hero in taken or (role in problem.role_room and role_used[role] >= problem.role_room[role]):
+                continue
+            next_late, next_middle = late + (timing == 2), middle + (timing >= 1)
+            if next_late > late_slots or next_middle > middle_slots or len(chosen) >= len(orders):
+                continue
+
+            taken.add(hero)
+            if role in role_used:
+                role_used[role] += 1
+            chosen.append((pid, candidate))
+            search_from(k + 1, total + score, next_late, next_middle, covered | {role} if role in missing else covered)
+            chosen.pop()
+            if role in role_used:
+                role_used[role] -= 1
+            taken.discard(hero)
+
+        search_from(k + 1, total, late, middle, covered)  # Nothing assignable for this player
+
+    with instrumentation.span("assignment"):
+        search_from(0, 0.0, 0, 0, frozenset(covered))
+    return best[0], best[1]
+
+
+def _fix_pick(problem, candidate):
+    """Returns the role counts and covered roles after the pick of `candidate`."""
+    role_used = dict(problem.role_used)
+    if candidate[2] in role_used:
+        role_used[candidate[2]] += 1
+    covered = frozenset({candidate[2]}) & problem.missing_roles
+    return role_used, covered
+
+
+def assignment_suggestions(DRAFT_DATA, slots, time_limit=search.DEFAULT_TIME_LIMIT, num_suggestions=search.DEFAULT_BRANCHING):
+    """
+    Returns pick suggestions for the first of `slots` from the best joint completion of the team's
+    remaining picks (see the module docstring), as Suggestion tuples shaped like the results of
+    `pick.select_best_pick_with_reason`. Ban slots return None, keeping the greedy bans.
+    """
+    draft_type, order, team_name = slots[0]
+    if draft_type != "Pick":
+        return None
+
+    state = search.as_draft_state(DRAFT_DATA)
+    engine = state.scoring_engine
+    orders = [slot_order for slot_type, slot_order, slot_team in slots if slot_type == "Pick" and slot_team == team_name]
+    problem = completion_problem(state, team_name, orders)
+    best, completion = solve(problem)
+    later_orders = sorted(orders)[1:]
+
+    # ✅ The completion's picks allowed now, then each player's best other heroes allowed now
+    pairs = [(pid, candidate) for pid, candidate in completion if _allowed_at(candidate[3], order)]
+    in_completion = set(pairs)
+    for pid, candidates in enumerate(problem.candidates):
+        pairs += [(pid, c) for c in candidates if _allowed_at(c[3], order) and (pid, c) not in in_completion][:ALTERNATIVES_PER_PLAYER]
+
+    ranked = []
+    for pid, candidate in pairs:
+        if (pid, candidate) in in_completion:
+            value = best
+            # ✅ Contested: what the completion loses if the enemy takes this hero first
+            without, _ = solve(problem, taken={candidate[1]})
+            contested = best[1] - without[1] if without[0] == best[0] else np.inf
+        else:
+            role_used, covered = _fix_pick(problem, candidate)
+            rest, _ = solve(problem, [p for p in range(len(problem.players)) if p != pid], later_orders, {candidate[1]}, role_used, covered)
+            value = (rest[0], rest[1] + candidate[0])
+            contested = 0.0
+        ranked.append((value, contested, pid, candidate))
+
+    if not ranked:
+        raise ValueError(f"❌ ERROR: No valid picks available for {team_name}. Check available heroes and players.")
+    ranked.sort(key=lambda x: (x[0], x[1]), reverse=True)
+
+    plan = ", ".join(f"{problem.players[pid]} {engine.heroes[c[1]]}" for pid, c in sorted(completion, key=lambda x: x[0]))
+    suggestions = []
+    for value, contested, pid, (score, hero, role, _) in ranked[:num_suggestions]:
+        missed_roles = best[0] - value[0]
+        loss = value[1] - best[1] if not missed_roles else None
+        loss_note = f"Loss: {loss:+.2f}" if not missed_roles else f"Misses {missed_roles} required role(s)"
+        reason = (f"Score: {score:.2f}, Completion: {best[1]:.2f} over {len(completion)} picks, {loss_note}, "
+                  f"Contested: {'only option for a required role' if np.isinf(contested) else f'{contested:.2f}'}, Plan: {plan}, Role: {engine.roles[role]}")
+        suggestions.append(Suggestion(loss, score, problem.players[pid], engine.heroes[hero], engine.roles[role], reason, missed_roles))
+    return suggestions
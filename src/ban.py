@@ -1,16 +1,23 @@
+import draft_state
+import hero_lookup
+import instrumentation
 import utils
 import interface
 
 
-def execute_ban_phase(order, team_name, user_input_enabled, DRAFT_DATA):
-    """Handles banning heroes, allowing manual input when enabled, with suggested bans and reasons."""
+def execute_ban_phase(order, team_name, user_input_enabled, DRAFT_DATA, suggestions=None):
+    """Handles banning heroes, allowing manual input when enabled, with suggested bans and reasons.
+
+    `suggestions` replaces the greedy suggestions when a search backend already ranked the bans.
+    """
 
     if not user_input_enabled:
-        score, score_drop, ban, player, hero_mmr, map_bonus, synergy_score, counter_score, reason = get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=1)[0]
-        reason = f"Score: {score:.2f}, Banning {ban} forces {player} to choose another option."
+        score, score_drop, ban, player, hero_mmr, map_bonus, synergy_score, counter_score, reason = (suggestions or get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=1))[0]
+        if suggestions is None:
+            reason = f"Score: {score:.2f}, Banning {ban} forces {player} to choose another option."
     else:
         # ✅ Provide suggestions before user input with reasons
-        ban_suggestions = get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=5)
+        ban_suggestions = suggestions or get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=5)
         # (score, score_drop, hero, player, hero_mmr, map_bonus, synergy_score, counter_score, reason))
         formatted_suggestions = [f"{b[2]} (Reason: {b[8]})" for b in ban_suggestions]
         print("\nSuggested Bans:\n" + "\n".join(formatted_suggestions))
@@ -21,17 +28,18 @@ def execute_ban_phase(order, team_name, user_input_enabled, DRAFT_DATA):
             DRAFT_DATA["hero_roles"],
             DRAFT_DATA["picked_heroes"],
             DRAFT_DATA["banned_heroes"],
-            formatted_suggestions
+            [b[2] for b in ban_suggestions],
+            hero_lookup.for_draft(DRAFT_DATA)
         )
-        if selected_ban in [s[2] for s in ban_suggestions]:
-            score, score_drop, ban, player, hero_mmr, map_bonus, synergy_score, counter_score, reason = ban_suggestions[0]  # Default to best suggestion
+        if selected_ban in [s[2] for s in ban_suggestions]:  # If selected hero is in suggestions
+            selected = next(s for s in ban_suggestions if s[2] == selected_ban)
+            score, score_drop, ban, player, hero_mmr, map_bonus, synergy_score, counter_score, reason = selected
         else:
             ban = selected_ban
             score, reason = 0, "Manual input"
 
     # ✅ Move DRAFT_DATA modifications here to avoid removing multiple heroes at once
-    DRAFT_DATA["banned_heroes"].add(ban)
-    DRAFT_DATA["available_heroes"].remove(ban)
+    draft_state.apply_ban(DRAFT_DATA, team_name, ban)
     DRAFT_DATA["draft_log"].append((order, "Ban", team_name, ban, score, reason))
 
     print(f"{order:<6} Ban   {team_name:<25} {'-':<20} {ban:<15} {score:<10.2f} {reason}")
@@ -39,6 +47,11 @@ def execute_ban_phase(order, team_name, user_input_enabled, DRAFT_DATA):
 
 def get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=1):
     """Returns a list of the top `num_suggestions` ban options based on impact, ranked by MMR, map bonus, and matchup advantage."""
+    # ✅ Use the vectorized engine when the draft was initialized with one
+    scoring_engine = DRAFT_DATA.get("scoring_engine")
+    if scoring_engine is not None:
+        return scoring_engine.ban_suggestions(DRAFT_DATA, team_name, num_suggestions)
+
     # ✅ Ensure we are banning against the correct team
     if team_name == DRAFT_DATA["team_1_name"]:
         # team 1 is banning
@@ -58,7 +71,8 @@ def get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=1):
     excluded_heroes = enemy_picked_heroes | DRAFT_DATA["banned_heroes"]
     available_heroes = DRAFT_DATA["available_heroes"] - excluded_heroes
 
-    player_hero_pool_sizes = utils.get_hero_player_pool_sizes(DRAFT_DATA, enemy_team_name)
+    with instrumentation.span("pool_sizes"):
+        player_hero_pool_sizes = utils.get_hero_player_pool_sizes(DRAFT_DATA, enemy_team_name)
 
     # ✅ Determine max pool size to scale the boost
     max_pool_size = max(player_hero_pool_sizes.values(), default=1)
@@ -76,16 +90,20 @@ def get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=1):
             stats = player_data["Storm League"][hero]
 
             hero_mmr = round(stats.get("mmr", 2000), 2)
-            map_bonus = round(DRAFT_DATA["hero_winrates_by_map"].get(DRAFT_DATA["map_name"], {}).get(hero, {}).get("win_rate", 50) - 50, 2)
-            synergy_score = round(utils.calculate_allied_synergy_score(DRAFT_DATA, hero, team_name), 2)
-            counter_score = round(utils.calculate_enemy_countering_score(DRAFT_DATA, hero, team_name), 2)
+            with instrumentation.span("map_bonus"):
+                map_bonus = round(DRAFT_DATA["hero_winrates_by_map"].get(DRAFT_DATA["map_name"], {}).get(hero, {}).get("win_rate", 50) - 50, 2)
+            with instrumentation.span("synergy"):
+                synergy_score = round(utils.calculate_allied_synergy_score(DRAFT_DATA, hero, team_name), 2)
+            with instrumentation.span("counter"):
+                counter_score = round(utils.calculate_enemy_countering_score(DRAFT_DATA, hero, team_name), 2)
 
             score = hero_mmr + (map_bonus * 50) + (synergy_score * 25) + (counter_score * 25)
 
         # ✅ Store top hero scores
             hero_scores.append((score, hero, player, hero_mmr, map_bonus, synergy_score, counter_score))
 
-        hero_scores.sort(reverse=True, key=lambda x: x[0])
+        with instrumentation.span("sorting"):
+            hero_scores.sort(reverse=True, key=lambda x: x[0])
 
         # ✅ Apply a **boost** to players with smaller hero pools
         hero_pool_size = player_hero_pool_sizes.get(player, 0)
@@ -99,7 +117,8 @@ def get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=1):
         candidates.append((score, score_drop, hero, player, hero_mmr, map_bonus, synergy_score, counter_score, reason))
 
     # ✅ Sort and return the top `num_suggestions`
-    candidates.sort(reverse=True, key=lambda x: x[1])
+    with instrumentation.span("sorting"):
+        candidates.sort(reverse=True, key=lambda x: x[1])
     ban_suggestions = candidates[:num_suggestions]
 
     return ban_suggestions
@@ -0,0 +1,163 @@
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections import namedtuple
+from urllib.parse import urlencode
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+CacheEntry = namedtuple("CacheEntry", ["value", "fetched_at", "expires_at"])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+def cache_key(endpoint, params=None):
+    """Canonical cache key: the endpoint plus its params sorted by name, without the API token."""
+    params = sorted((key, str(value)) for key, value in (params or {}).items() if key != "api_token")
+    return f"{endpoint}?{urlencode(params)}" if params else endpoint
+
+
+class CacheStore:
+    """
+    Single-file SQLite cache for API responses.
+
+    Payloads are pickled and zlib-compressed. Every entry records when it was fetched and last read,
+    entries can carry a TTL, and the least recently read entries are evicted once the payloads exceed
+    `max_bytes`. Safe to share between threads; other processes may open the same file.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(_SCHEMA)
+
+    def get(self, key, allow_expired=False):
+        """Returns the CacheEntry for `key`, or None on a miss."""
+        return self.get_many([key], allow_expired).get(key)
+
+    def get_many(self, keys, allow_expired=False):
+        """Returns {key: CacheEntry} for every key in `keys` that is cached, in one query."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        now = time.time()
+        entries = {}
+        with self.lock:
+            # ✅ SQLite caps the number of bound parameters, so very large lookups are chunked
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.connection.execute(
+                    f"SELECT key, payload, fetched_at, expires_at FROM entries WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, payload, fetched_at, expires_at in rows:
+                    if expires_at is not None and expires_at <= now and not allow_expired:
+                        continue
+                    entries[key] = CacheEntry(pickle.loads(zlib.decompress(payload)), fetched_at, expires_at)
+
+            if entries:
+                self.connection.executemany("UPDATE entries SET accessed_at = ? WHERE key = ?", [(now, key) for key in entries])
+        return entries
+
+    def fetched_at_many(self, keys):
+        """Returns {key: fetched_at} for every cached key in `keys` without loading the payloads."""
+        keys = list(dict.fromkeys(keys))
+        fetched = {}
+        with self.lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                fetched.update(self.connection.execute(
+                    f"SELECT key, fetched_at FROM entries WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+        return fetched
+
+    def fresh_keys(self, keys):
+        """Returns the keys in `keys` that are cached and not expired, without loading the payloads."""
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        fresh = set()
+        with self.lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                fresh.update(key for key, in self.connection.execute(
+                    f"SELECT key FROM entries WHERE key IN ({placeholders}) AND (expires_at IS NULL OR expires_at > ?)", chunk + [now]
+                ).fetchall())
+        return fresh
+
+    def put(self, key, value, ttl=None, fetched_at=None):
+        """Stores `value` under `key`, expiring after `ttl` seconds when given."""
+        self.put_many({key: value}, ttl, fetched_at)
+
+    def put_many(self, items, ttl=None, fetched_at=None):
+        """Stores every {key: value} in `items` in one transaction."""
+        if not items:
+            return
+
+        fetched_at = fetched_at or time.time()
+        expires_at = fetched_at + ttl if ttl is not None else None
+        rows = []
+        for key, value in items.items():
+            payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            rows.append((key, payload, len(payload), fetched_at, fetched_at, expires_at))
+
+        with self.lock:
+            with self.connection:
+                self.connection.execute("BEGIN")
+                self.connection.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._evict()
+
+    def delete(self, key):
+        with self.lock:
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def keys(self, prefix=""):
+        """Returns all cached keys starting with `prefix`."""
+        with self.lock:
+            rows = self.connection.execute("SELECT key FROM entries WHERE key >= ? AND key < ?", (prefix, prefix + "\uffff")).fetchall()
+        return [key for key, in rows]
+
+    def purge_expired(self):
+        """Deletes every expired entry."""
+        with self.lock:
+            self.connection.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+    def total_size(self):
+        with self.lock:
+            return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self):
+        """Drops least recently read entries until the payloads fit in `max_bytes` (lock must be held)."""
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self.connection.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self.connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,205 @@
+import os
+import time
+import weakref
+
+import instrumentation
+import search
+
+DEFAULT_CANDIDATES = 80
+BATCH_SIZE = 16
+LINE_CACHE_SIZE = 1024
+
+# Greedy lines per ScoringEngine, keyed by (map, rosters, state hash, pick slots)
+_line_cache = weakref.WeakKeyDictionary()
+
+
+def pick_slots_of(slots):
+    """Returns the (order, team_name) pick slots of (draft_type, order, team_name) `slots`."""
+    return tuple((order, team_name) for draft_type, order, team_name in slots if draft_type == "Pick")
+
+
+def greedy_line(state, pick_slots, start=0):
+    """
+    Plays the greedy pick of every slot in `pick_slots[start:]` on the DraftState and undoes them again.
+
+    Returns one (team_name, player, hero, role, score, contenders) step per slot, where `contenders`
+    are the heroes a ban would have to remove to change that pick. Player and hero are None when the
+    team has nothing left to pick.
+    """
+    engine = state.scoring_engine
+    line = []
+    applied = 0
+    try:
+        with instrumentation.span("rollout"):
+            for order, team_name in pick_slots[start:]:
+                contenders = {}
+                try:
+                    _, score, player, hero, role, _ = engine.pick_suggestions(state, team_name, order, 1, contenders)[0]
+                except ValueError:
+                    line.append((team_name, None, None, None, 0.0, contenders))
+                    continue
+                state.apply(("Pick", team_name, hero, player, role))
+                applied += 1
+                line.append((team_name, player, hero, role, score, contenders))
+    finally:
+        for _ in range(applied):
+            state.undo()
+    return line
+
+
+def ban_line(state, team_name, hero, pick_slots, baseline):
+    """
+    Returns the greedy line of `pick_slots` after `team_name` bans `hero`.
+
+    A ban only changes a pick if the hero is the best or second-best option of one of the players,
+    so the baseline is reused up to the first such pick and only the rest is replayed.
+    """
+    divergence = next((index for index, step in enumerate(baseline) if hero in step[5]), None)
+    if divergence is None:
+        return baseline
+
+    state.apply(("Ban", team_name, hero))
+    applied = 1
+    try:
+        for step_team, player, picked_hero, role, _, _ in baseline[:divergence]:
+            if player is not None:
+                state.apply(("Pick", step_team, picked_hero, player, role))
+                applied += 1
+        return baseline[:divergence] + greedy_line(state, pick_slots, divergence)
+    finally:
+        for _ in range(applied):
+            state.undo()
+
+
+def line_totals(line, team_name):
+    """Returns the summed pick scores of `team_name` and of the other team in `line`."""
+    ally_total = sum(step[4] for step in line if step[0] == team_name)
+    enemy_total = sum(step[4] for step in line if step[0] != team_name)
+    return ally_total, enemy_total
+
+
+def _cache_key(state, pick_slots):
+    return state["map_name"], state.context.rosters, state.hash, pick_slots
+
+
+def _cache_lines(state):
+    return _line_cache.setdefault(state.scoring_engine, {})
+
+
+def _store_line(lines, key, line):
+    if len(lines) >= LINE_CACHE_SIZE:
+        del lines[next(iter(lines))]
+    lines[key] = line
+
+
+def cached_greedy_line(state, pick_slots):
+    """`greedy_line` of the whole `pick_slots`, memoized across calls and draft slots."""
+    lines = _cache_lines(state)
+    key = _cache_key(state, pick_slots)
+    line = lines.get(key)
+    if line is None:
+        line = greedy_line(state, pick_slots)
+        _store_line(lines, key, line)
+    return line
+
+
+def _ban_key(state, team_name, hero, pick_slots):
+    state.apply(("Ban", team_name, hero))
+    try:
+        return _cache_key(state, pick_slots)
+    finally:
+        state.undo()
+
+
+def evaluate_bans(state, team_name, heroes, pick_slots, baseline, time_limit):
+    """
+    Process pool entry point: returns [(hero, line)] for `heroes` in order, stopping early once
+    `time_limit` seconds have passed.
+    """
+    deadline = time.perf_counter() + time_limit
+    results = []
+    for hero in heroes:
+        if results and time.perf_counter() > deadline:
+            break
+        results.append((hero, ban_line(state, team_name, hero, pick_slots, baseline)))
+    return results
+
+
+def counterfactual_suggestions(DRAFT_DATA, slots, time_limit=search.DEFAULT_TIME_LIMIT, num_suggestions=search.DEFAULT_BRANCHING,
+                               max_candidates=DEFAULT_CANDIDATES, max_workers=1):
+    """
+    Returns ban suggestions for the first of `slots`, ranked by replaying the rest of the draft.
+
+    The remaining picks of both teams are played greedily once without a ban and once per candidate
+    ban; a ban is worth the change in (own pick scores - enemy pick scores) it causes. Later bans are
+    not replayed. Candidates are the heroes that could change one of the greedy picks, earliest
+    first, up to `max_candidates`; banning any other hero changes nothing. With `max_workers` > 1 the
+    candidates are evaluated in batches on a process pool. Lines are cached, so the next slot starts
+    from the line of the ban that was made. Pick slots return None, keeping the greedy picks.
+    """
+    draft_type, _, team_name = slots[0]
+    if draft_type != "Ban":
+        return None
+
+    deadline = time.perf_counter() + time_limit
+    state = search.as_draft_state(DRAFT_DATA)
+    pick_slots = pick_slots_of(slots)
+    baseline = cached_greedy_line(state, pick_slots)
+
+    candidates = []
+    for step in baseline:
+        candidates.extend(hero for hero in step[5] if hero not in candidates)
+    candidates = candidates[:max_candidates]
+    if not candidates:
+        return None
+
+    # ✅ Lines of bans evaluated for an earlier slot (e.g. the other team's ban) are reused
+    lines = _cache_lines(state)
+    keys = {hero: _ban_key(state, team_name, hero, pick_slots) for hero in candidates}
+    results = {hero: lines[keys[hero]] for hero in candidates if keys[hero] in lines}
+    pending = [hero for hero in candidates if hero not in results]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers > 1 and len(pending) > BATCH_SIZE:
+        worker_state = state.copy()
+        worker_state.draft_log = []
+        executor = search.process_pool(max_workers)
+        remaining = max(0.0, deadline - time.perf_counter())
+        futures = [
+            executor.submit(evaluate_bans, worker_state, team_name, pending[start:start + BATCH_SIZE], pick_slots, baseline, remaining)
+            for start in range(0, len(pending), BATCH_SIZE)
+        ]
+        evaluated = [result for future in futures for result in future.result()]
+    else:
+        evaluated = evaluate_bans(state, team_name, pending, pick_slots, baseline, max(0.0, deadline - time.perf_counter()))
+
+    for hero, line in evaluated:
+        results[hero] = line
+        _store_line(lines, keys[hero], line)
+
+    base_ally, base_enemy = line_totals(baseline, team_name)
+    ranked = []
+    for hero in candidates:
+        if hero in results:
+            ally_total, enemy_total = line_totals(results[hero], team_name)
+            ranked.append(((ally_total - enemy_total) - (base_ally - base_enemy), base_enemy - enemy_total, hero))
+    ranked.sort(key=lambda x: (x[0], x[1]), reverse=True)
+
+    engine = state.scoring_engine
+    map_bonus, synergy, counter = engine.hero_scores(state, team_name)
+    suggestions = []
+    for swing, enemy_loss, hero in ranked[:num_suggestions]:
+        line = results[hero]
+        divergence = next(index for index, step in enumerate(baseline) if hero in step[5])
+        player = next((step[1] for step in baseline if step[2] == hero), None) or baseline[divergence][5][hero]
+        planned = next((step[2] for step in baseline if step[1] == player), None)
+        replacement = next((step[2] for step in line if step[1] == player), None)
+
+        hero_idx = engine.hero_index[hero]
+        tables = engine.teams["team_1" if player in state.context.player_slots[0] else "team_2"]
+        hero_mmr = tables.score_mmr[tables.player_index[player], hero_idx].item() if player in tables.player_index else 0.0
+
+        reason = (f"Swing: {swing:+.2f}, Enemy Loss: {enemy_loss:+.2f} over {len(pick_slots)} replayed picks, "
+                  f"{player}: {planned} -> {replacement}, {len(results)}/{len(candidates)} bans evaluated")
+        suggestions.append((swing, enemy_loss, hero, player, hero_mmr, map_bonus[hero_idx].item(), synergy[hero_idx].item(), counter[hero_idx].item(), reason))
+    return suggestions
@@ -1,8 +1,16 @@
+import sys
+import time
+
+import instrumentation
 import utils  # ✅ Import utils as a package
 import load_data
 import interface
 import ban
 import pick
+import search
+import mcts
+import counterfactual
+import assignment
 
 DRAFT_ORDER = [
     ("Ban", 1), ("Ban", 2), ("Ban", 3), ("Ban", 4),
@@ -13,52 +21,96 @@ DRAFT_ORDER = [
 
 FIRST_PICK_SLOTS = {1, 3, 5, 8, 9, 11, 14, 15}
 
+# ✅ Suggestion backends: None keeps the greedy single-step suggestions
+SUGGESTION_BACKENDS = {
+    "greedy": None,
+    "alphabeta": search.search_suggestions,
+    "mcts": mcts.mcts_suggestions,
+    "counterfactual": counterfactual.counterfactual_suggestions,
+    "assignment": assignment.assignment_suggestions,
+}
+
+
+def get_draft_slots(draft_data, first_pick_team=1):
+    """Returns DRAFT_ORDER as (draft_type, order, team_name) slots when `first_pick_team` (1 or 2) has first pick."""
+    return [
+        (draft_type, order, draft_data["team_1_name"] if (order in FIRST_PICK_SLOTS) == (first_pick_team == 1) else draft_data["team_2_name"])
+        for draft_type, order in DRAFT_ORDER
+    ]
+
+
+def execute_draft_phase(draft_data, user_input_enabled=True, backend="greedy", time_limit=search.DEFAULT_TIME_LIMIT, first_pick_team=1):
+    """Executes the draft process, allowing optional manual input for both teams while displaying suggestions.
+
+    `backend` selects how suggestions are ranked (see SUGGESTION_BACKENDS); `time_limit` is the
+    per-slot budget in seconds for the search backends. Returns the seconds spent on each decision,
+    keyed by draft order.
+    """
 
-def execute_draft_phase(draft_data, user_input_enabled=True):
-    """Executes the draft process, allowing optional manual input for both teams while displaying suggestions."""
+    suggest = SUGGESTION_BACKENDS[backend]
 
     if user_input_enabled:
         interface.print_available_heroes(draft_data["available_heroes"], draft_data["hero_roles"], draft_data["picked_heroes"], draft_data["banned_heroes"])
 
     print("\n🔹 STARTING DRAFT 🔹\n" + "=" * 120 + f"\n{'Order':<6} {'Type':<6} {'Team':<25} {'Player':<20} {'Hero':<15} {'Score':<10} {'Reason'}\n" + "=" * 120)
 
-    for draft_type, order in DRAFT_ORDER:
-        team_name = draft_data["team_1_name"] if (order in FIRST_PICK_SLOTS) == (first_pick_team == 1) else draft_data["team_2_name"]
+    decision_times = {}
+    slots = get_draft_slots(draft_data, first_pick_team)
+    with instrumentation.span("draft"):
+        for index, (draft_type, order, team_name) in enumerate(slots):
+            start = time.perf_counter()
+            with instrumentation.step(f"{draft_type} {order}") as step_timings:
+                with instrumentation.span(backend):
+                    suggestions = suggest(draft_data, slots[index:], time_limit) if suggest else None
 
-        if draft_type == "Ban":
-            ban.execute_ban_phase(order, team_name, user_input_enabled, draft_data)
-        elif draft_type == "Pick":
-            pick.execute_pick_phase(order, team_name, user_input_enabled, draft_data)
+                if draft_type == "Ban":
+                    ban.execute_ban_phase(order, team_name, user_input_enabled, draft_data, suggestions)
+                elif draft_type == "Pick":
+                    pick.execute_pick_phase(order, team_name, user_input_enabled, draft_data, suggestions)
+            decision_times[order] = time.perf_counter() - start
 
+            # ✅ Instrumented timings are attached to the draft log entry of the same order
+            if step_timings is not None:
+                draft_data.setdefault("step_timings", {})[order] = step_timings
 
-def draft(timeframe_type="major", timeframe="2.47"):
-    """Runs the draft process, allowing full automation or manual enemy input."""
+    return decision_times
 
-    while True:
+
+def draft(timeframe_type="major", timeframe="2.47", backend="greedy", time_limit=search.DEFAULT_TIME_LIMIT, first_pick_team=1, map_name=None, user_input_enabled=None, profile=False, lazy_matchups=False):
+    """Runs the draft process, allowing full automation or manual enemy input.
+
+    Prompts for the draft mode unless `user_input_enabled` is given. `map_name` overrides the map
+    from team_config. `profile` turns on instrumentation, whose report follows the final draft.
+    `lazy_matchups` starts the draft without waiting for matchup data (see load_data.load_patch_data).
+    """
+
+    if profile:
+        instrumentation.enable()
+
+    while user_input_enabled is None:
         mode = input("Choose draft mode: (1) Full Mock Draft, (2) Live Draft with Manual Input: ").strip()
         if mode in {"1", "2"}:
             user_input_enabled = (mode == "2")
             break
         print("❌ Invalid input. Enter 1 or 2.")
 
-    draft_data = load_data.load_and_initialize_draft(timeframe_type, timeframe)
-    execute_draft_phase(draft_data, user_input_enabled)
+    draft_data = load_data.load_and_initialize_draft(timeframe_type, timeframe, map_name=map_name, lazy_matchups=lazy_matchups)
+    execute_draft_phase(draft_data, user_input_enabled, backend, time_limit, first_pick_team)
 
     utils.print_final_draft(draft_data, user_input_enabled)
 
-    utils.save_to_pickle(draft_data["draft_log"], f"draft_{map_name}.pkl")
+    utils.save_to_pickle(draft_data["draft_log"], f"draft_{draft_data['map_name']}.pkl")
     return draft_data["draft_log"]
 
 
 if __name__ == "__main__":
 
     # ✅ Load team configuration
-    import team_config
+    team_config = utils.config_module("team_config")
     team_1_name = team_config.team_1_name
     team_1_tags = team_config.team_1_tags
     team_2_name = team_config.team_2_name
     team_2_tags = team_config.team_2_tags
-    map_name = team_config.map_name
 
     # ✅ Prompt for first pick team
     while True:
@@ -70,4 +122,4 @@ if __name__ == "__main__":
 
     # ✅ Run the draft
     # draft_log = draft(timeframe_type="major", timeframe="2.55")
-    draft_log = draft(timeframe_type="minor", timeframe="2.55.9.93640")
+    draft_log = draft(timeframe_type="minor", timeframe="2.55.9.93640", first_pick_team=first_pick_team, profile="--profile" in sys.argv[1:], lazy_matchups="--lazy" in sys.argv[1:])
@@ -1,11 +1,29 @@
 import time
-import pyautogui
-import pytesseract
-from PIL import ImageGrab
-import re
+
+# Player hexagons on the draft screen, as fractions of the screen size, in slot order
+PLAYER_POSITIONS = [
+    (0.0633, 0.1368),  # Blue team player 1 (top-left)
+    (0.1141, 0.2993),
+    (0.0656, 0.4528),
+    (0.1242, 0.6250),
+    (0.0586, 0.7639),  # Blue team player 5 (bottom-left)
+    (0.9375, 0.1389),  # Red team player 1 (top-right)
+    (0.8398, 0.2993),
+    (0.9375, 0.4528),
+    (0.8398, 0.6250),
+    (0.9375, 0.7639),  # Red team player 5 (bottom-right)
+]
+
+# Offsets from a hexagon to 'View Profile' in its right-click menu
+MENU_OFFSETS = [
+    (90, 170), (90, 160), (90, 160), (90, 170), (90, 10),  # Offsets for blue team
+    (-90, 120), (-90, 160), (-90, 160), (-90, 170), (-90, -10),  # Offsets for red team
+]
+
 
 def get_screen_size():
     """Returns the screen width and height."""
+    import pyautogui
     return pyautogui.size()
 
 
@@ -17,12 +35,15 @@ def convert_percentage_to_position(x_percent, y_percent):
 
 def capture_screen_text():
     """Captures the screen and extracts text using OCR."""
+    import pytesseract
+    from PIL import ImageGrab
     screen_image = ImageGrab.grab()
     return pytesseract.image_to_string(screen_image)
 
 
 def right_click_view_profile(player_position, menu_offset):
     """Right-clicks on a player’s hexagon and selects 'View Profile' with specific offsets."""
+    import pyautogui
     pyautogui.moveTo(player_position)
     pyautogui.rightClick()
     time.sleep(0.2)  # Wait for the menu to open
@@ -34,30 +55,17 @@ def right_click_view_profile(player_position, menu_offset):
 def extract_battletag():
     """Extracts the BattleTag from the profile window using OCR."""
     time.sleep(0.5)
-    text = capture_screen_text()
-    matches = re.findall(r'([A-Za-z0-9]+#\d{4,6})', text)  # Extracts text matching a BattleTag format
-    print(matches[0])
-    return matches[0] if matches else None
+    import ocr_pipeline
+    tag = ocr_pipeline.parse_battletag(capture_screen_text())
+    print(tag)
+    return tag
 
 def get_battletags():
     """Extracts BattleTags for all 10 players using accurate percentage-based positions."""
-    player_positions = [
-        convert_percentage_to_position(0.0633, 0.1368),  # Blue team player 1 (top-left)
-        convert_percentage_to_position(0.1141, 0.2993),
-        convert_percentage_to_position(0.0656, 0.4528),
-        convert_percentage_to_position(0.1242, 0.6250),
-        convert_percentage_to_position(0.0586, 0.7639),  # Blue team player 5 (bottom-left)
-        # convert_percentage_to_position(0.9375, 0.1389),  # Red team player 1 (top-right)
-        # convert_percentage_to_position(0.8398, 0.2993),
-        # convert_percentage_to_position(0.9375, 0.4528),
-        # convert_percentage_to_position(0.8398, 0.6250),
-        # convert_percentage_to_position(0.9375, 0.7639)  # Red team player 5 (bottom-right)
-    ]
-
-    menu_offsets = [
-        (90, 170), (90, 160), (90, 160), (90, 170), (90, 10),  # Offsets for blue team
-        # (-90, 120), (-90, 160), (-90, 160), (-90, 170), (-90, -10)  # Offsets for red team
-    ]
+    import pyautogui  # ✅ GUI and OCR packages are imported on use, so importing this module stays cheap
+    # Red team menu offsets are not calibrated yet, so only the blue team is clicked through
+    player_positions = [convert_percentage_to_position(x, y) for x, y in PLAYER_POSITIONS[:5]]
+    menu_offsets = MENU_OFFSETS[:5]
 
     battletags = []
     for pos, offset in zip(player_positions, menu_offsets):
@@ -76,6 +84,7 @@ def main():
     print(f"Team 1 BattleTags: {team_1}")
     print(f"Team 2 BattleTags: {team_2}")
     # Now you can pass these lists to draft.py
+    # ocr_pipeline.py reads name labels from a screenshot or saved image without clicking (regions not calibrated yet)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,377 @@
+"""
+Long-running draft server: loads the patch data once, keeps it warm in memory and serves any number
+of concurrent draft sessions over a local JSON HTTP API:
+
+    python draft_server.py --timeframe minor:2.55.9.93640 --host 0.0.0.0 --port 8766
+
+    GET    /health
+    POST   /sessions                           {"map_name", "first_pick_team", "backend", "time_limit",
+                                                "team_1_name", "team_1_tags", "team_2_name", "team_2_tags"}
+                                               (all optional; teams and map default to team_config)
+    GET    /sessions                           ids of the open sessions
+    GET    /sessions/<id>                      the draft so far and the next slot
+    GET    /sessions/<id>/suggestions?num=5    suggestions for the next slot
+    POST   /sessions/<id>/select               {"hero", "player"} for the next slot; "player" may be
+                                               omitted (or a unique prefix) for suggested picks
+    DELETE /sessions/<id>
+
+Team data and scoring engines are cached per roster pair, so sessions of the same teams share them.
+"""
+import argparse
+import json
+import logging
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import ban
+import draft
+import draft_state
+import load_data
+import pick
+import search
+import simulate
+import utils
+
+DEFAULT_PORT = 8766
+DEFAULT_SUGGESTIONS = 5
+SESSION_IDLE_TIMEOUT = 6 * 3600  # Seconds an untouched session is kept
+
+logger = logging.getLogger(__name__)
+
+PICK_FIELDS = ("score_drop", "score", "player", "hero", "role", "reason")
+BAN_FIELDS = ("score", "score_drop", "hero", "player", "hero_mmr", "map_bonus", "synergy", "counter", "reason")
+
+
+class DraftServerError(Exception):
+    """A request the server refuses; `status` is the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class _Teams:
+    """Loaded team data of one roster pair and the scoring engine built for it."""
+
+    def __init__(self):
+        self.team_data = None
+        self.scoring_engine = None
+        # ✅ Suggestions share the engine's matchup memo, so they are computed one at a time per engine
+        self.lock = threading.Lock()
+
+
+class DraftSession:
+    """One draft: its own DRAFT_DATA (sharing the loaded data and engine) and the slot it is at."""
+
+    def __init__(self, session_id, draft_data, teams, first_pick_team=1, backend="greedy", time_limit=search.DEFAULT_TIME_LIMIT):
+        self.session_id = session_id
+        self.draft_data = draft_data
+        self.teams = teams
+        self.first_pick_team = first_pick_team
+        self.backend = backend
+        self.time_limit = time_limit
+        self.slots = draft.get_draft_slots(draft_data, first_pick_team)
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self._suggestions = None  # (slot index, num_suggestions, suggestions) of the last request
+
+    def next_slot(self):
+        index = len(self.draft_data["draft_log"])
+        return self.slots[index] if index < len(self.slots) else None
+
+    def suggestions(self, num_suggestions=None):
+        """
+        Returns the suggestion tuples for the next slot, ranked like `draft.execute_draft_phase` does.
+        Without `num_suggestions` the last suggestions of this slot are reused, whatever their number.
+        """
+        index = len(self.draft_data["draft_log"])
+        if index >= len(self.slots):
+            raise DraftServerError("The draft is complete", 409)
+        if self._suggestions and self._suggestions[0] == index and num_suggestions in (None, self._suggestions[1]):
+            return self._suggestions[2]
+        num_suggestions = num_suggestions or DEFAULT_SUGGESTIONS
+
+        draft_type, order, team_name = self.slots[index]
+        suggest = draft.SUGGESTION_BACKENDS[self.backend]
+        with self.teams.lock:
+            suggestions = suggest(self.draft_data, self.slots[index:], self.time_limit, num_suggestions=num_suggestions) if suggest else None
+            if not suggestions and draft_type == "Ban":
+                suggestions = ban.get_ban_suggestions(self.draft_data, team_name, num_suggestions)
+            elif not suggestions:
+                suggestions = pick.select_best_pick_with_reason(self.draft_data, team_name, order, num_suggestions)
+
+        self._suggestions = (index, num_suggestions, suggestions)
+        return suggestions
+
+    def select(self, hero, player=None):
+        """Bans or picks `hero` in the next slot; a suggested hero keeps the suggestion's score, reason and player."""
+        slot = self.next_slot()
+        if slot is None:
+            raise DraftServerError("The draft is complete", 409)
+        draft_type, order, team_name = slot
+        if hero not in self.draft_data["available_heroes"]:
+            raise DraftServerError(f"{hero} is not available", 409)
+
+        if draft_type == "Ban":
+            suggestion = next((s for s in self.suggestions() if s[2] == hero), None)
+            score, reason = (suggestion[0], suggestion[8]) if suggestion else (0, "Manual input")
+            draft_state.apply_ban(self.draft_data, team_name, hero)
+            self.draft_data["draft_log"].append((order, "Ban", team_name, hero, score, reason))
+            return
+
+        team_tags = utils.get_available_players(self.draft_data, team_name)
+        if player is not None:
+            matches = [tag for tag in team_tags if tag == player] or [tag for tag in team_tags if tag.lower().startswith(player.lower())]
+            if len(matches) != 1:
+                raise DraftServerError(f"'{player}' does not identify one of {team_name}'s remaining players: {', '.join(team_tags)}")
+            player = matches[0]
+
+        suggestion = next((s for s in self.suggestions() if s[3] == hero and player in (None, s[2])), None)
+        if suggestion:
+            score, player, role, reason = suggestion[1], suggestion[2], suggestion[4], suggestion[5]
+        elif player is None:
+            raise DraftServerError(f"{hero} is not a suggested pick, say which player of {team_name} picks it")
+        else:
+            score, reason = None, None
+            role = self.draft_data["hero_roles"].get(hero, ["Unknown"])[0]
+
+        draft_state.apply_pick(self.draft_data, team_name, player, hero, role)
+        self.draft_data["draft_log"].append((order, "Pick", team_name, player, hero, score, reason))
+
+    def view(self):
+        slot = self.next_slot()
+        return {
+            "session_id": self.session_id,
+            "map_name": self.draft_data["map_name"],
+            "first_pick_team": self.first_pick_team,
+            "backend": self.backend,
+            "next": dict(zip(("type", "order", "team"), slot)) if slot else None,
+            "draft_log": self.draft_data["draft_log"],
+            "team_1_picked_heroes": self.draft_data["team_1_picked_heroes"],
+            "team_2_picked_heroes": self.draft_data["team_2_picked_heroes"],
+            "banned_heroes": sorted(self.draft_data["banned_heroes"]),
+        }
+
+
+class DraftServer(ThreadingHTTPServer):
+    """
+    Holds one timeframe's patch data and the open sessions. Every session has a lock of its own,
+    so requests to different sessions run concurrently and requests to one session are serialized.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, timeframe_type="major", timeframe="2.55", use_snapshot=True, verbose=False):
+        super().__init__(address, _Handler)
+        self.timeframe = (timeframe_type, timeframe)
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.teams = {}  # (team_1_tags, team_2_tags) -> _Teams
+
+        self.patch_data = load_data.load_patch_data(timeframe_type, timeframe, use_snapshot=use_snapshot)
+        try:
+            self.team_config = utils.config_module("team_config")
+        except FileNotFoundError:
+            self.team_config = None  # ✅ Every session has to name its teams then
+        if self.team_config is not None:
+            self._teams(self.team_config.team_1_tags, self.team_config.team_2_tags)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _teams(self, team_1_tags, team_2_tags):
+        """Returns the cached team data of a roster pair, loading it on first use without blocking other sessions."""
+        key = (tuple(team_1_tags), tuple(team_2_tags))
+        with self.lock:
+            teams = self.teams.setdefault(key, _Teams())
+        with teams.lock:
+            if teams.team_data is None:
+                teams.team_data = load_data.load_team_data(list(key[0]), list(key[1]))
+        return teams
+
+    def create_session(self, options):
+        defaults = self.team_config
+        try:
+            team_1_name = options.get("team_1_name") or defaults.team_1_name
+            team_2_name = options.get("team_2_name") or defaults.team_2_name
+            team_1_tags = options.get("team_1_tags") or defaults.team_1_tags
+            team_2_tags = options.get("team_2_tags") or defaults.team_2_tags
+            map_name = options.get("map_name") or defaults.map_name
+        except AttributeError:
+            raise DraftServerError("No team_config: give team_1_name, team_1_tags, team_2_name, team_2_tags and map_name")
+
+        if map_name not in self.patch_data["hero_winrates_by_map"]:
+            raise DraftServerError(f"Unknown map '{map_name}', expected one of: {', '.join(sorted(self.patch_data['hero_winrates_by_map']))}")
+        backend = options.get("backend", "greedy")
+        if backend not in draft.SUGGESTION_BACKENDS:
+            raise DraftServerError(f"Unknown backend '{backend}', expected one of: {', '.join(sorted(draft.SUGGESTION_BACKENDS))}")
+        first_pick_team = options.get("first_pick_team", 1)
+        if first_pick_team not in (1, 2):
+            raise DraftServerError("first_pick_team must be 1 or 2")
+
+        teams = self._teams(team_1_tags, team_2_tags)
+        with teams.lock:
+            draft_data = load_data.initialize_draft(self.patch_data, teams.team_data, map_name, team_1_name, team_2_name, teams.scoring_engine)
+            teams.scoring_engine = draft_data["scoring_engine"]
+
+        session = DraftSession(
+            secrets.token_hex(8), draft_data, teams, first_pick_team, backend, float(options.get("time_limit", search.DEFAULT_TIME_LIMIT))
+        )
+        with self.lock:
+            self._expire_sessions()
+            self.sessions[session.session_id] = session
+        return session
+
+    def get_session(self, session_id):
+        with self.lock:
+            session = self.sessions.get(session_id)
+        if session is None:
+            raise DraftServerError(f"No session '{session_id}'", 404)
+        session.last_used = time.monotonic()
+        return session
+
+    def close_session(self, session_id):
+        with self.lock:
+            if self.sessions.pop(session_id, None) is None:
+                raise DraftServerError(f"No session '{session_id}'", 404)
+
+    def _expire_sessions(self):
+        cutoff = time.monotonic() - SESSION_IDLE_TIMEOUT
+        for session_id in [session_id for session_id, session in self.sessions.items() if session.last_used < cutoff]:
+            del self.sessions[session_id]
+
+    def health(self):
+        with self.lock:
+            return {
+                "timeframe": ":".join(self.timeframe),
+                "sessions": len(self.sessions),
+                "rosters_loaded": sum(teams.team_data is not None for teams in self.teams.values()),
+                "heroes": len(self.patch_data["heroes_list"]),
+                "maps": sorted(self.patch_data["hero_winrates_by_map"]),
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        try:
+            status, body = self._route(method, parts, dict(parse_qsl(url.query)))
+        except DraftServerError as e:
+            status, body = e.status, {"error": str(e)}
+        except ValueError as e:
+            status, body = 400, {"error": str(e)}
+        except Exception as e:
+            # ✅ Any other bug still gets a JSON answer instead of a dropped connection
+            logger.exception(f"{method} {self.path} failed")
+            status, body = 500, {"error": f"Internal server error: {type(e).__name__}: {e}"}
+        self._send(status, body)
+
+    def _route(self, method, parts, query):
+        server = self.server
+        if parts == ["health"] and method == "GET":
+            return 200, server.health()
+        if parts == ["sessions"] and method == "GET":
+            with server.lock:
+                return 200, {"sessions": sorted(server.sessions)}
+        if parts == ["sessions"] and method == "POST":
+            return 201, server.create_session(self._read_json()).view()
+
+        if len(parts) < 2 or parts[0] != "sessions":
+            raise DraftServerError("Not found", 404)
+        if len(parts) == 2 and method == "DELETE":
+            server.close_session(parts[1])
+            return 200, {"closed": parts[1]}
+
+        session = server.get_session(parts[1])
+        action = parts[2] if len(parts) == 3 else None
+        with session.lock:
+            if len(parts) == 2 and method == "GET":
+                return 200, session.view()
+            if action == "suggestions" and method == "GET":
+                draft_type, order, team_name = session.next_slot() or (None, None, None)
+                suggestions = session.suggestions(int(query.get("num", DEFAULT_SUGGESTIONS)))
+                fields = BAN_FIELDS if draft_type == "Ban" else PICK_FIELDS
+                return 200, {"type": draft_type, "order": order, "team": team_name, "suggestions": [suggestion_fields(fields, s) for s in suggestions]}
+            if action == "select" and method == "POST":
+                options = self._read_json()
+                if not options.get("hero"):
+                    raise DraftServerError("Missing 'hero'")
+                session.select(options["hero"], options.get("player"))
+                return 200, session.view()
+        raise DraftServerError("Not found", 404)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise DraftServerError("Request body is not valid JSON")
+        if not isinstance(body, dict):
+            raise DraftServerError("Request body must be a JSON object")
+        return body
+
+    def _send(self, status, body):
+        payload = json.dumps(body, default=lambda value: value.item() if hasattr(value, "item") else str(value)).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def suggestion_fields(fields, suggestion):
+    """Returns a suggestion tuple as a JSON object, with any extra attributes of the backend's suggestion type."""
+    return {**dict(zip(fields, suggestion)), **getattr(suggestion, "__dict__", {})}
+
+
+def start_server(timeframe_type="major", timeframe="2.55", host="127.0.0.1", port=0, **options):
+    """Loads the data, starts a server on a background thread (port 0 picks a free port) and returns it; call `shutdown()` to stop."""
+    server = DraftServer((host, port), timeframe_type, timeframe, **options)
+    threading.Thread(target=server.serve_forever, name="draft-server", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve draft suggestions from warm, in-memory data over a local HTTP API.")
+    parser.add_argument("--timeframe", type=simulate.parse_timeframe, default=("major", "2.55"), help="TYPE:TIMEFRAME (default: major:2.55)")
+    parser.add_argument("--host", default="127.0.0.1", help="Use 0.0.0.0 to serve the LAN")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--no-snapshot", action="store_true", help="Load patch data from the API cache instead of the snapshot")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = DraftServer((args.host, args.port), *args.timeframe, use_snapshot=not args.no_snapshot, verbose=args.verbose)
+    print(f"✅ Draft server ready on {server.url} ({':'.join(server.timeframe)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
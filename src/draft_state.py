@@ -0,0 +1,280 @@
+import random
+from array import array
+
+import numpy as np
+
+import scoring
+
+ZOBRIST_SEED = 0x5EED_D8AF7
+NUM_PLAYERS = 5
+
+# Keys of DRAFT_DATA that a DraftState derives from its own arrays instead of the static data
+DYNAMIC_KEYS = {
+    "available_heroes", "picked_heroes", "banned_heroes",
+    "team_1_picked_heroes", "team_2_picked_heroes",
+    "available_players_team_1", "available_players_team_2",
+    "team_roles", "draft_log",
+}
+
+
+class DraftContext:
+    """Static, shared part of a draft: hero ids, rosters, roles, Zobrist keys and the untouched DRAFT_DATA."""
+
+    def __init__(self, DRAFT_DATA):
+        self.static_data = {key: value for key, value in DRAFT_DATA.items() if key not in DYNAMIC_KEYS}
+        self.scoring_engine = DRAFT_DATA.get("scoring_engine") or scoring.ScoringEngine(DRAFT_DATA)
+        self.static_data["scoring_engine"] = self.scoring_engine
+
+        self.heroes = self.scoring_engine.heroes
+        self.hero_index = self.scoring_engine.hero_index
+        self.team_names = (DRAFT_DATA["team_1_name"], DRAFT_DATA["team_2_name"])
+
+        # ✅ Full rosters in their original order: already picked players first, in pick order, then the rest
+        self.rosters = tuple(
+            tuple(DRAFT_DATA[f"team_{team + 1}_picked_heroes"]) + tuple(DRAFT_DATA[f"available_players_team_{team + 1}"])
+            for team in (0, 1)
+        )
+        self.player_slots = tuple({player: slot for slot, player in enumerate(roster)} for roster in self.rosters)
+
+        self.required_roles = sorted(DRAFT_DATA["required_roles"])
+        self.required_role_index = {role: idx for idx, role in enumerate(self.required_roles)}
+
+        rng = random.Random(ZOBRIST_SEED)
+        num_heroes = len(self.heroes)
+        self.ban_keys = [rng.getrandbits(64) for _ in range(num_heroes)]
+        self.pick_keys = [[[rng.getrandbits(64) for _ in range(num_heroes)] for _ in roster] for roster in self.rosters]
+
+    def team_of(self, team_name):
+        return 0 if team_name == self.team_names[0] else 1
+
+
+class DraftState:
+    """
+    Compact, cheaply copyable draft state.
+
+    Heroes are integer ids shared with the ScoringEngine. Available, picked and banned heroes are
+    int bitsets, role counts and player assignments are small fixed arrays, and every apply() is
+    O(1) and reversible with undo(). `hash` is a Zobrist hash that is stable across processes.
+
+    Reads like DRAFT_DATA (`state["available_heroes"]`, `state.get("role_limits")`), so the
+    existing pick/ban functions accept it; mutate it through apply/undo or `apply_ban`/`apply_pick`.
+    """
+
+    __slots__ = ("context", "available", "banned", "picked", "team_picked", "assignments", "pick_order",
+                 "pick_counts", "role_counts", "history", "hash", "draft_log")
+
+    def __init__(self, context):
+        self.context = context
+        self.available = 0
+        self.banned = 0
+        self.picked = 0
+        self.team_picked = [0, 0]
+        self.assignments = [array("h", [-1] * len(roster)) for roster in context.rosters]
+        self.pick_order = [array("h", [-1] * len(roster)) for roster in context.rosters]
+        self.pick_counts = [0, 0]
+        self.role_counts = [array("b", [0] * len(context.required_roles)) for _ in (0, 1)]
+        self.history = []
+        self.hash = 0
+        self.draft_log = []
+
+    @classmethod
+    def from_draft_data(cls, DRAFT_DATA, context=None):
+        """Builds a DraftState mirroring a DRAFT_DATA dict; pass `context` to share it between states."""
+        context = context or DraftContext(DRAFT_DATA)
+        state = cls(context)
+        hero_index = context.hero_index
+
+        for hero in DRAFT_DATA["available_heroes"]:
+            state.available |= 1 << hero_index[hero]
+        for hero in DRAFT_DATA["banned_heroes"]:
+            state.banned |= 1 << hero_index[hero]
+            state.hash ^= context.ban_keys[hero_index[hero]]
+        for hero in DRAFT_DATA["picked_heroes"]:
+            state.picked |= 1 << hero_index[hero]
+
+        for team in (0, 1):
+            for player, hero in DRAFT_DATA[f"team_{team + 1}_picked_heroes"].items():
+                slot, hero_id = context.player_slots[team][player], hero_index[hero]
+                state.team_picked[team] |= 1 << hero_id
+                state.assignments[team][slot] = hero_id
+                state.pick_order[team][state.pick_counts[team]] = slot
+                state.pick_counts[team] += 1
+                state.hash ^= context.pick_keys[team][slot][hero_id]
+
+            team_roles = DRAFT_DATA["team_roles"][context.team_names[team]]
+            for role, idx in context.required_role_index.items():
+                state.role_counts[team][idx] = team_roles.get(role, 0)
+
+        state.draft_log = list(DRAFT_DATA["draft_log"])
+        return state
+
+    def copy(self):
+        """Returns an independent state sharing the static context."""
+        state = DraftState.__new__(DraftState)
+        state.context = self.context
+        state.available = self.available
+        state.banned = self.banned
+        state.picked = self.picked
+        state.team_picked = self.team_picked[:]
+        state.assignments = [array("h", a) for a in self.assignments]
+        state.pick_order = [array("h", a) for a in self.pick_order]
+        state.pick_counts = self.pick_counts[:]
+        state.role_counts = [array("b", a) for a in self.role_counts]
+        state.history = self.history[:]
+        state.hash = self.hash
+        state.draft_log = self.draft_log[:]
+        return state
+
+    # ✅ Mutation
+
+    def apply(self, action):
+        """
+        Applies ("Ban", team_name, hero) or ("Pick", team_name, hero, player, role).
+
+        Search moves of the form (draft_type, team_name, hero, player, role) are accepted as well.
+        """
+        context = self.context
+        draft_type, team_name, hero = action[0], action[1], action[2]
+        hero_id = context.hero_index[hero]
+        bit = 1 << hero_id
+        self.available &= ~bit
+
+        if draft_type == "Ban":
+            self.banned |= bit
+            self.hash ^= context.ban_keys[hero_id]
+            self.history.append((0, -1, -1, hero_id, -1))
+            return
+
+        player, role = action[3], action[4]
+        team = context.team_of(team_name)
+        slot = context.player_slots[team][player]
+        role_idx = context.required_role_index.get(role, -1)
+
+        self.picked |= bit
+        self.team_picked[team] |= bit
+        self.assignments[team][slot] = hero_id
+        self.pick_order[team][self.pick_counts[team]] = slot
+        self.pick_counts[team] += 1
+        if role_idx >= 0:
+            self.role_counts[team][role_idx] += 1
+        self.hash ^= context.pick_keys[team][slot][hero_id]
+        self.history.append((1, team, slot, hero_id, role_idx))
+
+    def undo(self):
+        """Reverts the most recent apply()."""
+        kind, team, slot, hero_id, role_idx = self.history.pop()
+        bit = 1 << hero_id
+        self.available |= bit
+
+        if kind == 0:
+            self.banned &= ~bit
+            self.hash ^= self.context.ban_keys[hero_id]
+            return
+
+        self.picked &= ~bit
+        self.team_picked[team] &= ~bit
+        self.assignments[team][slot] = -1
+        self.pick_counts[team] -= 1
+        self.pick_order[team][self.pick_counts[team]] = -1
+        if role_idx >= 0:
+            self.role_counts[team][role_idx] -= 1
+        self.hash ^= self.context.pick_keys[team][slot][hero_id]
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, DraftState) and self.context is other.context and self.hash == other.hash
+            and self.banned == other.banned and self.available == other.available
+            and self.assignments == other.assignments
+        )
+
+    # ✅ DRAFT_DATA-compatible reads
+
+    def bitset(self, key):
+        """Returns the hero bitset behind a hero-set key of DRAFT_DATA."""
+        if key == "available_heroes":
+            return self.available
+        if key == "picked_heroes":
+            return self.picked
+        if key == "banned_heroes":
+            return self.banned
+        if key == "team_1_picked_heroes":
+            return self.team_picked[0]
+        if key == "team_2_picked_heroes":
+            return self.team_picked[1]
+        raise KeyError(key)
+
+    @property
+    def scoring_engine(self):
+        return self.context.scoring_engine
+
+    def _heroes_of(self, bits):
+        heroes = self.context.heroes
+        return {heroes[idx] for idx in np.flatnonzero(scoring.unpack_bitset(bits, len(heroes))).tolist()}
+
+    def _team_picks(self, team):
+        roster, heroes = self.context.rosters[team], self.context.heroes
+        return {roster[slot]: heroes[self.assignments[team][slot]] for slot in self.pick_order[team][:self.pick_counts[team]]}
+
+    def __getitem__(self, key):
+        if key == "available_heroes":
+            return self._heroes_of(self.available)
+        if key == "picked_heroes":
+            return self._heroes_of(self.picked)
+        if key == "banned_heroes":
+            return self._heroes_of(self.banned)
+        if key == "team_1_picked_heroes":
+            return self._team_picks(0)
+        if key == "team_2_picked_heroes":
+            return self._team_picks(1)
+        if key == "available_players_team_1":
+            return [player for slot, player in enumerate(self.context.rosters[0]) if self.assignments[0][slot] < 0]
+        if key == "available_players_team_2":
+            return [player for slot, player in enumerate(self.context.rosters[1]) if self.assignments[1][slot] < 0]
+        if key == "team_roles":
+            return {
+                self.context.team_names[team]: {role: self.role_counts[team][idx] for role, idx in self.context.required_role_index.items()}
+                for team in (0, 1)
+            }
+        if key == "draft_log":
+            return self.draft_log
+        return self.context.static_data[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in DYNAMIC_KEYS or key in self.context.static_data
+
+
+def apply_ban(DRAFT_DATA, team_name, hero):
+    """Records a ban in either a DraftState or a DRAFT_DATA dict."""
+    if isinstance(DRAFT_DATA, DraftState):
+        DRAFT_DATA.apply(("Ban", team_name, hero))
+        return
+    DRAFT_DATA["banned_heroes"].add(hero)
+    DRAFT_DATA["available_heroes"].remove(hero)
+
+
+def apply_pick(DRAFT_DATA, team_name, player, hero, role):
+    """Records a pick in either a DraftState or a DRAFT_DATA dict."""
+    if isinstance(DRAFT_DATA, DraftState):
+        DRAFT_DATA.apply(("Pick", team_name, hero, player, role))
+        return
+
+    DRAFT_DATA["available_players_team_1" if team_name == DRAFT_DATA["team_1_name"] else "available_players_team_2"].remove(player)
+    DRAFT_DATA["picked_heroes"].add(hero)
+    DRAFT_DATA["available_heroes"].remove(hero)
+
+    if role in DRAFT_DATA["required_roles"]:
+        DRAFT_DATA["team_roles"][team_name][role] += 1  # ✅ Update role count only when a hero is actually picked
+
+    if team_name == DRAFT_DATA["team_1_name"]:
+        DRAFT_DATA["team_1_picked_heroes"][player] = hero
+    else:
+        DRAFT_DATA["team_2_picked_heroes"][player] = hero
@@ -0,0 +1,139 @@
+import bisect
+
+import interface
+import utils
+
+FUZZY_MAX_DISTANCE = 2  # Typos tolerated in longer inputs; inputs of up to SHORT_INPUT characters get one
+SHORT_INPUT = 4
+MAX_CANDIDATES = 5
+
+
+def _deletes(key, distance):
+    """Every string obtained by deleting up to `distance` characters of `key`, `key` included."""
+    variants = {key}
+    frontier = {key}
+    for _ in range(distance):
+        frontier = {variant[:idx] + variant[idx + 1:] for variant in frontier for idx in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance (adjacent swaps count once), or limit + 1 once it exceeds `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_row, row = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous_row, row = previous_row, row, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], before[j - 2] + 1)
+        if min(row) > limit:
+            return limit + 1
+    return row[-1]
+
+
+class HeroLookup:
+    """
+    Name index of a draft's heroes for interactive selection, built once per draft.
+
+    Resolves role codes (T1, H2: the codes of the printed hero list), names ignoring case, spaces,
+    punctuation and diacritics, aliases (ETC, KT), unique name prefixes (also of single words, "ming"),
+    and typos of up to FUZZY_MAX_DISTANCE edits through a deletion index (built on the first typo),
+    so a lookup never scans every hero. Lookups filter by the heroes available at that moment, which
+    the draft keeps up to date on every pick and ban, so the index itself never needs rebuilding.
+    """
+
+    def __init__(self, heroes, hero_roles, aliases=None):
+        heroes = set(heroes)
+        _, self.codes = interface.get_formatted_hero_list(heroes, hero_roles, set(), set())
+        self.names = {}  # normalized name or alias -> hero
+        self.keys = {}  # normalized name, alias or name word -> heroes it can mean
+        for hero in sorted(heroes):
+            name = interface.normalize_hero_name(hero)
+            self.names[name] = hero
+            for key in {name} | {interface.normalize_hero_name(word) for word in hero.replace("-", " ").split()}:
+                self.keys.setdefault(key, set()).add(hero)
+        for alias, hero in (aliases or {}).items():
+            if hero in heroes:
+                self.names.setdefault(interface.normalize_hero_name(alias), hero)
+                self.keys.setdefault(interface.normalize_hero_name(alias), set()).add(hero)
+
+        self.sorted_keys = sorted(self.keys)
+        self._deletions = None  # deletion variant -> keys it was derived from, built on the first typo
+
+    def deletions(self):
+        if self._deletions is None:
+            deletions = {}
+            for key in self.sorted_keys:
+                for variant in _deletes(key, FUZZY_MAX_DISTANCE):
+                    deletions.setdefault(variant, []).append(key)
+            self._deletions = deletions
+        return self._deletions
+
+    def exact(self, text):
+        """Returns the hero `text` names exactly (code, name or alias), available or not, else None."""
+        text = text.strip()
+        return self.codes.get(text.lower()) or self.names.get(interface.normalize_hero_name(text))
+
+    def prefix_matches(self, text):
+        """Heroes with a name, name word or alias starting with `text`, shortest match first."""
+        query = interface.normalize_hero_name(text)
+        if not query:
+            return []
+        matches = {}
+        for position in range(bisect.bisect_left(self.sorted_keys, query), len(self.sorted_keys)):
+            key = self.sorted_keys[position]
+            if not key.startswith(query):
+                break
+            for hero in self.keys[key]:
+                matches[hero] = min(matches.get(hero, len(key)), len(key))
+        return sorted(matches, key=lambda hero: (matches[hero], hero))
+
+    def fuzzy_matches(self, text):
+        """[(distance, hero)] of the heroes whose name, name word or alias is within the typo budget of `text`, closest first."""
+        query = interface.normalize_hero_name(text)
+        if not query:
+            return []
+        limit = 1 if len(query) <= SHORT_INPUT else FUZZY_MAX_DISTANCE
+        deletions = self.deletions()
+        keys = {key for variant in _deletes(query, limit) for key in deletions.get(variant, ())}
+        matches = {}
+        for key in keys:
+            distance = edit_distance(query, key, limit)
+            if distance <= limit:
+                for hero in self.keys[key]:
+                    matches[hero] = min(matches.get(hero, distance), distance)
+        return sorted((distance, hero) for hero, distance in matches.items())
+
+    def lookup(self, text, available_heroes):
+        """
+        Returns (hero, candidates) for user input: `hero` when the input identifies one available
+        hero (exactly, by unique prefix or by its single closest typo match), else None and up to
+        MAX_CANDIDATES available heroes it might mean.
+        """
+        hero = self.exact(text)
+        if hero is not None:
+            return (hero, [hero]) if hero in available_heroes else (None, [])
+
+        prefixed = [hero for hero in self.prefix_matches(text) if hero in available_heroes]
+        if len(prefixed) == 1:
+            return prefixed[0], prefixed
+
+        fuzzy = [(distance, hero) for distance, hero in self.fuzzy_matches(text) if hero in available_heroes]
+        if not prefixed and fuzzy and (len(fuzzy) == 1 or fuzzy[0][0] < fuzzy[1][0]):
+            return fuzzy[0][1], [fuzzy[0][1]]
+        candidates = list(dict.fromkeys(prefixed + [hero for _, hero in fuzzy]))
+        return None, candidates[:MAX_CANDIDATES]
+
+
+def for_draft(DRAFT_DATA):
+    """Returns the draft's HeroLookup, building it on first use (automated drafts never pay for it)."""
+    lookup = DRAFT_DATA.get("hero_lookup")
+    if lookup is None:
+        heroes = DRAFT_DATA["available_heroes"] | DRAFT_DATA["picked_heroes"] | DRAFT_DATA["banned_heroes"]
+        lookup = HeroLookup(heroes, DRAFT_DATA["hero_roles"], utils.config_module("hero_config").hero_aliases)
+        DRAFT_DATA["hero_lookup"] = lookup
+    return lookup
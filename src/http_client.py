@@ -0,0 +1,154 @@
+import os
+import random
+import threading
+import time
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RATE_LIMIT = 5.0  # Requests per second allowed by the HeroesProfile quota
+DEFAULT_RATE_BURST = 10
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5  # Seconds; attempt n sleeps a random time up to BACKOFF_BASE * 2 ** n
+BACKOFF_CAP = 30
+
+_session = None
+_rate_limiter = None
+_lock = threading.Lock()
+
+
+class HeroesProfileError(Exception):
+    """Base class for failed HeroesProfile API requests."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class NotFoundError(HeroesProfileError):
+    """The API has no data for the request (HTTP 404)."""
+
+
+class RateLimitError(HeroesProfileError):
+    """The API kept answering HTTP 429 after all retries."""
+
+
+class QuotaExhaustedError(HeroesProfileError):
+    """The API answered with a non-JSON body, which is what it does once the subscription's calls are used up."""
+
+
+class ApiResponseError(HeroesProfileError):
+    """Any other failed request: unexpected status, connection error or timeout after all retries."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`. `clock` and
+    `sleep` default to time.monotonic and time.sleep.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = capacity
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+def max_concurrency():
+    """Returns the configured number of concurrent API requests (HEROES_PROFILE_MAX_CONCURRENCY)."""
+    return int(os.getenv("HEROES_PROFILE_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+
+
+def get_rate_limiter():
+    """Returns the process-wide token bucket (HEROES_PROFILE_RATE_LIMIT / HEROES_PROFILE_RATE_BURST)."""
+    global _rate_limiter
+    with _lock:
+        if _rate_limiter is None:
+            _rate_limiter = TokenBucket(
+                float(os.getenv("HEROES_PROFILE_RATE_LIMIT", DEFAULT_RATE_LIMIT)),
+                int(os.getenv("HEROES_PROFILE_RATE_BURST", DEFAULT_RATE_BURST))
+            )
+        return _rate_limiter
+
+
+def get_session():
+    """Returns the shared session whose connection pool is sized for the concurrency limit."""
+    global _session
+    with _lock:
+        if _session is None:
+            # ✅ Imported here: requests is the slowest import of the project and most processes never send a request
+            import requests
+            from requests.adapters import HTTPAdapter
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency())
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def get(url):
+    """Rate-limited GET through the shared connection pool."""
+    get_rate_limiter().acquire()
+    return get_session().get(url, timeout=REQUEST_TIMEOUT)
+
+
+def _backoff_delay(attempt, retry_after=None):
+    """Full-jitter exponential backoff, never shorter than a server supplied Retry-After."""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
+
+
+def get_json(url, retries=MAX_RETRIES):
+    """
+    GETs `url` and returns the parsed JSON body.
+
+    Connection errors, timeouts, HTTP 429 and 5xx responses are retried with jittered exponential
+    backoff. Raises a HeroesProfileError subclass once retries are exhausted or the error is final.
+    """
+    import requests
+    for attempt in range(retries + 1):
+        last_attempt = attempt == retries
+
+        try:
+            response = get(url)
+        except requests.RequestException as e:
+            if last_attempt:
+                raise ApiResponseError(f"Request failed: {e}") from e
+            time.sleep(_backoff_delay(attempt))
+            continue
+
+        if response.status_code == 200:
+            try:
+                return response.json()
+            except ValueError as e:
+                raise QuotaExhaustedError(f"Could not parse JSON response: {response.text[:200]}", response.status_code) from e
+
+        if response.status_code == 404:
+            raise NotFoundError(f"No data: {response.text[:200]}", response.status_code)
+
+        retryable = response.status_code == 429 or response.status_code >= 500
+        if not retryable or last_attempt:
+            error_type = RateLimitError if response.status_code == 429 else ApiResponseError
+            raise error_type(f"Status Code: {response.status_code} | Response: {response.text[:200]}", response.status_code)
+
+        time.sleep(_backoff_delay(attempt, response.headers.get("Retry-After")))
@@ -0,0 +1,170 @@
+"""
+Opt-in timing and allocation instrumentation for the drafting hot paths.
+
+Enable with HOTS_DRAFT_PROFILE=1 (or `enable()` / the `--profile` flags). Code marks regions with
+
+    with instrumentation.span("synergy"):
+        ...
+
+which costs one no-op context manager while disabled. When enabled every span records calls, wall
+time and net traced allocations, draft steps collect the spans run inside them, and the nesting is
+kept as folded stacks ("draft;Pick 5;synergy 1234") that flamegraph.pl and speedscope read.
+"""
+import contextlib
+import os
+import threading
+import time
+import tracemalloc
+
+ENV_FLAG = "HOTS_DRAFT_PROFILE"
+
+_enabled = False
+_trace_allocations = False
+_local = threading.local()
+_lock = threading.Lock()
+_stats = {}  # name -> [calls, seconds, allocated bytes]
+_folded = {}  # "outer;inner" -> self time in seconds
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def enable(allocations=True):
+    """Turns instrumentation on; `allocations` also starts tracemalloc, which slows everything down noticeably."""
+    global _enabled, _trace_allocations
+    _enabled, _trace_allocations = True, allocations
+    if allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def enable_if_requested():
+    """Turns instrumentation on when the HOTS_DRAFT_PROFILE environment variable asks for it (and it is off)."""
+    if not _enabled and os.getenv(ENV_FLAG, "").lower() in {"1", "true", "yes", "on"}:
+        enable()
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Drops everything recorded so far."""
+    with _lock:
+        _stats.clear()
+        _folded.clear()
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _traced_memory():
+    return tracemalloc.get_traced_memory()[0] if _trace_allocations and tracemalloc.is_tracing() else 0
+
+
+class _Span:
+    __slots__ = ("name", "timings", "start", "memory", "child_time", "outer_step")
+
+    def __init__(self, name, timings=None):
+        self.name = name
+        self.timings = timings
+
+    def __enter__(self):
+        _stack().append(self)
+        if self.timings is not None:
+            self.outer_step = getattr(_local, "step", None)
+            _local.step = self.timings
+        self.child_time = 0.0
+        self.memory = _traced_memory()
+        self.start = time.perf_counter()
+        return self.timings
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        allocated = max(0, _traced_memory() - self.memory)
+        stack = _stack()
+        path = ";".join(span.name for span in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child_time += elapsed
+
+        if self.timings is not None:
+            _local.step = self.outer_step
+            self.timings["seconds"] = elapsed
+            self.timings["allocated"] = allocated
+        else:
+            step = getattr(_local, "step", None)
+            if step is not None:
+                component = step["components"].setdefault(self.name, {"calls": 0, "seconds": 0.0, "allocated": 0})
+                component["calls"] += 1
+                component["seconds"] += elapsed
+                component["allocated"] += allocated
+
+        with _lock:
+            if self.timings is None:
+                stats = _stats.setdefault(self.name, [0, 0.0, 0])
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] += allocated
+            _folded[path] = _folded.get(path, 0.0) + elapsed - self.child_time
+        return False
+
+
+def span(name):
+    """Context manager timing the enclosed block under `name` (a shared no-op while disabled)."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def step(name):
+    """
+    Like `span`, but also collects every span run inside it. Entering returns the step's timings,
+    {"seconds", "allocated", "components": {name: {"calls", "seconds", "allocated"}}}, filled in on
+    exit; None while disabled.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, {"seconds": 0.0, "allocated": 0, "components": {}})
+
+
+def summary():
+    """Returns [(name, calls, seconds, allocated bytes)] for every span name (steps excluded), slowest first."""
+    with _lock:
+        rows = [(name, calls, seconds, allocated) for name, (calls, seconds, allocated) in _stats.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def write_folded(path):
+    """Writes the folded stacks with self time in microseconds, one "outer;inner value" line per stack."""
+    with _lock:
+        lines = [f"{stack} {max(1, round(seconds * 1e6))}" for stack, seconds in sorted(_folded.items())]
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+def print_summary(step_timings=None):
+    """Prints the per-span totals and, when given, the per-step timings keyed by draft order."""
+    print("\n🔹 PROFILE 🔹")
+    print(f"{'Span':<28} {'Calls':>8} {'Total ms':>10} {'Mean µs':>10} {'Alloc KiB':>10}")
+    print("=" * 70)
+    for name, calls, seconds, allocated in summary():
+        print(f"{name:<28} {calls:>8} {seconds * 1000:>10.2f} {seconds / calls * 1e6:>10.1f} {allocated / 1024:>10.1f}")
+
+    if step_timings:
+        print(f"\n{'Order':<6} {'Step ms':>10} {'Alloc KiB':>10}  Slowest components")
+        print("=" * 70)
+        for order, timings in sorted(step_timings.items()):
+            components = sorted(timings["components"].items(), key=lambda item: item[1]["seconds"], reverse=True)[:3]
+            slowest = ", ".join(f"{name} {component['seconds'] * 1000:.2f}ms" for name, component in components)
+            print(f"{order:<6} {timings['seconds'] * 1000:>10.2f} {timings['allocated'] / 1024:>10.1f}  {slowest}")
+
+
+enable_if_requested()
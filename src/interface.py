@@ -59,10 +59,16 @@ def get_formatted_hero_list(available_heroes, hero_roles, picked_heroes, banned_
     return hero_display_list, hero_index_map
 
 
-def select_hero_interactive(prompt, available_heroes, hero_roles, picked_heroes, banned_heroes, suggestions):
-    """Prompts the user for hero selection with the top 5 suggestions. Pressing Enter defaults to the top suggestion."""
+def select_hero_interactive(prompt, available_heroes, hero_roles, picked_heroes, banned_heroes, suggestions, hero_lookup=None):
+    """
+    Prompts the user for hero selection with the top 5 suggestions. Pressing Enter defaults to the top suggestion.
 
-    _, hero_index_map = get_formatted_hero_list(available_heroes, hero_roles, picked_heroes, banned_heroes)
+    Accepts hero codes (T1, H2), names, aliases, unique prefixes and small typos; pass the draft's
+    `hero_lookup` (hero_lookup.for_draft) to skip building the index on every prompt.
+    """
+    if hero_lookup is None:
+        import hero_lookup as lookup_module
+        hero_lookup = lookup_module.HeroLookup(available_heroes | picked_heroes | banned_heroes, hero_roles)
 
     # ✅ Show top 5 suggestions inline
     suggestion_text = ", ".join(suggestions[:5]) if suggestions else "No suggestions available"
@@ -74,20 +80,22 @@ def select_hero_interactive(prompt, available_heroes, hero_roles, picked_heroes,
 
         # ✅ Default to top suggested pick if Enter is pressed
         if choice == "" and suggestions:
-            return suggestions[0].split(" ")[0]
-
-        # ✅ Match by hero code (e.g., T1, H2)
-        if choice.lower() in hero_index_map:
-            return hero_index_map[choice.lower()]
-
-        # ✅ Match by exact name (case insensitive, ignores punctuation/diacritics)
-        normalized_choice = normalize_hero_name(choice)
-        normalized_hero_map = {normalize_hero_name(h): h for h in available_heroes}
-
-        if normalized_choice in normalized_hero_map:
-            return normalized_hero_map[normalized_choice]
-
-        print("\n❌ Invalid choice. Please select a valid code, hero name, or press Enter for the default.")
+            return suggestions[0]
+
+        # ✅ Match by code, name, alias, unique prefix or a small typo (ignores case, punctuation/diacritics)
+        hero, candidates = hero_lookup.lookup(choice, available_heroes)
+        exact_hero = hero_lookup.exact(choice)
+        if hero is not None:
+            if exact_hero is None:
+                print(f"➤ {hero}")  # ✅ Echo prefix and typo matches
+            return hero
+
+        if candidates:
+            print(f"\n❓ Did you mean: {', '.join(candidates)}?")
+        elif exact_hero is not None:
+            print(f"\n❌ {exact_hero} is already picked or banned.")
+        else:
+            print("\n❌ Invalid choice. Please select a valid code, hero name, or press Enter for the default.")
 
 
 def select_player_interactive(prompt, available_players):
@@ -1,71 +1,123 @@
 import os
+import fnmatch
 import logging
-import re
-import time
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+import queue
+import tempfile
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import load_data
+import lobby_parser
+import utils
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-BATTLETAG_PATTERN = re.compile(r'([A-Za-z0-9]+#\d{4,6})')
+DEBOUNCE_SECONDS = 0.25  # Quiet time after the last write before a lobby file is read
+LOCKED_RETRIES = 20  # Re-reads of a file the game still holds locked, one debounce apart
+
+LobbyDetected = namedtuple("LobbyDetected", ["path", "source", "battletags"])
+
+
+class _DebouncedHandler:
+    """
+    watchdog event handler that reports a file matching `patterns` once it has been quiet for
+    `debounce` seconds: every create/modify/move event re-arms the file's timer, so a file that is
+    still being written is read once, after the last write, instead of being polled.
+    """
+
+    def __init__(self, patterns, debounce, on_ready):
+        self.patterns = patterns
+        self.debounce = debounce
+        self.on_ready = on_ready
+        self.timers = {}
+        self.lock = threading.Lock()
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in {"created", "modified", "moved", "closed"}:
+            return
+        path = getattr(event, "dest_path", None) or event.src_path
+        if any(fnmatch.fnmatch(os.path.basename(path), pattern) for pattern in self.patterns):
+            self.schedule(path)
+
+    def schedule(self, path, attempt=0):
+        with self.lock:
+            timer = self.timers.pop(path, None)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.debounce, self._fire, (path, attempt))
+            timer.daemon = True
+            self.timers[path] = timer
+            timer.start()
+
+    def _fire(self, path, attempt):
+        with self.lock:
+            if self.timers.get(path) is not threading.current_thread():
+                return  # ✅ Re-armed by a later event
+            del self.timers[path]
+        try:
+            self.on_ready(path)
+        except PermissionError:
+            if attempt < LOCKED_RETRIES:
+                logger.warning(f"File is locked: {path}. Retrying...")
+                self.schedule(path, attempt + 1)
+
+    def cancel(self):
+        with self.lock:
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
 
 
 class LiveMonitor:
-    def __init__(self):
-        self.battle_lobby_temp_path = os.getenv("TEMP")
+    """
+    Watches the Battle Lobby temp directory and the StormSave folder and puts a LobbyDetected onto
+    `lobby_queue` for every new lobby or replay file with BattleTags in it. Nothing polls: the
+    observers block on file system events and consumers block on the queue.
+    """
+
+    def __init__(self, lobby_queue=None, battle_lobby_path=None, storm_save_path=None, debounce=DEBOUNCE_SECONDS):
+        self.battle_lobby_temp_path = battle_lobby_path or os.getenv("TEMP") or tempfile.gettempdir()
 
         # Check multiple locations for Storm Save path
         default_storm_save_path = os.path.join(os.path.expanduser("~"), "Documents", "Heroes of the Storm", "Accounts")
         onedrive_storm_save_path = os.path.join(os.path.expanduser("~"), "OneDrive", "Documents", "Heroes of the Storm")
 
-        self.storm_save_path = default_storm_save_path if os.path.exists(default_storm_save_path) else onedrive_storm_save_path
+        self.storm_save_path = storm_save_path or (default_storm_save_path if os.path.exists(default_storm_save_path) else onedrive_storm_save_path)
 
+        self.lobby_queue = lobby_queue if lobby_queue is not None else queue.Queue()
+        self.battle_lobby_handler = _DebouncedHandler(['*.battlelobby'], debounce, lambda path: self.on_file_ready(path, "battlelobby"))
+        self.storm_save_handler = _DebouncedHandler(['*.StormSave'], debounce, lambda path: self.on_file_ready(path, "stormsave"))
         self.battle_lobby_observer = None
         self.storm_save_observer = None
-
-    def wait_for_file(self, file_path, timeout=5):
-        """Waits for the file to be fully written before reading it."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                try:
-                    with open(file_path, 'rb') as f:
-                        f.read(1)  # Try to read a byte to check access
-                    return True
-                except PermissionError:
-                    logger.warning(f"File is locked: {file_path}. Retrying...")
-            time.sleep(0.5)
-        return False
+        self._last_battletags = None
 
     def extract_battletags(self, file_path):
-        """Extracts BattleTags from a given file."""
-        if not self.wait_for_file(file_path):
-            logger.error(f"File not available or locked: {file_path}")
-            return
+        """Extracts BattleTags from a given file in file order (see lobby_parser for why teams aren't assigned)."""
+        battletags = [player.battletag for player in lobby_parser.parse_battletags(file_path)]
+        if battletags:
+            logger.info(f"Extracted BattleTags from {file_path}: {battletags}")
+        else:
+            logger.info(f"No BattleTags found in {file_path}")
+        return battletags
 
+    def on_file_ready(self, file_path, source):
+        """Queues the BattleTags of a completely written file, unless they are the lobby queued last."""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                battletags = BATTLETAG_PATTERN.findall(content)
-                if battletags:
-                    logger.info(f"Extracted BattleTags from {file_path}: {battletags}")
-                else:
-                    logger.info(f"No BattleTags found in {file_path}")
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
-
-    def on_battle_lobby_added(self, event):
-        if event.is_directory:
+            battletags = self.extract_battletags(file_path)
+        except FileNotFoundError:
             return
-        logger.debug(f"Detected new temp live replay: {event.src_path}")
-        self.extract_battletags(event.src_path)
+        if battletags and battletags != self._last_battletags:
+            self._last_battletags = battletags
+            self.lobby_queue.put(LobbyDetected(file_path, source, battletags))
 
-    def on_storm_save_added(self, event):
-        if event.is_directory:
-            return
-        logger.debug(f"Detected new StormSave replay: {event.src_path}")
-        self.extract_battletags(event.src_path)
+    def _start_observer(self, path, handler):
+        from watchdog.observers import Observer
+
+        observer = Observer()
+        observer.schedule(handler, path, recursive=True)
+        observer.start()
+        return observer
 
     def start_battle_lobby(self):
         if not os.path.exists(self.battle_lobby_temp_path):
@@ -73,15 +125,7 @@ class LiveMonitor:
             return
 
         if not self.battle_lobby_observer:
-            event_handler = FileSystemEventHandler()
-
-            event_handler.on_created = self.on_battle_lobby_added
-
-            self.battle_lobby_observer = Observer()
-            self.battle_lobby_observer.schedule(event_handler, self.battle_lobby_temp_path, recursive=True)
-
-            event_handler.event_handler.patterns = ['*.battlelobby']
-            self.battle_lobby_observer.start()
+            self.battle_lobby_observer = self._start_observer(self.battle_lobby_temp_path, self.battle_lobby_handler)
             logger.debug("Started watching for new battlelobby")
 
     def start_storm_save(self):
@@ -90,15 +134,7 @@ class LiveMonitor:
             return
 
         if not self.storm_save_observer:
-            event_handler = FileSystemEventHandler()
-
-            event_handler.on_created = self.on_storm_save_added
-
-            self.storm_save_observer = Observer()
-            self.storm_save_observer.schedule(event_handler, self.storm_save_path, recursive=True)
-
-            event_handler.event_handler.patterns = ['*.StormSave']
-            self.storm_save_observer.start()
+            self.storm_save_observer = self._start_observer(self.storm_save_path, self.storm_save_handler)
             logger.debug("Started watching for new storm save")
 
     def stop_battle_lobby_watcher(self):
@@ -107,6 +143,7 @@ class LiveMonitor:
             self.battle_lobby_observer.join()
             self.battle_lobby_observer = None
             logger.debug("Stopped watching for new replays")
+        self.battle_lobby_handler.cancel()
 
     def stop_storm_save_watcher(self):
         if self.storm_save_observer:
@@ -114,6 +151,7 @@ class LiveMonitor:
             self.storm_save_observer.join()
             self.storm_save_observer = None
             logger.debug("Stopped watching for new storm save files")
+        self.storm_save_handler.cancel()
 
     def is_battle_lobby_running(self):
         return self.battle_lobby_observer is not None
@@ -122,14 +160,114 @@ class LiveMonitor:
         return self.storm_save_observer is not None
 
 
+class LobbyPrefetcher:
+    """
+    Consumes LiveMonitor's queue: as soon as a lobby is detected the players' hero data and NGS
+    profiles are fetched concurrently (warming the API cache), then a DRAFT_DATA for the lobby is
+    initialized and put onto `ready_queue`. The patch data is loaded once, in the background, while
+    the first lobby is awaited.
+
+    The lobby's file order isn't a verified team split (see lobby_parser), so the tags are sorted into
+    team_config's rosters; when there is no team_config or a tag is on neither roster, `confirm_teams`
+    is asked instead. It gets the lobby's tags and returns (team_1_tags, team_2_tags); without it
+    such a lobby is skipped. Team names and the map come from team_config when it exists.
+    """
+
+    def __init__(self, lobby_queue, timeframe_type="major", timeframe="2.55", map_name=None, ready_queue=None, confirm_teams=None):
+        self.lobby_queue = lobby_queue
+        self.ready_queue = ready_queue if ready_queue is not None else queue.Queue()
+        self.map_name = map_name
+        self.confirm_teams = confirm_teams
+        self.executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="lobby-prefetch")
+        self.patch_data = self.executor.submit(load_data.load_patch_data, timeframe_type, timeframe)
+        self.thread = None
+
+    def start(self):
+        """Starts consuming on a daemon thread; put None onto the lobby queue to stop it."""
+        self.thread = threading.Thread(target=self.run, name="lobby-prefetcher", daemon=True)
+        self.thread.start()
+        return self
+
+    def run(self):
+        while True:
+            lobby = self.lobby_queue.get()
+            if lobby is None:
+                break
+            try:
+                self.ready_queue.put(self.prepare(lobby.battletags))
+            except Exception as e:
+                logger.error(f"Could not prepare a draft for {lobby.battletags}: {e}")
+
+    def split_teams(self, battletags, team_config):
+        """Returns (team_1_tags, team_2_tags) of a lobby from team_config's rosters, else from confirm_teams."""
+        if team_config is not None:
+            try:
+                return lobby_parser.team_tags(battletags, team_config.team_1_tags, team_config.team_2_tags)
+            except ValueError as e:
+                if self.confirm_teams is None:
+                    raise
+                logger.info(f"{e}; asking for the teams")
+        elif self.confirm_teams is None:
+            raise ValueError("No team split: add the players to team_config or pass confirm_teams")
+        team_1_tags, team_2_tags = self.confirm_teams(list(battletags))
+        return list(team_1_tags), list(team_2_tags)
+
+    def prepare(self, battletags):
+        """Fetches the players' data and returns an initialized DRAFT_DATA for the lobby."""
+        battletags = list(battletags)
+        logger.info(f"Prefetching player data for {battletags}")
+        # ✅ Fetched while the teams are being confirmed
+        hero_data = self.executor.submit(utils.get_player_hero_data, battletags, 1, "Storm League")
+        profiles = self.executor.submit(utils.get_ngs_profile_data, battletags)
+
+        try:
+            team_config = utils.config_module("team_config")
+            team_1_name, team_2_name, map_name = team_config.team_1_name, team_config.team_2_name, team_config.map_name
+        except FileNotFoundError:
+            team_config, team_1_name, team_2_name, map_name = None, "Team 1", "Team 2", None
+        team_1_tags, team_2_tags = self.split_teams(battletags, team_config)
+        hero_data.result()
+        profiles.result()
+
+        # ✅ Every request below is answered from the now warm cache
+        team_data = load_data.load_team_data(team_1_tags, team_2_tags)
+        if not (self.map_name or map_name):
+            raise ValueError("No map: pass map_name or set it in team_config")
+        return load_data.initialize_draft(self.patch_data.result(), team_data, self.map_name or map_name, team_1_name, team_2_name)
+
+    def close(self):
+        self.lobby_queue.put(None)
+        if self.thread is not None:
+            self.thread.join()
+        self.executor.shutdown(wait=False)
+
+
+def confirm_teams_on_console(battletags):
+    """Asks which of the lobby's players are on team 1; the others are team 2."""
+    for number, tag in enumerate(battletags, 1):
+        print(f"{number}. {tag}")
+    answer = input("Team 1 players (numbers separated by spaces): ")
+    team_1 = {int(number) - 1 for number in answer.split() if number.isdigit()}
+    return ([tag for index, tag in enumerate(battletags) if index in team_1],
+            [tag for index, tag in enumerate(battletags) if index not in team_1])
+
+
 if __name__ == "__main__":
+    import draft
+
+    logging.basicConfig(level=logging.DEBUG)
     monitor = LiveMonitor()
+    prefetcher = LobbyPrefetcher(monitor.lobby_queue, confirm_teams=confirm_teams_on_console).start()
     monitor.start_battle_lobby()
     monitor.start_storm_save()
 
     try:
         while True:
-            pass
+            draft_data = prefetcher.ready_queue.get()  # ✅ Blocks until a lobby's draft is ready
+            print(f"\n✅ Draft ready: {draft_data['team_1_name']} vs {draft_data['team_2_name']} on {draft_data['map_name']}")
+            draft.execute_draft_phase(draft_data, user_input_enabled=True)
+            utils.print_final_draft(draft_data, True)
     except KeyboardInterrupt:
         monitor.stop_battle_lobby_watcher()
         monitor.stop_storm_save_watcher()
+        prefetcher.close()
@@ -1,30 +1,19 @@
-import os
-import sys
-
-# ✅ Add the config directory to sys.path to enable importing
-config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../config"))
-if config_path not in sys.path:
-    sys.path.append(config_path)
-
 DATA_DIR = "../data"
 
-import hero_config
-import team_config
 import utils
+import scoring
+import snapshot
+import matchup_store
 
-def load_and_initialize_draft(timeframe_type="major", timeframe="2.55"):
-    """
-    Loads all necessary data and initializes the draft structure.
-    """
-    print(f"\nLoading draft data for {team_config.map_name}...")
-
+def load_team_data(team_1_tags, team_2_tags):
+    """Loads NGS profiles, hero performance and hero MMR data for both rosters."""
     # Load team data
-    team_1 = utils.get_ngs_profile_data(team_config.team_1_tags)
-    team_2 = utils.get_ngs_profile_data(team_config.team_2_tags)
+    team_1 = utils.get_ngs_profile_data(team_1_tags)
+    team_2 = utils.get_ngs_profile_data(team_2_tags)
 
     # Load team hero performance data
-    team_1_data = utils.get_player_hero_data(team_config.team_1_tags, region=1, game_type="Storm League")
-    team_2_data = utils.get_player_hero_data(team_config.team_2_tags, region=1, game_type="Storm League")
+    team_1_data = utils.get_player_hero_data(team_1_tags, region=1, game_type="Storm League")
+    team_2_data = utils.get_player_hero_data(team_2_tags, region=1, game_type="Storm League")
 
     team_1_hero_performance = {
         player: {
@@ -48,53 +37,156 @@ def load_and_initialize_draft(timeframe_type="major", timeframe="2.55"):
         for player, player_data in team_2_data.items() if player_data and "Storm League" in player_data
     }
 
-    # Fetch hero win rates by map
-    hero_winrates_by_map = utils.get_hero_winrates_by_map(timeframe_type, timeframe)
+    return {
+        "team_1_tags": list(team_1_tags),
+        "team_2_tags": list(team_2_tags),
+        "team_1": team_1,
+        "team_2": team_2,
+        "team_1_hero_performance": team_1_hero_performance,
+        "team_2_hero_performance": team_2_hero_performance,
+        # Load MMR data for both teams
+        "team_1_player_mmr_data": {tag: team_1_data.get(tag, {}) for tag in team_1_tags},
+        "team_2_player_mmr_data": {tag: team_2_data.get(tag, {}) for tag in team_2_tags},
+    }
+
 
-    # Load MMR data for both teams
-    team_1_player_hero_mmr = {tag: utils.get_player_hero_data([tag], region=1, game_type="Storm League").get(tag, {}) for tag in team_config.team_1_tags}
-    team_2_player_hero_mmr = {tag: utils.get_player_hero_data([tag], region=1, game_type="Storm League").get(tag, {}) for tag in team_config.team_2_tags}
+def pool_heroes(team_data):
+    """Returns the heroes any of the ten players has played, without forbidden heroes, sorted."""
+    hero_config = utils.config_module("hero_config")
+    heroes = set()
+    for side in ("team_1", "team_2"):
+        for player_data in team_data[f"{side}_player_mmr_data"].values():
+            heroes.update((player_data or {}).get("Storm League", {}))
+    return sorted(heroes - set(hero_config.forbidden_heroes))
+
+
+def load_patch_data(timeframe_type="major", timeframe="2.55", max_workers=None, use_snapshot=True, lazy_matchups=False, priority_heroes=()):
+    """
+    Loads the patch data (heroes, roles, map win rates, matchups) for a timeframe.
+
+    Read from the memory-mapped snapshot for the timeframe, which is rebuilt when missing or stale;
+    `use_snapshot=False` loads it from the API cache instead. Per-hero matchup data is fetched with up
+    to `max_workers` concurrent requests (default: HEROES_PROFILE_MAX_CONCURRENCY).
+
+    With `lazy_matchups`, a missing or stale snapshot isn't rebuilt and matchup data becomes a
+    LazyMatchupStore: nothing is waited for, the rows of `priority_heroes` load in the background
+    first and the other non-forbidden heroes after them.
+    """
+    if use_snapshot:
+        if lazy_matchups:
+            patch_snapshot = snapshot.current_snapshot(timeframe_type, timeframe)
+        else:
+            patch_snapshot = snapshot.load_snapshot(timeframe_type, timeframe, max_workers)
+        if patch_snapshot is not None:
+            return {
+                "hero_winrates_by_map": patch_snapshot.hero_winrates_by_map(),
+                "heroes_list": patch_snapshot.hero_list,
+                "hero_roles": patch_snapshot.hero_roles,
+                "hero_matchup_data": patch_snapshot.hero_matchup_data(),
+            }
 
     # Fetch hero matchup data
     heroes_list = utils.get_heroes_list()
-    forbidden_heroes = set(hero_config.forbidden_heroes)
-    available_heroes = set(heroes_list) - forbidden_heroes
-
-    hero_matchup_data = {}
-    for hero in heroes_list:
-        matchup_data = utils.get_hero_matchup_data(hero, timeframe_type, timeframe)
-        if matchup_data:
-            hero_matchup_data.update(matchup_data)
+    if lazy_matchups:
+        hero_matchup_data = matchup_store.LazyMatchupStore(heroes_list, timeframe_type, timeframe, max_workers)
+        forbidden_heroes = utils.config_module("hero_config").forbidden_heroes
+        hero_matchup_data.prefetch(priority_heroes, [hero for hero in heroes_list if hero not in forbidden_heroes])
+    else:
+        hero_matchup_data = {}
+        for matchup_data in utils.get_hero_matchup_data_bulk(heroes_list, timeframe_type, timeframe, max_workers).values():
+            if matchup_data:
+                hero_matchup_data.update(matchup_data)
 
-    # ✅ Use direct Python imports instead of JSON loading
     return {
-        "map_name": team_config.map_name,
-        "team_1": team_1,
-        "team_2": team_2,
-        "team_1_hero_performance": team_1_hero_performance,
-        "team_2_hero_performance": team_2_hero_performance,
+        # Fetch hero win rates by map
+        "hero_winrates_by_map": utils.get_hero_winrates_by_map(timeframe_type, timeframe),
+        "heroes_list": heroes_list,
+        "hero_roles": utils.get_hero_roles(),
         "hero_matchup_data": hero_matchup_data,
-        "hero_winrates_by_map": hero_winrates_by_map,
-        "team_1_player_mmr_data": team_1_player_hero_mmr,
-        "team_2_player_mmr_data": team_2_player_hero_mmr,
+    }
+
+
+def initialize_draft(patch_data, team_data, map_name, team_1_name, team_2_name, scoring_engine=None):
+    """
+    Builds a fresh DRAFT_DATA dict from loaded patch and team data.
+
+    The loaded data is shared, not copied, so many drafts can be initialized from one load. Pass the
+    `scoring_engine` of an earlier draft with the same patch and team data to reuse its arrays; the
+    engine doesn't depend on the map.
+    """
+    hero_config = utils.config_module("hero_config")
+    forbidden_heroes = set(hero_config.forbidden_heroes)
+    available_heroes = set(patch_data["heroes_list"]) - forbidden_heroes
+
+    # ✅ Use direct Python imports instead of JSON loading
+    draft_data = {
+        "map_name": map_name,
+        "team_1": team_data["team_1"],
+        "team_2": team_data["team_2"],
+        "team_1_hero_performance": team_data["team_1_hero_performance"],
+        "team_2_hero_performance": team_data["team_2_hero_performance"],
+        "hero_matchup_data": patch_data["hero_matchup_data"],
+        "hero_winrates_by_map": patch_data["hero_winrates_by_map"],
+        "team_1_player_mmr_data": team_data["team_1_player_mmr_data"],
+        "team_2_player_mmr_data": team_data["team_2_player_mmr_data"],
         "available_heroes": available_heroes,
-        "team_1_name": team_config.team_1_name,
-        "team_2_name": team_config.team_2_name,
-        "available_players_team_1": team_config.team_1_tags[:],
-        "available_players_team_2": team_config.team_2_tags[:],
+        "team_1_name": team_1_name,
+        "team_2_name": team_2_name,
+        "available_players_team_1": team_data["team_1_tags"][:],
+        "available_players_team_2": team_data["team_2_tags"][:],
         "draft_log": [],
         "banned_heroes": set(),
         "picked_heroes": set(),
         "team_1_picked_heroes": {},
         "team_2_picked_heroes": {},
-        "hero_roles": utils.get_hero_roles(),
+        "hero_roles": patch_data["hero_roles"],
         "forbidden_heroes": forbidden_heroes,
         "required_roles": set(hero_config.required_roles),
         "role_limits": hero_config.role_limits,
         "role_pick_restrictions": hero_config.role_pick_restrictions,
         "hero_pick_restrictions": hero_config.hero_pick_restrictions,
         "team_roles": {
-            team_config.team_1_name: {role: 0 for role in hero_config.required_roles},
-            team_config.team_2_name: {role: 0 for role in hero_config.required_roles}
+            team_1_name: {role: 0 for role in hero_config.required_roles},
+            team_2_name: {role: 0 for role in hero_config.required_roles}
         }
     }
+
+    # ✅ Build the dense scoring arrays once per draft
+    draft_data["scoring_engine"] = scoring_engine or scoring.ScoringEngine(draft_data)
+    return draft_data
+
+
+def switch_map(draft_data, map_name):
+    """
+    Returns a copy of DRAFT_DATA on `map_name`, with its own draft state (picks, bans and log are
+    copied as they are) and the loaded data and scoring engine shared. The engine already holds the
+    tables of every map, so nothing is reloaded or rebuilt.
+    """
+    switched = dict(draft_data, map_name=map_name)
+    for key in ("available_heroes", "banned_heroes", "picked_heroes"):
+        switched[key] = set(draft_data[key])
+    for key in ("available_players_team_1", "available_players_team_2", "draft_log"):
+        switched[key] = list(draft_data[key])
+    for key in ("team_1_picked_heroes", "team_2_picked_heroes"):
+        switched[key] = dict(draft_data[key])
+    switched["team_roles"] = {team_name: dict(roles) for team_name, roles in draft_data["team_roles"].items()}
+    switched.pop("step_timings", None)
+    return switched
+
+
+def load_and_initialize_draft(timeframe_type="major", timeframe="2.55", max_workers=None, use_snapshot=True, map_name=None, lazy_matchups=False):
+    """
+    Loads all necessary data and initializes the draft structure.
+
+    Teams come from team_config, as does the map unless `map_name` is given. See `load_patch_data`
+    for `max_workers`, `use_snapshot` and `lazy_matchups`; lazy matchup rows of the players' hero
+    pools are prefetched first.
+    """
+    team_config = utils.config_module("team_config")
+
+    map_name = map_name or team_config.map_name
+    print(f"\nLoading draft data for {map_name}...")
+
+    team_data = load_team_data(team_config.team_1_tags, team_config.team_2_tags)
+    patch_data = load_patch_data(timeframe_type, timeframe, max_workers, use_snapshot, lazy_matchups, pool_heroes(team_data))
+    return initialize_draft(patch_data, team_data, map_name, team_config.team_1_name, team_config.team_2_name)
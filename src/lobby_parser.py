@@ -0,0 +1,104 @@
+"""
+BattleTag extraction from .battlelobby files (and the uncompressed parts of .StormSave files).
+
+The file is memory-mapped and scanned for '#' bytes, so it is never decoded or copied as a whole.
+Around every '#' a BattleTag is only accepted if it is well formed: a 3-12 character name that
+starts with a letter and is valid UTF-8, then 4-6 digits, delimited on both sides. Lobby files
+store strings with a length byte in front of them, and a player's tag usually appears more than
+once, so each tag is scored on its own: length-prefixed tags first, then tags seen more often. At
+most 10 tags are kept, so well formed binary noise only takes a slot when fewer real tags exist.
+
+Players come back in file order. Whether that is slot order, and which players form a team, hasn't
+been verified against a captured lobby file, so no team is assigned here: team_tags sorts the tags
+into known rosters (e.g. team_config's) instead.
+"""
+import mmap
+from collections import namedtuple
+
+LobbyPlayer = namedtuple("LobbyPlayer", ["index", "battletag"])  # index: position in the file
+
+TEAM_SIZE = 5
+MAX_PLAYERS = 2 * TEAM_SIZE
+NAME_MIN, NAME_MAX = 3, 12  # BattleTag name length in characters
+DIGITS_MIN, DIGITS_MAX = 4, 6
+_NAME_BYTES_MAX = NAME_MAX * 4  # UTF-8 worst case
+
+
+def _is_name_byte(byte):
+    return byte >= 0x80 or 48 <= byte <= 57 or 65 <= byte <= 90 or 97 <= byte <= 122
+
+
+def _tag_at(data, hash_pos):
+    """Returns (battletag, length prefixed) for a well formed BattleTag around `data[hash_pos] == '#'`, else None."""
+    end = hash_pos + 1
+    while end < len(data) and end - hash_pos - 1 <= DIGITS_MAX and 48 <= data[end] <= 57:
+        end += 1
+    digits = end - hash_pos - 1
+    if not DIGITS_MIN <= digits <= DIGITS_MAX or (end < len(data) and 48 <= data[end] <= 57):
+        return None
+
+    start = hash_pos
+    while start > 0 and hash_pos - start < _NAME_BYTES_MAX and _is_name_byte(data[start - 1]):
+        start -= 1
+    if start > 0 and _is_name_byte(data[start - 1]):
+        return None  # ✅ Longer than any BattleTag name: noise
+
+    # UTF-8 continuation bytes can't start a name; skip a torn sequence at the front
+    while start < hash_pos and 0x80 <= data[start] < 0xC0:
+        start += 1
+    try:
+        name = bytes(data[start:hash_pos]).decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if not NAME_MIN <= len(name) <= NAME_MAX or not name[0].isalpha():
+        return None
+
+    length_prefixed = start > 0 and data[start - 1] == end - start
+    return f"{name}#{bytes(data[hash_pos + 1:end]).decode()}", length_prefixed
+
+
+def scan_battletags(data):
+    """
+    Returns at most MAX_PLAYERS distinct BattleTags in a bytes-like object, in file order. When there
+    are more, the length-prefixed tags win, then the tags found most often.
+    """
+    first_seen, framed, seen = {}, set(), {}
+    position = data.find(b"#")
+    while position != -1:
+        found = _tag_at(data, position)
+        if found is not None:
+            tag, length_prefixed = found
+            first_seen.setdefault(tag, position)
+            seen[tag] = seen.get(tag, 0) + 1
+            if length_prefixed:
+                framed.add(tag)
+        position = data.find(b"#", position + 1)
+
+    kept = sorted(first_seen, key=lambda tag: (tag not in framed, -seen[tag], first_seen[tag]))[:MAX_PLAYERS]
+    return sorted(kept, key=first_seen.get)
+
+
+def parse_battletags(file_path):
+    """Returns the players of a lobby file as LobbyPlayer(index, battletag), in file order."""
+    with open(file_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return []  # ✅ Empty file: the game hasn't written it yet
+        try:
+            battletags = scan_battletags(data)
+        finally:
+            data.close()
+    return [LobbyPlayer(index, tag) for index, tag in enumerate(battletags)]
+
+
+def team_tags(battletags, team_1_roster, team_2_roster):
+    """
+    Splits a lobby's BattleTags into (team_1_tags, team_2_tags) by the rosters they are on, ready for
+    load_data.load_team_data. Raises ValueError for tags on neither roster, as file order can't place them.
+    """
+    team_1_roster, team_2_roster = set(team_1_roster), set(team_2_roster)
+    unknown = [tag for tag in battletags if tag not in team_1_roster and tag not in team_2_roster]
+    if unknown:
+        raise ValueError(f"BattleTags on neither roster: {unknown}")
+    return [tag for tag in battletags if tag in team_1_roster], [tag for tag in battletags if tag in team_2_roster]
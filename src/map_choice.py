@@ -0,0 +1,78 @@
+"""
+Compares every map of the patch for the two configured rosters, to answer "which map should we pick":
+
+    python map_choice.py --timeframe minor:2.55.9.93640 --first-pick 2
+"""
+import argparse
+
+import load_data
+import simulate
+
+
+def compare_maps(draft_data, team_name=None, first_pick_team=1, maps=None, mock_drafts=True):
+    """
+    Returns one row per map, best map for `team_name` (default: team 1) first, as
+    {"map", "roster_advantage", "draft_advantage", "top_heroes"}.
+
+    The roster advantage is the difference between the teams' summed best base scores (MMR + map
+    bonus) on the map, read from the scoring engine's tables for all maps at once. With `mock_drafts`
+    a fully automated greedy draft is run on every map as well, and the draft advantage is the
+    difference between the teams' summed pick scores; otherwise it is None.
+    """
+    engine = draft_data["scoring_engine"]
+    team_name = team_name or draft_data["team_1_name"]
+    side, enemy_side = ("team_1", "team_2") if team_name == draft_data["team_1_name"] else ("team_2", "team_1")
+    maps = maps or list(engine.hero_winrates_by_map)
+
+    engine.precompute_maps(maps)
+    own_strengths = engine.roster_strengths(side, draft_data[f"available_players_{side}"])
+    enemy_strengths = engine.roster_strengths(enemy_side, draft_data[f"available_players_{enemy_side}"])
+
+    rows = []
+    for map_name in maps:
+        map_idx = engine.map_index[map_name]
+        top_heroes = [engine.heroes[idx] for idx in engine.map_rankings[map_name].tolist() if not engine.forbidden_mask[idx]][:3]
+
+        draft_advantage = None
+        if mock_drafts:
+            result = simulate.simulate_draft(load_data.switch_map(draft_data, map_name), first_pick_team)
+            draft_advantage = sum(score if pick_team == team_name else -score for _, pick_team, _, _, _, score in result["picks"])
+
+        rows.append({
+            "map": map_name,
+            "roster_advantage": round(own_strengths[map_idx].item() - enemy_strengths[map_idx].item(), 2),
+            "draft_advantage": None if draft_advantage is None else round(draft_advantage, 2),
+            "top_heroes": top_heroes,
+        })
+
+    rows.sort(key=lambda row: (row["draft_advantage"] if mock_drafts else row["roster_advantage"], row["roster_advantage"]), reverse=True)
+    return rows
+
+
+def print_map_comparison(rows, team_name):
+    print(f"\n🔹 MAP COMPARISON FOR {team_name} 🔹")
+    print(f"{'Map':<26} {'Draft Adv.':>11} {'Roster Adv.':>12}  Best map heroes")
+    print("=" * 90)
+    for row in rows:
+        draft_advantage = "-" if row["draft_advantage"] is None else f"{row['draft_advantage']:+.2f}"
+        print(f"{row['map']:<26} {draft_advantage:>11} {row['roster_advantage']:>+12.2f}  {', '.join(row['top_heroes'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank the maps of a patch for the two configured rosters.")
+    parser.add_argument("--timeframe", type=simulate.parse_timeframe, default=("major", "2.55"), help="TYPE:TIMEFRAME (default: major:2.55)")
+    parser.add_argument("--team", type=int, choices=[1, 2], default=1, help="Team to rank the maps for")
+    parser.add_argument("--first-pick", type=int, choices=[1, 2], default=1, help="First pick team of the mock drafts")
+    parser.add_argument("--maps", nargs="+", help="Maps to compare (default: every map in the patch data)")
+    parser.add_argument("--no-drafts", action="store_true", help="Only compare rosters, skip the mock draft per map")
+    args = parser.parse_args(argv)
+
+    draft_data = load_data.load_and_initialize_draft(*args.timeframe)
+    team_name = draft_data[f"team_{args.team}_name"]
+    rows = compare_maps(draft_data, team_name, args.first_pick, args.maps, not args.no_drafts)
+    print_map_comparison(rows, team_name)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import http_client
+import utils
+
+
+class LazyMatchupStore(Mapping):
+    """
+    Read-only {hero: {other_hero: {"ally": {...}, "enemy": {...}}}} over the HeroesProfile matchup
+    endpoint that loads a hero's row (from the API cache, or the API) on first access.
+
+    `prefetch` queues rows to load on a background thread, one bulk request per batch; reading a row
+    that is queued waits for its batch instead of requesting it twice. Iterating loads every row.
+    Pickles as its parameters and the rows loaded so far, so worker processes load the rest themselves.
+    """
+
+    def __init__(self, heroes, timeframe_type, timeframe, max_workers=None, rows=None):
+        self.heroes = list(heroes)
+        self.timeframe_type = timeframe_type
+        self.timeframe = timeframe
+        self.max_workers = max_workers
+        self._hero_set = set(self.heroes)
+        self._rows = dict(rows or {})  # hero -> row, None when the API has no data for the hero
+        self._pending = {}  # hero -> future of the prefetch batch that loads it
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def __reduce__(self):
+        with self._lock:
+            rows = dict(self._rows)
+        return LazyMatchupStore, (self.heroes, self.timeframe_type, self.timeframe, self.max_workers, rows)
+
+    # ✅ Loading
+
+    def _load_batch(self, heroes):
+        """Loads `heroes` in one bulk pass; heroes whose request failed are left for `_load_row` to retry."""
+        responses = utils.get_hero_matchup_data_bulk(heroes, self.timeframe_type, self.timeframe, self.max_workers, missing_ok=True)
+        with self._lock:
+            for hero in heroes:
+                data = responses.get(hero)
+                if data is not None:
+                    self._rows[hero] = data.get(hero)
+                    self._pending.pop(hero, None)
+
+    def _load_row(self, hero):
+        """Returns the row of `hero`, waiting for its prefetch batch or requesting it directly."""
+        with self._lock:
+            if hero in self._rows:
+                return self._rows[hero]
+            future = self._pending.get(hero)
+
+        if future is not None:
+            future.result()
+            with self._lock:
+                self._pending.pop(hero, None)
+                if hero in self._rows:
+                    return self._rows[hero]
+
+        try:
+            row = utils.get_hero_matchup_data(hero, self.timeframe_type, self.timeframe).get(hero)
+        except http_client.NotFoundError:
+            row = None
+        with self._lock:
+            self._rows[hero] = row
+        return row
+
+    def prefetch(self, priority, rest=()):
+        """
+        Queues the rows of `priority` and then those of `rest` for loading on a background thread,
+        skipping rows that are loaded or queued already. Returns the future of the last batch.
+        """
+        future = None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="matchup-prefetch")
+            for heroes in (priority, rest):
+                batch = [hero for hero in dict.fromkeys(heroes) if hero in self._hero_set and hero not in self._rows and hero not in self._pending]
+                if batch:
+                    future = self._executor.submit(self._load_batch, batch)
+                    self._pending.update((hero, future) for hero in batch)
+        return future
+
+    def rows_for(self, heroes):
+        """Returns [(hero, row)] for the heroes in `heroes` that have matchup data, loading missing rows in one bulk pass."""
+        heroes = [hero for hero in dict.fromkeys(heroes) if hero in self._hero_set]
+        with self._lock:
+            unqueued = [hero for hero in heroes if hero not in self._rows and hero not in self._pending]
+        if unqueued:
+            self._load_batch(unqueued)
+
+        rows = ((hero, self._load_row(hero)) for hero in heroes)
+        return [(hero, row) for hero, row in rows if row is not None]
+
+    def wait(self):
+        """Blocks until every queued batch is loaded."""
+        with self._lock:
+            futures = set(self._pending.values())
+        for future in futures:
+            future.result()
+
+    def loaded_count(self):
+        """Number of rows loaded so far (including heroes without data)."""
+        with self._lock:
+            return len(self._rows)
+
+    # ✅ Mapping
+
+    def __getitem__(self, hero):
+        row = self._load_row(hero) if hero in self._hero_set else None
+        if row is None:
+            raise KeyError(hero)
+        return row
+
+    def __iter__(self):
+        return (hero for hero, _ in self.rows_for(self.heroes))
+
+    def __len__(self):
+        return len(self.rows_for(self.heroes))
@@ -0,0 +1,169 @@
+import math
+import os
+import random
+import time
+
+import search
+
+DEFAULT_TIME_LIMIT = 2.0
+EXPLORATION = 1.4
+VALUE_SCALE = 1000.0  # Pick scores are in MMR units, UCT works on values of roughly unit size
+ROLLOUT_EPSILON = 0.2  # Chance a rollout step plays a non-greedy candidate instead of the greedy one
+
+
+class _Node:
+    __slots__ = ("move", "value", "slot", "children", "untried", "visits", "total_value")
+
+    def __init__(self, move, value):
+        self.move = move
+        self.value = value
+        self.slot = None  # Index of the slot the children's moves are played in
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.total_value = 0.0
+
+
+class MonteCarloTreeSearch:
+    """
+    Single-tree MCTS over the remaining draft slots.
+
+    Tree moves and rollouts both come from the greedy pick/ban suggestions: the tree expands the
+    top `branching` candidates and rollouts play the greedy choice, with an occasional runner-up
+    so that independent trees explore different lines. Values are the signed sum of pick scores
+    from the point of view of the team on the clock at the root.
+    """
+
+    def __init__(self, DRAFT_DATA, slots, seed=0, branching=search.DEFAULT_BRANCHING):
+        self.DRAFT_DATA = search.as_draft_state(DRAFT_DATA)
+        self.slots = slots
+        self.branching = branching
+        self.root_team = slots[0][2]
+        self.rng = random.Random(seed)
+        self.root = _Node(None, 0.0)
+
+    def run(self, time_limit):
+        """Runs iterations until `time_limit` seconds have passed and returns the root child statistics."""
+        deadline = time.perf_counter() + time_limit
+        while time.perf_counter() < deadline:
+            self._iterate()
+            if self.root.untried == [] and not self.root.children:
+                break
+        return {child.move: (child.visits, child.total_value) for child in self.root.children}
+
+    def _iterate(self):
+        node, index = self.root, 0
+        path = [node]
+        applied = []
+        line_value = 0.0
+
+        try:
+            # ✅ Selection and expansion
+            while index < len(self.slots):
+                if node.untried is None:
+                    # ✅ Slots with nothing to ban or pick get no tree level: the children play the next slot that has moves
+                    node.slot, node.untried = index, self._moves(index)
+                    while not node.untried and node.slot + 1 < len(self.slots):
+                        node.slot += 1
+                        node.untried = self._moves(node.slot)
+                    self.rng.shuffle(node.untried)
+                index = node.slot
+                if not node.untried and not node.children:
+                    break  # Nothing left to ban or pick
+
+                if node.untried:
+                    move, value = node.untried.pop()
+                    child = _Node(move, value)
+                    node.children.append(child)
+                else:
+                    child = self._select(node, self.slots[index][2] == self.root_team)
+
+                applied.append((child.move, search.apply_move(self.DRAFT_DATA, child.move)))
+                line_value += self._signed(child.value, index)
+                node = child
+                path.append(node)
+                index += 1
+                if node.visits == 0:
+                    break
+
+            # ✅ Greedy default policy for the rest of the draft
+            for rollout_index in range(index, len(self.slots)):
+                moves = search.candidate_moves(self.DRAFT_DATA, self.slots[rollout_index], self.branching)
+                if not moves:
+                    continue
+                move, value, _ = moves[0] if len(moves) == 1 or self.rng.random() >= ROLLOUT_EPSILON else self.rng.choice(moves[1:])
+                applied.append((move, search.apply_move(self.DRAFT_DATA, move)))
+                line_value += self._signed(value, rollout_index)
+        finally:
+            for move, token in reversed(applied):
+                search.undo_move(self.DRAFT_DATA, move, token)
+
+        for visited in path:
+            visited.visits += 1
+            visited.total_value += line_value
+
+    def _moves(self, index):
+        return [(move, value) for move, value, _ in search.candidate_moves(self.DRAFT_DATA, self.slots[index], self.branching)]
+
+    def _signed(self, value, index):
+        return value if self.slots[index][2] == self.root_team else -value
+
+    def _select(self, node, maximizing):
+        """UCT child selection; the opposing team picks the child that is worst for the root team."""
+        log_visits = math.log(node.visits)
+        sign = 1 if maximizing else -1
+        return max(
+            node.children,
+            key=lambda child: sign * child.total_value / child.visits / VALUE_SCALE + EXPLORATION * math.sqrt(log_visits / child.visits)
+        )
+
+
+def _run_tree(DRAFT_DATA, slots, time_limit, seed, branching):
+    """Process pool entry point: grows one tree and returns its root statistics."""
+    return MonteCarloTreeSearch(DRAFT_DATA, slots, seed, branching).run(time_limit)
+
+
+def merge_statistics(trees):
+    """Sums the {move: (visits, total value)} root statistics of independent trees by move."""
+    merged = {}
+    for statistics in trees:
+        for move, (visits, total_value) in statistics.items():
+            merged_visits, merged_value = merged.get(move, (0, 0.0))
+            merged[move] = (merged_visits + visits, merged_value + total_value)
+    return merged
+
+
+def mcts_suggestions(DRAFT_DATA, slots, time_limit=DEFAULT_TIME_LIMIT, num_suggestions=search.DEFAULT_BRANCHING, max_workers=None):
+    """
+    Returns suggestions for the first of `slots`, ranked by root-parallel MCTS.
+
+    Each worker process grows an independent tree from its own copy of the draft state; the root child
+    statistics are merged and the greedy suggestion tuples are returned ordered by visit count,
+    with visits and mean value appended to the reason.
+    """
+    state = search.as_draft_state(DRAFT_DATA)
+    root_moves = search.candidate_moves(state, slots[0])
+    if len(root_moves) <= 1:
+        return [suggestion for _, _, suggestion in root_moves]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    # ✅ Workers get a compact DraftState without the log, which only grows the payload sent to each process
+    worker_data = state.copy()
+    worker_data.draft_log = []
+
+    executor = search.process_pool(max_workers)
+    futures = [
+        executor.submit(_run_tree, worker_data, slots, time_limit, seed, search.DEFAULT_BRANCHING)
+        for seed in range(max_workers)
+    ]
+
+    merged = merge_statistics(future.result() for future in futures)
+
+    ranked = []
+    for move, _, suggestion in root_moves:
+        visits, total_value = merged.get(move, (0, 0.0))
+        mean_value = total_value / visits if visits else 0.0
+        ranked.append((visits, mean_value, suggestion[:-1] + (f"{suggestion[-1]}, MCTS Visits: {visits}, Mean Value: {mean_value:+.2f}",)))
+
+    ranked.sort(key=lambda x: (x[0], x[1]), reverse=True)
+    return [suggestion for _, _, suggestion in ranked[:num_suggestions]]
@@ -0,0 +1,225 @@
+"""
+Local stand-in for the HeroesProfile API.
+
+Serves generated (synthetic_api) or recorded (an api_cache.sqlite3 file) responses for the
+endpoints utils.py calls, with configurable latency, server errors, 429s and a call quota:
+
+    python mock_server.py --port 8765 --latency 0.05 --error-rate 0.01 --throttle-rate 0.02 --quota 5000
+    HEROES_PROFILE_BASE_URL=http://127.0.0.1:8765/api python draft.py
+
+GET /__stats returns the request counters as JSON.
+"""
+import argparse
+import json
+import pickle
+import random
+import sqlite3
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import synthetic_api
+
+QUOTA_EXHAUSTED_BODY = "<html><body>You have exceeded your API call limit.</body></html>"
+
+
+def normalized_key(endpoint, params):
+    """Lookup key that matches however the parameters were encoded: decoded values, sorted, no API token."""
+    return endpoint.strip("/"), tuple(sorted((key, unquote(str(value))) for key, value in (params or {}).items() if key != "api_token"))
+
+
+def generated_responses(seed=0, timeframes=(("major", "2.55"),), **kwargs):
+    """Returns {normalized key: response} of synthetic data for every timeframe in `timeframes`."""
+    responses = {}
+    for timeframe_type, timeframe in timeframes:
+        for endpoint, params, response in synthetic_api.generate_api_responses(seed, timeframe_type=timeframe_type, timeframe=timeframe, **kwargs):
+            responses[normalized_key(endpoint, params)] = response
+
+            if endpoint == "Heroes/Stats":
+                # ✅ The ungrouped stats endpoint averages the per-map win rates
+                stats = [
+                    {
+                        "hero": hero,
+                        "win_rate": round(sum(maps[hero]["win_rate"] for maps in response.values()) / len(response), 2),
+                        "popularity": 10.0,
+                        "games_played": 1000,
+                    }
+                    for hero in next(iter(response.values()))
+                ]
+                stats_params = {"timeframe_type": timeframe_type, "timeframe": timeframe, "game_type": "Storm League", "group_by_map": "false"}
+                responses[normalized_key("1.0/Heroes/Stats", stats_params)] = stats
+    return responses
+
+
+def recorded_responses(cache_path):
+    """Returns {normalized key: response} for every cached response in an API cache file (cached 404s are skipped)."""
+    connection = sqlite3.connect(cache_path)
+    try:
+        rows = connection.execute("SELECT key, payload FROM entries").fetchall()
+    finally:
+        connection.close()
+
+    responses = {}
+    for key, payload in rows:
+        value = pickle.loads(zlib.decompress(payload))
+        if value is not None:
+            endpoint, _, query = key.partition("?")
+            responses[normalized_key(endpoint, dict(parse_qsl(query)))] = value
+    return responses
+
+
+class MockHeroesProfileServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering from `responses` ({normalized key: response}).
+
+    Each request waits `latency` seconds (uniformly jittered by ±`jitter`), then answers 500 with
+    probability `error_rate` and 429 with probability `throttle_rate` or when more than `rate_limit`
+    requests arrive within one second. After `quota` answered calls every request gets a 200 with an
+    HTML body, which is how the real API reports an exhausted subscription. Unknown requests get 404.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, responses, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 rate_limit=None, quota=None, seed=None, verbose=False):
+        super().__init__(address, _Handler)
+        self.responses = responses
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.quota = quota
+        self.verbose = verbose
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.window = []
+        self.stats = {"requests": 0, "ok": 0, "not_found": 0, "server_errors": 0, "throttled": 0, "quota_exhausted": 0, "by_endpoint": {}}
+
+    @property
+    def url(self):
+        """Base URL to use as HEROES_PROFILE_BASE_URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def decide(self, endpoint):
+        """Counts the request and returns ("ok" | "error" | "throttled" | "quota", delay in seconds)."""
+        with self.lock:
+            now = time.monotonic()
+            self.stats["requests"] += 1
+            self.stats["by_endpoint"][endpoint] = self.stats["by_endpoint"].get(endpoint, 0) + 1
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+
+            self.window = [t for t in self.window if now - t < 1.0]
+            self.window.append(now)
+
+            if self.quota is not None and self.stats["ok"] + self.stats["not_found"] >= self.quota:
+                self.stats["quota_exhausted"] += 1
+                return "quota", delay
+            if self.rng.random() < self.error_rate:
+                self.stats["server_errors"] += 1
+                return "error", delay
+            if self.rng.random() < self.throttle_rate or (self.rate_limit and len(self.window) > self.rate_limit):
+                self.stats["throttled"] += 1
+                return "throttled", delay
+            return "ok", delay
+
+    def count(self, outcome):
+        with self.lock:
+            self.stats[outcome] += 1
+
+    def snapshot_stats(self):
+        with self.lock:
+            return json.loads(json.dumps(self.stats))
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.strip("/")
+        if path == "__stats":
+            return self._send(200, json.dumps(self.server.snapshot_stats()))
+        if path.startswith("api/"):
+            path = path[len("api/"):]
+
+        outcome, delay = self.server.decide(path)
+        if delay:
+            time.sleep(delay)
+
+        if outcome == "quota":
+            return self._send(200, QUOTA_EXHAUSTED_BODY, "text/html")
+        if outcome == "error":
+            return self._send(500, json.dumps({"error": "Internal Server Error"}))
+        if outcome == "throttled":
+            return self._send(429, json.dumps({"error": "Too Many Attempts."}), headers={"Retry-After": "1"})
+
+        response = self.server.responses.get(normalized_key(path, dict(parse_qsl(url.query))))
+        if response is None:
+            self.server.count("not_found")
+            return self._send(404, json.dumps({"error": "Not Found"}))
+        self.server.count("ok")
+        return self._send(200, json.dumps(response))
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def start_server(responses=None, host="127.0.0.1", port=0, **options):
+    """Starts a server on a background thread (port 0 picks a free port) and returns it; call `shutdown()` to stop."""
+    server = MockHeroesProfileServer((host, port), responses if responses is not None else generated_responses(), **options)
+    threading.Thread(target=server.serve_forever, name="mock-heroes-profile", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HeroesProfile API stand-in for offline and quota testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--recorded", help="Serve the responses stored in this API cache file instead of generated data")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated data and of the fault injection")
+    parser.add_argument("--timeframe", action="append", help="TYPE:TIMEFRAME to generate data for, repeatable (default: major:2.55)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform ± jitter on the latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 429")
+    parser.add_argument("--rate-limit", type=int, help="Requests per second before answering HTTP 429")
+    parser.add_argument("--quota", type=int, help="Answered calls before the quota is exhausted")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    if args.recorded:
+        responses = recorded_responses(args.recorded)
+    else:
+        timeframes = [tuple(value.split(":", 1)) for value in args.timeframe or ["major:2.55"]]
+        responses = generated_responses(args.seed, timeframes)
+
+    server = MockHeroesProfileServer(
+        (args.host, args.port), responses, args.latency, args.jitter, args.error_rate, args.throttle_rate,
+        args.rate_limit, args.quota, args.seed, args.verbose
+    )
+    print(f"Serving {len(responses)} responses. Use HEROES_PROFILE_BASE_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.snapshot_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Offline BattleTag OCR for draft screen images.
+
+draft_screen_scraper clicks through every player's profile and OCRs the whole screen each time.
+This pipeline instead reads the players from one screenshot or saved image: one region per slot
+is cropped, preprocessed for tesseract (grayscale, upscale, threshold to dark text on white) and
+the crops are OCRed at once in a thread pool. tesseract runs as a subprocess per crop, so threads
+run it in parallel and a whole screen takes about one OCR latency.
+
+The default regions are unverified. PLAYER_POSITIONS are the hexagons the scraper right-clicks,
+and the full Name#1234 is only known to appear in the View Profile window it opens; the label box
+below each hexagon (LABEL_SIZE, LABEL_OFFSET_Y) is a guess that hasn't been checked against a
+captured draft screen. The red team's positions aren't calibrated either, so their slots have no
+default region and read as None. Pass calibrated regions to OcrPipeline or `--regions`.
+
+OCR results are cached by the hash of the preprocessed crop, so an unchanged label is never read
+twice; pass a cache_store.CacheStore to keep them across runs.
+
+Pillow and pytesseract are imported on use. Tests can pass `ocr` to run without tesseract.
+"""
+import argparse
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import draft_screen_scraper
+
+# Guessed name label relative to its hexagon, as fractions of the image size (unverified)
+LABEL_SIZE = (0.11, 0.04)
+LABEL_OFFSET_Y = 0.055
+UPSCALE = 3  # tesseract reads small game fonts best at roughly 30px cap height
+THRESHOLD = 140  # Light label text on the dark draft screen
+TESSERACT_CONFIG = "--psm 7"  # Every crop is a single line of text
+TEAM_SIZE = 5
+
+BATTLETAG_PATTERN = re.compile(r"([^\W\d_]\w{2,11})\s*#\s*(\d{4,6})(?!\d)")
+
+
+def label_region(x_percent, y_percent, size=LABEL_SIZE, offset_y=LABEL_OFFSET_Y):
+    """Returns the (left, top, right, bottom) fractions of the name label under a hexagon at (x, y)."""
+    width, height = size
+    left = min(max(x_percent - width / 2, 0.0), 1.0 - width)
+    top = min(max(y_percent + offset_y - height / 2, 0.0), 1.0 - height)
+    return left, top, left + width, top + height
+
+
+# ✅ Slot order; the red team (slots 5-9) is left out until its positions are calibrated
+PLAYER_REGIONS = [label_region(x, y) for x, y in draft_screen_scraper.PLAYER_POSITIONS[:TEAM_SIZE]] + [None] * TEAM_SIZE
+
+
+def crop_box(image_size, region):
+    """Converts a fractional region to a pixel box for an image of `image_size` (width, height)."""
+    width, height = image_size
+    left, top, right, bottom = region
+    return round(left * width), round(top * height), round(right * width), round(bottom * height)
+
+
+def parse_battletag(text):
+    """Returns the first BattleTag in OCR output, tolerating spaces around '#', or None."""
+    match = BATTLETAG_PATTERN.search(text or "")
+    return f"{match.group(1)}#{match.group(2)}" if match else None
+
+
+def image_hash(image):
+    """Content hash of a PIL image: mode, size and pixels."""
+    digest = hashlib.sha256(f"{image.mode}{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def load_image(source=None):
+    """Returns a PIL image for a file path or an image, or a screenshot when `source` is None."""
+    from PIL import Image, ImageGrab
+
+    if source is None:
+        return ImageGrab.grab()
+    if isinstance(source, Image.Image):
+        return source
+    with Image.open(source) as image:
+        image.load()
+        return image
+
+
+def preprocess(crop, scale=UPSCALE, threshold=THRESHOLD):
+    """Grayscale, upscale and threshold a label crop to black text on white."""
+    from PIL import Image
+
+    gray = crop.convert("L")
+    gray = gray.resize((gray.width * scale, gray.height * scale), Image.LANCZOS)
+    return gray.point(lambda p: 0 if p > threshold else 255)
+
+
+def tesseract_ocr(image):
+    import pytesseract
+    return pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+
+
+class OcrPipeline:
+    """
+    Reads one BattleTag per region of a draft screen image, OCRing the regions in parallel.
+    `regions` are (left, top, right, bottom) fractions per slot, None for a slot that isn't read.
+    """
+
+    def __init__(self, regions=None, ocr=None, cache_store=None, max_workers=None):
+        self.regions = list(regions or PLAYER_REGIONS)
+        self.ocr = ocr or tesseract_ocr
+        self.cache_store = cache_store
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.regions), thread_name_prefix="ocr")
+
+    def crops(self, image):
+        """Returns the preprocessed crop of every region, in region order (None for slots without a region)."""
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        return [preprocess(image.crop(crop_box(image.size, region))) if region is not None else None for region in self.regions]
+
+    def _cached(self, key):
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+        if self.cache_store is not None:
+            entry = self.cache_store.get(f"ocr/{key}")
+            if entry is not None:
+                with self.lock:
+                    self.cache[key] = entry.value
+                return entry.value
+        return None
+
+    def _read(self, key, crop):
+        text = self.ocr(crop)
+        with self.lock:
+            self.cache[key] = text
+        if self.cache_store is not None:
+            self.cache_store.put(f"ocr/{key}", text)
+        return text
+
+    def read_texts(self, source=None):
+        """Returns the OCR text of every region of an image, file path or screenshot, in region order."""
+        crops = self.crops(load_image(source))
+        keys = [image_hash(crop) if crop is not None else None for crop in crops]
+
+        texts, pending = {None: None}, {}
+        for key, crop in zip(keys, crops):
+            if key in texts or key in pending:
+                continue  # ✅ Identical labels (e.g. empty slots) are read once
+            text = self._cached(key)
+            if text is None:
+                pending[key] = self.executor.submit(self._read, key, crop)
+            else:
+                texts[key] = text
+        for key, future in pending.items():
+            texts[key] = future.result()
+        return [texts[key] for key in keys]
+
+    def battletags(self, source=None):
+        """Returns the BattleTag (or None) of every region, in slot order."""
+        return [parse_battletag(text) for text in self.read_texts(source)]
+
+    def team_tags(self, source=None):
+        """Returns (team_1_tags, team_2_tags) read from a draft screen, skipping unread and unreadable slots."""
+        tags = self.battletags(source)
+        return [tag for tag in tags[:TEAM_SIZE] if tag], [tag for tag in tags[TEAM_SIZE:] if tag]
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        if self.cache_store is not None:
+            self.cache_store.close()
+
+
+def read_regions(path):
+    """Reads calibrated regions from a JSON list of [left, top, right, bottom] fractions (or null) per slot."""
+    with open(path, encoding="utf-8") as f:
+        return [tuple(region) if region else None for region in json.load(f)]
+
+
+def main(argv=None):
+    import cache_store
+    import utils
+
+    parser = argparse.ArgumentParser(description="OCR the BattleTags of draft screen images, or of a screenshot.")
+    parser.add_argument("images", nargs="*", help="Image files (default: take a screenshot)")
+    parser.add_argument("--regions", help="JSON file of [left, top, right, bottom] fractions per slot, null to skip a slot "
+                                          "(default: the unverified blue team label guesses)")
+    args = parser.parse_args(argv)
+
+    regions = read_regions(args.regions) if args.regions else None
+    pipeline = OcrPipeline(regions, cache_store=cache_store.CacheStore(utils.data_path("ocr_cache.sqlite3")))
+    try:
+        for source in args.images or [None]:
+            team_1, team_2 = pipeline.team_tags(source)
+            print(f"{source or 'Screenshot'}:")
+            print(f"Team 1 BattleTags: {team_1}")
+            print(f"Team 2 BattleTags: {team_2}")
+    finally:
+        pipeline.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,20 @@
+import draft_state
+import hero_lookup
+import instrumentation
 import interface
 import utils
 
 
-def execute_pick_phase(order, team_name, user_input_enabled, DRAFT_DATA):
-    """Handles picking heroes, prioritizing critical selections and role enforcement with suggested picks and reasons."""
+def execute_pick_phase(order, team_name, user_input_enabled, DRAFT_DATA, suggestions=None):
+    """Handles picking heroes, prioritizing critical selections and role enforcement with suggested picks and reasons.
+
+    `suggestions` replaces the greedy suggestions when a search backend already ranked the picks.
+    """
 
     team_tags = utils.get_available_players(DRAFT_DATA, team_name)
 
     # ✅ Now passing `order` to enforce pick timing restrictions
-    pick_suggestions = select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=5)
+    pick_suggestions = suggestions or select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=5)
 
     if not user_input_enabled:
         selected_score, selected_player, selected_hero, selected_role, reason = pick_suggestions[0][1:]
@@ -23,7 +29,8 @@ def execute_pick_phase(order, team_name, user_input_enabled, DRAFT_DATA):
             DRAFT_DATA["hero_roles"],
             DRAFT_DATA["picked_heroes"],
             DRAFT_DATA["banned_heroes"],
-            [p[3] for p in pick_suggestions]
+            [p[3] for p in pick_suggestions],
+            hero_lookup.for_draft(DRAFT_DATA)
         )
 
         if selected_index in [p[3] for p in pick_suggestions]:  # If selected hero is in suggestions
@@ -59,17 +66,7 @@ def execute_pick_phase(order, team_name, user_input_enabled, DRAFT_DATA):
                     print("Invalid player. Please enter a valid team member or more characters.")
 
     # ✅ Update DRAFT_DATA correctly
-    team_tags.remove(selected_player)
-    DRAFT_DATA["picked_heroes"].add(selected_hero)
-    DRAFT_DATA["available_heroes"].remove(selected_hero)
-
-    if selected_role in DRAFT_DATA["required_roles"]:
-        DRAFT_DATA["team_roles"][team_name][selected_role] += 1  # ✅ Update role count only when a hero is actually picked
-
-    if team_name == DRAFT_DATA["team_1_name"]:
-        DRAFT_DATA["team_1_picked_heroes"][selected_player] = selected_hero
-    else:
-        DRAFT_DATA["team_2_picked_heroes"][selected_player] = selected_hero
+    draft_state.apply_pick(DRAFT_DATA, team_name, selected_player, selected_hero, selected_role)
 
     DRAFT_DATA["draft_log"].append((order, "Pick", team_name, selected_player, selected_hero, selected_score, reason))
     print(f"{order:<6} Pick  {team_name:<25} {selected_player:<20} {selected_hero:<15} {selected_score if selected_score is not None else 'N/A':<10} {reason if reason else 'No reason provided'}")
@@ -79,6 +76,11 @@ def execute_pick_phase(order, team_name, user_input_enabled, DRAFT_DATA):
 def select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=1, mmr_threshold=2700):
     """Selects the best `num_suggestions` hero picks while enforcing role limits, pick timing restrictions, and slightly boosting smaller hero pools."""
 
+    # ✅ Use the vectorized engine when the draft was initialized with one
+    scoring_engine = DRAFT_DATA.get("scoring_engine")
+    if scoring_engine is not None:
+        return scoring_engine.pick_suggestions(DRAFT_DATA, team_name, order, num_suggestions)
+
     required_roles = DRAFT_DATA["required_roles"]
     already_picked = len(DRAFT_DATA["team_1_picked_heroes"]) if team_name == DRAFT_DATA["team_1_name"] else len(DRAFT_DATA["team_2_picked_heroes"])
     remaining_picks = 5 - already_picked
@@ -98,7 +100,8 @@ def select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=1
     is_late_pick = order >= 14
 
     available_players = utils.get_available_players(DRAFT_DATA, team_name)
-    player_hero_pool_sizes = utils.get_hero_player_pool_sizes(DRAFT_DATA, team_name)
+    with instrumentation.span("pool_sizes"):
+        player_hero_pool_sizes = utils.get_hero_player_pool_sizes(DRAFT_DATA, team_name)
 
     # ✅ Determine max pool size to scale the boost
     max_pool_size = max(player_hero_pool_sizes.values(), default=1)
@@ -140,9 +143,12 @@ def select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=1
                 continue
 
             hero_mmr = round(stats.get("mmr", 2000), 2)
-            map_bonus = round(DRAFT_DATA["hero_winrates_by_map"].get(DRAFT_DATA["map_name"], {}).get(hero, {}).get("win_rate", 50) - 50, 2)
-            synergy_score = round(utils.calculate_allied_synergy_score(DRAFT_DATA, hero, team_name), 2)
-            counter_score = round(utils.calculate_enemy_countering_score(DRAFT_DATA, hero, team_name), 2)
+            with instrumentation.span("map_bonus"):
+                map_bonus = round(DRAFT_DATA["hero_winrates_by_map"].get(DRAFT_DATA["map_name"], {}).get(hero, {}).get("win_rate", 50) - 50, 2)
+            with instrumentation.span("synergy"):
+                synergy_score = round(utils.calculate_allied_synergy_score(DRAFT_DATA, hero, team_name), 2)
+            with instrumentation.span("counter"):
+                counter_score = round(utils.calculate_enemy_countering_score(DRAFT_DATA, hero, team_name), 2)
 
             # ✅ Apply a **boost** to players with smaller hero pools
             hero_pool_size = player_hero_pool_sizes.get(player, 0)
@@ -150,7 +156,8 @@ def select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=1
             score = hero_mmr + (map_bonus * 50) + (synergy_score * 25) + (counter_score * 25)
             hero_scores.append((score, hero, role, hero_mmr, map_bonus, synergy_score, counter_score))
 
-        hero_scores.sort(reverse=True, key=lambda x: x[0])
+        with instrumentation.span("sorting"):
+            hero_scores.sort(reverse=True, key=lambda x: x[0])
 
         if not hero_scores:
             continue
@@ -169,6 +176,7 @@ def select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=1
         raise ValueError(f"❌ ERROR: No valid picks available for {team_name}. Check available heroes and players.")
 
     # ✅ Sort by score drop first, then total score, and return `num_suggestions`
-    candidates.sort(reverse=True, key=lambda x: (x[0], x[1]))
+    with instrumentation.span("sorting"):
+        candidates.sort(reverse=True, key=lambda x: (x[0], x[1]))
     return candidates[:num_suggestions]
 
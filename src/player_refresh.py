@@ -0,0 +1,185 @@
+"""
+Incremental refresh of cached player data.
+
+A player's hero MMR data and NGS profile stay in the API cache until they are refreshed. The time
+the hero data was fetched is the player's freshness: `stale_players` returns the players older
+than a max age (HEROES_PROFILE_PLAYER_MAX_AGE_HOURS, default 72), and `refresh_players` refetches
+only those, concurrently. New hero stats are merged into the stored record, so heroes the API
+leaves out of a response keep their last known MMR. Every refresh reports what changed.
+
+    python player_refresh.py                          # team_config's two rosters
+    python player_refresh.py --roster-file rosters.txt --max-age-hours 24
+    python player_refresh.py "Player#1234" --force
+"""
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import cache_store
+import http_client
+import utils
+
+DEFAULT_MAX_AGE_HOURS = 72
+
+HeroChange = namedtuple("HeroChange", ["hero", "old_mmr", "new_mmr", "old_games", "new_games"])
+RefreshResult = namedtuple("RefreshResult", ["battletag", "status", "changes", "fetched_at", "error"])
+
+
+def default_max_age():
+    """Returns the max age of player data in seconds (HEROES_PROFILE_PLAYER_MAX_AGE_HOURS)."""
+    utils.load_environment()
+    hours = os.getenv("HEROES_PROFILE_PLAYER_MAX_AGE_HOURS")
+    return float(hours if hours else DEFAULT_MAX_AGE_HOURS) * 3600
+
+
+def _hero_key(battle_tag, region, game_type):
+    return cache_store.cache_key(*utils.player_hero_request(battle_tag, region, game_type))
+
+
+def player_fetched_at(battle_tags, region=1, game_type="Storm League"):
+    """Returns {battletag: time its hero data was fetched, or None when it isn't cached}."""
+    keys = {tag: _hero_key(tag, region, game_type) for tag in battle_tags}
+    fetched_at = utils.get_cache_store().fetched_at_many(keys.values())
+    return {tag: fetched_at.get(key) for tag, key in keys.items()}
+
+
+def stale_players(battle_tags, max_age=None, region=1, game_type="Storm League", now=None):
+    """Returns the players whose data is missing or older than `max_age` seconds, in input order."""
+    max_age = max_age if max_age is not None else default_max_age()
+    now = now or time.time()
+    return [
+        tag for tag, fetched_at in player_fetched_at(battle_tags, region, game_type).items()
+        if fetched_at is None or now - fetched_at > max_age
+    ]
+
+
+def merge_hero_data(old, new, game_type="Storm League"):
+    """
+    Merges a fresh Player/Hero/All response into the stored one. Returns (merged, changes) where
+    changes lists a HeroChange for every hero whose MMR or games played changed, or that is new.
+    """
+    old_heroes = (old or {}).get(game_type) or {}
+    new_heroes = (new or {}).get(game_type) or {}
+    changes = []
+    for hero, stats in new_heroes.items():
+        previous = old_heroes.get(hero, {})
+        if previous.get("mmr") != stats.get("mmr") or previous.get("games_played") != stats.get("games_played"):
+            changes.append(HeroChange(hero, previous.get("mmr"), stats.get("mmr"), previous.get("games_played"), stats.get("games_played")))
+
+    merged = {**(old or {}), **(new or {})}
+    merged[game_type] = {**old_heroes, **new_heroes}
+    return merged, changes
+
+
+def refresh_players(battle_tags, max_age=None, force=False, region=1, game_type="Storm League", max_workers=None):
+    """
+    Refetches the hero data and NGS profiles of the stale players (all of them with `force`)
+    concurrently, merges the hero data into the cache and returns a RefreshResult per player in
+    input order. A player whose request fails keeps the cached data.
+    """
+    battle_tags = list(dict.fromkeys(battle_tags))
+    stale = set(battle_tags if force else stale_players(battle_tags, max_age, region, game_type))
+    store = utils.get_cache_store()
+    fetched_at = player_fetched_at(battle_tags, region, game_type)
+    hero_requests = {tag: utils.player_hero_request(tag, region, game_type) for tag in battle_tags if tag in stale}
+    cached = store.get_many([cache_store.cache_key(*request) for request in hero_requests.values()], allow_expired=True)
+
+    def request(api_request):
+        try:
+            return utils.request_api_data(*api_request), None
+        except http_client.HeroesProfileError as e:
+            return None, e
+
+    # ✅ Hero data and profiles of every stale player are requested in one batch
+    api_requests = list(hero_requests.values()) + [utils.ngs_profile_request(tag) for tag in hero_requests]
+    with ThreadPoolExecutor(max_workers=max_workers or http_client.max_concurrency()) as executor:
+        responses = list(executor.map(request, api_requests))
+    hero_data = dict(zip(hero_requests, responses[:len(hero_requests)]))
+    profiles = dict(zip(hero_requests, responses[len(hero_requests):]))
+
+    now = time.time()
+    updates, results = {}, []
+    for tag in battle_tags:
+        if tag not in stale:
+            results.append(RefreshResult(tag, "fresh", [], fetched_at[tag], None))
+            continue
+
+        # ✅ The profile is stored whether or not the hero data came back
+        profile, profile_error = profiles[tag]
+        profile_key = cache_store.cache_key(*utils.ngs_profile_request(tag))
+        if profile_error is None:
+            updates[profile_key] = profile
+        else:
+            utils.cache_negative_result(profile_key, profile_error)
+
+        key = cache_store.cache_key(*hero_requests[tag])
+        data, error = hero_data[tag]
+        entry = cached.get(key)
+        if error is not None:
+            if entry is None:
+                utils.cache_negative_result(key, error)
+            results.append(RefreshResult(tag, "failed", [], fetched_at[tag], error))
+            continue
+
+        merged, changes = merge_hero_data(entry.value if entry else None, data, game_type)
+        updates[key] = merged
+        results.append(RefreshResult(tag, "refreshed" if entry else "new", changes, now, None))
+
+    store.put_many(updates, utils.default_cache_ttl(), fetched_at=now)
+    return results
+
+
+def format_report(results, now=None):
+    """Returns a printable summary of refresh results, one line per player plus their MMR changes."""
+    now = now or time.time()
+    lines = []
+    for result in results:
+        if result.status == "fresh":
+            lines.append(f"  {result.battletag}: fresh ({(now - result.fetched_at) / 3600:.1f}h old)")
+        elif result.status == "failed":
+            lines.append(f"❌ {result.battletag}: {result.error}")
+        else:
+            lines.append(f"✅ {result.battletag}: {result.status}, {len(result.changes)} heroes changed")
+            for change in sorted(result.changes, key=lambda change: change.hero):
+                if change.old_mmr is None:
+                    lines.append(f"     {change.hero}: new, {change.new_mmr} MMR over {change.new_games} games")
+                else:
+                    lines.append(f"     {change.hero}: {change.old_mmr} → {change.new_mmr} MMR, {change.old_games} → {change.new_games} games")
+
+    counts = {status: sum(result.status == status for result in results) for status in ("refreshed", "new", "fresh", "failed")}
+    lines.append(", ".join(f"{count} {status}" for status, count in counts.items()))
+    return "\n".join(lines)
+
+
+def read_roster_file(path):
+    """Reads BattleTags from a text file, one per line; blank lines are skipped."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refetch the cached data of players older than a max age and report what changed.")
+    parser.add_argument("battletags", nargs="*", help="Players to refresh (default: team_config's two rosters)")
+    parser.add_argument("--roster-file", action="append", default=[], help="File with one BattleTag per line, repeatable")
+    parser.add_argument("--max-age-hours", type=float, help=f"Refresh players older than this (default: HEROES_PROFILE_PLAYER_MAX_AGE_HOURS or {DEFAULT_MAX_AGE_HOURS})")
+    parser.add_argument("--force", action="store_true", help="Refresh every player regardless of age")
+    parser.add_argument("--workers", type=int, help="Concurrent requests (default: the HTTP client's limit)")
+    args = parser.parse_args(argv)
+
+    battle_tags = list(args.battletags)
+    for path in args.roster_file:
+        battle_tags += read_roster_file(path)
+    if not battle_tags:
+        team_config = utils.config_module("team_config")
+        battle_tags = list(team_config.team_1_tags) + list(team_config.team_2_tags)
+
+    max_age = args.max_age_hours * 3600 if args.max_age_hours is not None else None
+    results = refresh_players(battle_tags, max_age, args.force, max_workers=args.workers)
+    print(format_report(results))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+import numpy as np
+
+import instrumentation
+
+MIDDLE_PICK_ORDER = 8
+LATE_PICK_ORDER = 14
+DEFAULT_POOL_MMR_THRESHOLD = 2700
+MATCHUP_CACHE_SIZE = 4096
+
+
+def unpack_bitset(bits, size):
+    """Returns a boolean vector of length `size` with bit i of the int `bits` at position i."""
+    packed = np.frombuffer(bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(packed, bitorder="little")[:size].astype(bool)
+
+
+def round_2(values):
+    """Rounds an array to 2 decimals with the same results as Python's round(value, 2)."""
+    scaled = values * 100
+    rounded = np.rint(scaled) / 100
+    # ✅ Near .5 the product may have been rounded across the tie, those few go through round() itself
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(value, 2) for value in values[ties].tolist()]
+    return rounded
+
+
+class ScoringEngine:
+    """
+    Dense-array view of the static draft data.
+
+    Built once per draft from DRAFT_DATA. Holds a hero×hero ally matrix, a hero×hero enemy matrix,
+    a map×hero bonus table and per team a player×hero MMR matrix and its map×player×hero base
+    scores, so a whole pick or ban suggestion round is a handful of masked array operations instead
+    of nested dict walks, on any map of the patch.
+    """
+
+    def __init__(self, DRAFT_DATA):
+        hero_matchup_data = DRAFT_DATA["hero_matchup_data"]
+        hero_roles = DRAFT_DATA["hero_roles"]
+
+        heroes = set(hero_roles) | set(DRAFT_DATA["available_heroes"]) | set(DRAFT_DATA["picked_heroes"])
+        heroes |= set(DRAFT_DATA["banned_heroes"]) | set(DRAFT_DATA["forbidden_heroes"])
+        # ✅ Snapshot-backed matchup data already comes as dense arrays, a lazy store is read on first need
+        dense_matrices = hero_matchup_data.dense_matrices() if hasattr(hero_matchup_data, "dense_matrices") else None
+        lazy_matchups = dense_matrices is None and hasattr(hero_matchup_data, "rows_for")
+        if dense_matrices is not None:
+            heroes.update(dense_matrices[0])
+        elif lazy_matchups:
+            heroes.update(hero_matchup_data.heroes)
+        else:
+            for hero, matchups in hero_matchup_data.items():
+                heroes.add(hero)
+                heroes.update(matchups)
+        pool_heroes = set()
+        for side in ("team_1", "team_2"):
+            for player_data in DRAFT_DATA[f"{side}_player_mmr_data"].values():
+                pool_heroes.update((player_data or {}).get("Storm League", {}))
+        heroes |= pool_heroes
+
+        self.heroes = sorted(heroes)
+        self.hero_index = {hero: idx for idx, hero in enumerate(self.heroes)}
+        num_heroes = len(self.heroes)
+
+        # ✅ Matchup win rates are parsed once here instead of on every score
+        self.ally_matrix = np.zeros((num_heroes, num_heroes))
+        self.enemy_matrix = np.zeros((num_heroes, num_heroes))
+        if dense_matrices is not None:
+            matrix_heroes, ally_matrix, enemy_matrix = dense_matrices
+            positions = [self.hero_index[hero] for hero in matrix_heroes]
+            self.ally_matrix[np.ix_(positions, positions)] = ally_matrix
+            self.enemy_matrix[np.ix_(positions, positions)] = enemy_matrix
+        elif not lazy_matchups:
+            self._fill_matchups(hero_matchup_data.items())
+
+        # ✅ Row i is what picking hero i adds to every candidate's synergy/counter, stored contiguously
+        self.ally_rows = np.ascontiguousarray(self.ally_matrix.T)
+        self.enemy_rows = np.ascontiguousarray(self.enemy_matrix.T)
+        self._matchup_totals = {}
+        # Scores only read the matchup rows of heroes a player can pick or ban, and only once something is picked
+        self._lazy_matchups = hero_matchup_data if lazy_matchups else None
+        self._matchup_heroes = sorted(pool_heroes - set(DRAFT_DATA["forbidden_heroes"]))
+
+        # ✅ Pick role as used by the drafting rules (Bruiser counts as Offlaner)
+        self.roles = []
+        role_codes = []
+        for hero in self.heroes:
+            role_list = hero_roles.get(hero, ["Unknown"])
+            role = "Offlaner" if "Bruiser" in role_list else role_list[0]
+            if role not in self.roles:
+                self.roles.append(role)
+            role_codes.append(self.roles.index(role))
+        self.role_codes = np.array(role_codes, dtype=np.int16)
+
+        # ✅ Timing restrictions from role and hero config folded into two boolean vectors
+        self.needs_middle = np.zeros(num_heroes, dtype=bool)
+        self.needs_late = np.zeros(num_heroes, dtype=bool)
+        for role, restriction in DRAFT_DATA.get("role_pick_restrictions", {}).items():
+            if role in self.roles:
+                self._restriction_vector(restriction)[self.role_codes == self.roles.index(role)] = True
+        for hero, restriction in DRAFT_DATA.get("hero_pick_restrictions", {}).items():
+            if hero in self.hero_index:
+                self._restriction_vector(restriction)[self.hero_index[hero]] = True
+
+        self.forbidden_mask = self.mask_of(DRAFT_DATA["forbidden_heroes"])
+
+        self.teams = {side: _TeamTables(self, DRAFT_DATA[f"{side}_player_mmr_data"]) for side in ("team_1", "team_2")}
+
+        # ✅ Every map of the patch is tabulated up front, so a draft on another map only swaps table rows
+        self.hero_winrates_by_map = DRAFT_DATA["hero_winrates_by_map"]
+        self.map_names = []
+        self.map_index = {}
+        self.map_bonus_table = np.zeros((0, num_heroes))
+        self.map_rankings = {}
+        self.precompute_maps(self.hero_winrates_by_map)
+
+    def _fill_matchups(self, matchup_rows):
+        """Writes (hero, {other_hero: matchup}) rows into the ally and enemy matrices."""
+        for hero, matchups in matchup_rows:
+            row = self.hero_index[hero]
+            for other_hero, matchup in matchups.items():
+                col = self.hero_index.get(other_hero)
+                if col is None:
+                    continue
+                self.ally_matrix[row, col] = float(matchup.get("ally", {}).get("win_rate_as_ally", 50)) - 50
+                self.enemy_matrix[row, col] = float(matchup.get("enemy", {}).get("win_rate_against", 50)) - 50
+
+    def _load_lazy_matchups(self):
+        """Fills the matchup matrices from a lazy store, waiting only for the rows of heroes a player can pick or ban."""
+        store, self._lazy_matchups = self._lazy_matchups, None
+        with instrumentation.span("matchup_load"):
+            self._fill_matchups(store.rows_for(self._matchup_heroes))
+        self.ally_rows = np.ascontiguousarray(self.ally_matrix.T)
+        self.enemy_rows = np.ascontiguousarray(self.enemy_matrix.T)
+        self._matchup_totals.clear()
+
+    def _restriction_vector(self, restriction):
+        if restriction == "middle":
+            return self.needs_middle
+        if restriction == "late":
+            return self.needs_late
+        return np.zeros(len(self.heroes), dtype=bool)
+
+    def mask_of(self, heroes):
+        """Returns a boolean hero vector that is True for every hero in `heroes`."""
+        mask = np.zeros(len(self.heroes), dtype=bool)
+        mask[[self.hero_index[hero] for hero in heroes if hero in self.hero_index]] = True
+        return mask
+
+    def hero_mask(self, DRAFT_DATA, key):
+        """Returns the mask of a hero-set key of DRAFT_DATA, straight from the bitset when it is a DraftState."""
+        if getattr(DRAFT_DATA, "scoring_engine", None) is self:
+            return unpack_bitset(DRAFT_DATA.bitset(key), len(self.heroes))
+        heroes = DRAFT_DATA[key]
+        return self.mask_of(heroes.values() if isinstance(heroes, dict) else heroes)
+
+    def precompute_maps(self, map_names):
+        """
+        Tabulates `map_names` in one pass: a row of rounded map bonuses per map, the heroes ranked by
+        map bonus, and each team's player×hero base score (MMR + map bonus * 50) per map.
+        """
+        new_maps = [map_name for map_name in dict.fromkeys(map_names) if map_name not in self.map_index]
+        if not new_maps:
+            return
+
+        win_rates = []
+        for map_name in new_maps:
+            map_winrates = self.hero_winrates_by_map.get(map_name) or {}
+            win_rates.append([map_winrates[hero].get("win_rate", 50) if hero in map_winrates else 50 for hero in self.heroes])
+        rows = round_2(np.array(win_rates, dtype=float).reshape(len(new_maps), len(self.heroes)) - 50)
+        for map_name, row in zip(new_maps, rows):
+            self.map_index[map_name] = len(self.map_names)
+            self.map_names.append(map_name)
+            self.map_rankings[map_name] = np.argsort(-row, kind="stable")
+        self.map_bonus_table = np.concatenate([self.map_bonus_table, rows])
+
+        for tables in self.teams.values():
+            tables.map_scores = np.concatenate([tables.map_scores, tables.score_mmr[np.newaxis] + (rows[:, np.newaxis] * 50)])
+
+    def map_bonus(self, map_name):
+        """Returns the rounded map win rate bonus vector for `map_name` (maps outside the patch data get no bonus)."""
+        if map_name not in self.map_index:
+            self.precompute_maps([map_name])
+        return self.map_bonus_table[self.map_index[map_name]]
+
+    def base_scores(self, side, map_name):
+        """Returns the player×hero MMR + map bonus * 50 table of "team_1" or "team_2" on `map_name`."""
+        if map_name not in self.map_index:
+            self.precompute_maps([map_name])
+        return self.teams[side].map_scores[self.map_index[map_name]]
+
+    def roster_strengths(self, side, players=None):
+        """
+        Returns, per map in `map_names` order, the sum over `players` (default: the whole team) of
+        each player's best base score, ignoring forbidden heroes and hero overlap between players.
+        """
+        tables = self.teams[side]
+        rows = [tables.player_index[player] for player in (tables.players if players is None else players) if player in tables.player_index]
+        valid = tables.played[rows] & ~self.forbidden_mask
+        best = np.where(valid, tables.map_scores[:, rows], -np.inf).max(axis=2, initial=-np.inf)
+        return np.where(np.isfinite(best), best, 0.0).sum(axis=1)
+
+    def matchup_totals(self, rows, picked_heroes):
+        """
+        Returns the running (total, rounded) synergy or counter vectors for heroes picked in this order.
+
+        `rows` is `ally_rows` or `enemy_rows`. Totals are memoized per pick sequence and each one is
+        built from the sequence without its last pick, so a new pick adds a single row, sums stay in
+        pick order like the dict-based scores, and later lookups (including bans) are free.
+        """
+        picked = tuple(hero for hero in picked_heroes if hero in self.hero_index)
+        if picked and self._lazy_matchups is not None:
+            is_ally = rows is self.ally_rows
+            self._load_lazy_matchups()
+            rows = self.ally_rows if is_ally else self.enemy_rows
+        key = (rows is self.ally_rows, picked)
+        entry = self._matchup_totals.get(key)
+        if entry is None:
+            if picked:
+                total = self.matchup_totals(rows, picked[:-1])[0] + rows[self.hero_index[picked[-1]]]
+            else:
+                total = np.zeros(len(self.heroes))
+            entry = (total, np.array([round(value, 2) for value in total.tolist()]))
+
+            if len(self._matchup_totals) >= MATCHUP_CACHE_SIZE:
+                del self._matchup_totals[next(iter(self._matchup_totals))]
+            self._matchup_totals[key] = entry
+        return entry
+
+    def hero_scores(self, DRAFT_DATA, team_name):
+        """Returns the per-hero map bonus, synergy and counter vectors for `team_name`."""
+        if team_name == DRAFT_DATA["team_1_name"]:
+            ally_picked_heroes, enemy_picked_heroes = DRAFT_DATA["team_1_picked_heroes"], DRAFT_DATA["team_2_picked_heroes"]
+        else:
+            ally_picked_heroes, enemy_picked_heroes = DRAFT_DATA["team_2_picked_heroes"], DRAFT_DATA["team_1_picked_heroes"]
+
+        with instrumentation.span("map_bonus"):
+            map_bonus = self.map_bonus(DRAFT_DATA["map_name"])
+        with instrumentation.span("synergy"):
+            synergy = self.matchup_totals(self.ally_rows, ally_picked_heroes.values())[1]
+        with instrumentation.span("counter"):
+            counter = self.matchup_totals(self.enemy_rows, enemy_picked_heroes.values())[1]
+        return map_bonus, synergy, counter
+
+    def pick_suggestions(self, DRAFT_DATA, team_name, order, num_suggestions=1, contenders=None):
+        """
+        Vectorized equivalent of `pick.select_best_pick_with_reason`.
+
+        A `contenders` dict is filled with {hero: player} for the best and second-best hero of every
+        player: the only heroes whose removal (e.g. by a ban) can change the result.
+        """
+        side = "team_1" if team_name == DRAFT_DATA["team_1_name"] else "team_2"
+        tables = self.teams[side]
+
+        required_roles = DRAFT_DATA["required_roles"]
+        already_picked = len(DRAFT_DATA[f"{side}_picked_heroes"])
+        remaining_picks = 5 - already_picked
+        role_counts = DRAFT_DATA["team_roles"][team_name]
+        missing_roles = {r for r in required_roles if role_counts.get(r, 0) == 0}
+
+        # ✅ Availability, role limits, timing and role enforcement as one boolean vector
+        hero_mask = self.hero_mask(DRAFT_DATA, "available_heroes") & ~self.forbidden_mask
+        hero_mask &= ~self.hero_mask(DRAFT_DATA, "picked_heroes") & ~self.hero_mask(DRAFT_DATA, "banned_heroes")
+
+        for role, limit in DRAFT_DATA.get("role_limits", {}).items():
+            if role in self.roles and role_counts.get(role, 0) >= limit:
+                hero_mask &= self.role_codes != self.roles.index(role)
+
+        if order < MIDDLE_PICK_ORDER:
+            hero_mask &= ~self.needs_middle
+        if order < LATE_PICK_ORDER:
+            hero_mask &= ~self.needs_late
+
+        if remaining_picks == len(missing_roles):
+            hero_mask &= np.isin(self.role_codes, [self.roles.index(r) for r in missing_roles if r in self.roles])
+
+        available_players = DRAFT_DATA[f"available_players_{side}"]
+        with instrumentation.span("pool_sizes"):
+            player_hero_pool_sizes = tables.pool_sizes(available_players, DEFAULT_POOL_MMR_THRESHOLD)
+        max_pool_size = max(player_hero_pool_sizes.values(), default=1)
+
+        map_bonus, synergy, counter = self.hero_scores(DRAFT_DATA, team_name)
+        rows = [tables.player_index[player] for player in available_players if player in tables.player_index]
+        with instrumentation.span("sorting"):
+            ranked, scores, valid = tables.rank(rows, hero_mask, self.base_scores(side, DRAFT_DATA["map_name"]), synergy, counter)
+
+        candidates = []
+        for row_pos, row in enumerate(rows):
+            if not valid[row_pos, 0]:
+                continue
+            player = tables.players[row]
+            if contenders is not None:
+                for position in (0, 1):
+                    if valid[row_pos, position]:
+                        contenders.setdefault(self.heroes[ranked[row_pos, position]], player)
+            best_hero_idx = ranked[row_pos, 0]
+            best_score = scores[row_pos, best_hero_idx].item()
+            second_best_score = scores[row_pos, ranked[row_pos, 1]].item() if valid[row_pos, 1] else 2000
+
+            best_hero = self.heroes[best_hero_idx]
+            best_role = self.roles[self.role_codes[best_hero_idx]]
+            hero_mmr = tables.score_mmr[row, best_hero_idx].item()
+
+            hero_pool_size = player_hero_pool_sizes.get(player, 0)
+            pool_boost = (1 - (hero_pool_size / max_pool_size)) * 500
+            score_drop = best_score - second_best_score + pool_boost
+
+            reason = f"Score: {best_score:.2f}, Score Drop: {score_drop:.2f}, MMR {hero_mmr:.2f}, Map Bonus {map_bonus[best_hero_idx].item():+.2f}%, Synergy {synergy[best_hero_idx].item():+.2f}, Counter {counter[best_hero_idx].item():+.2f}, Pool Boost: {pool_boost:.2f}, Role: {best_role}"
+            candidates.append((score_drop, best_score, player, best_hero, best_role, reason))
+
+        if not candidates:
+            raise ValueError(f"❌ ERROR: No valid picks available for {team_name}. Check available heroes and players.")
+
+        with instrumentation.span("sorting"):
+            candidates.sort(reverse=True, key=lambda x: (x[0], x[1]))
+        return candidates[:num_suggestions]
+
+    def ban_suggestions(self, DRAFT_DATA, team_name, num_suggestions=1):
+        """Vectorized equivalent of `ban.get_ban_suggestions`."""
+        enemy_side = "team_2" if team_name == DRAFT_DATA["team_1_name"] else "team_1"
+        tables = self.teams[enemy_side]
+
+        hero_mask = self.hero_mask(DRAFT_DATA, "available_heroes")
+        hero_mask &= ~self.hero_mask(DRAFT_DATA, f"{enemy_side}_picked_heroes") & ~self.hero_mask(DRAFT_DATA, "banned_heroes")
+
+        available_players = DRAFT_DATA[f"available_players_{enemy_side}"]
+        with instrumentation.span("pool_sizes"):
+            player_hero_pool_sizes = tables.pool_sizes(available_players, DEFAULT_POOL_MMR_THRESHOLD)
+        max_pool_size = max(player_hero_pool_sizes.values(), default=1)
+
+        # ✅ Synergy and counter are taken from the banning team's point of view, as in the dict-based version
+        map_bonus, synergy, counter = self.hero_scores(DRAFT_DATA, team_name)
+        rows = [row for row, player in enumerate(tables.players) if player in available_players]
+        with instrumentation.span("sorting"):
+            ranked, scores, valid = tables.rank(rows, hero_mask, self.base_scores(enemy_side, DRAFT_DATA["map_name"]), synergy, counter)
+
+        candidates = []
+        for row_pos, row in enumerate(rows):
+            if not valid[row_pos, 0]:
+                continue
+            player = tables.players[row]
+            hero_idx = ranked[row_pos, 0]
+            score = scores[row_pos, hero_idx].item()
+            has_next = valid[row_pos, 1]
+            second_best_score = scores[row_pos, ranked[row_pos, 1]].item() if has_next else 2000
+            next_hero = self.heroes[ranked[row_pos, 1]] if has_next else None
+
+            hero_mmr = tables.score_mmr[row, hero_idx].item()
+            map_bonus_value = map_bonus[hero_idx].item()
+            synergy_score = synergy[hero_idx].item()
+            counter_score = counter[hero_idx].item()
+
+            hero_pool_size = player_hero_pool_sizes.get(player, 0)
+            pool_boost = (1 - (hero_pool_size / max_pool_size)) * 200
+            score_drop = score - second_best_score + pool_boost
+
+            reason = f"Score: {score:.2f}, Score Drop: {score_drop:.2f}, MMR {hero_mmr:.2f}, Map Bonus {map_bonus_value:+.2f}%, Synergy {synergy_score:+.2f}, Counter {counter_score:+.2f}, Pool Boost: {pool_boost:.2f}, Next option for {player}: {next_hero}"
+            candidates.append((score, score_drop, self.heroes[hero_idx], player, hero_mmr, map_bonus_value, synergy_score, counter_score, reason))
+
+        with instrumentation.span("sorting"):
+            candidates.sort(reverse=True, key=lambda x: x[1])
+        return candidates[:num_suggestions]
+
+
+class _TeamTables:
+    """Player×hero MMR tables for one team."""
+
+    def __init__(self, engine, team_mmr_data):
+        self.players = list(team_mmr_data)
+        self.player_index = {player: idx for idx, player in enumerate(self.players)}
+        shape = (len(self.players), len(engine.heroes))
+
+        self.score_mmr = np.zeros(shape)
+        self.raw_mmr = np.zeros(shape)
+        self.played = np.zeros(shape, dtype=bool)
+        # ✅ Position of each hero in the player's API data, used to break score ties the same way a stable sort does
+        self.rank_in_pool = np.full(shape, np.iinfo(np.int32).max, dtype=np.int32)
+        # ✅ Base scores per map, filled in by ScoringEngine.precompute_maps
+        self.map_scores = np.zeros((0,) + shape)
+
+        for row, player in enumerate(self.players):
+            for position, (hero, stats) in enumerate((team_mmr_data[player] or {}).get("Storm League", {}).items()):
+                col = engine.hero_index[hero]
+                self.score_mmr[row, col] = round(stats.get("mmr", 2000), 2)
+                self.raw_mmr[row, col] = stats.get("mmr", 2000)
+                self.played[row, col] = True
+                self.rank_in_pool[row, col] = position
+
+    def pool_sizes(self, available_players, mmr_threshold):
+        """Vectorized equivalent of `utils.get_hero_player_pool_sizes`."""
+        counts = ((self.raw_mmr > mmr_threshold) & self.played).sum(axis=1)
+        return {player: int(counts[self.player_index[player]]) if player in self.player_index else 0 for player in available_players}
+
+    def rank(self, rows, hero_mask, base_scores, synergy, counter):
+        """Scores every (player, hero) pair for `rows` from the map's base scores and returns the top two hero indices per player."""
+        scores = base_scores[rows] + (synergy * 25) + (counter * 25)
+        valid = self.played[rows] & hero_mask
+        ordering = np.lexsort((self.rank_in_pool[rows], np.where(valid, -scores, np.inf)), axis=-1)[:, :2]
+        if ordering.shape[1] < 2:
+            ordering = np.pad(ordering, ((0, 0), (0, 2 - ordering.shape[1])))
+        return ordering, scores, np.take_along_axis(valid, ordering, axis=1)
@@ -0,0 +1,286 @@
+import math
+import threading
+import time
+
+import ban
+import draft_state
+import pick
+
+DEFAULT_TIME_LIMIT = 2.0
+DEFAULT_BRANCHING = 5
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+_process_pools = {}
+_process_pools_lock = threading.Lock()
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the wall-clock budget is spent."""
+
+
+class AlphaBetaSearch:
+    """
+    Two-player alpha-beta search over the remaining draft slots.
+
+    Values are from the point of view of the team on the clock at the root: each pick adds its greedy
+    score for that team and subtracts it for the other, bans only act through the picks they deny.
+    Candidate moves and their ordering come from the greedy pick/ban suggestions. The search runs
+    on its own DraftState, so the caller's DRAFT_DATA is never modified.
+    """
+
+    def __init__(self, DRAFT_DATA, slots, time_limit=DEFAULT_TIME_LIMIT, branching=DEFAULT_BRANCHING):
+        self.DRAFT_DATA = as_draft_state(DRAFT_DATA)
+        self.slots = slots
+        self.time_limit = time_limit
+        self.branching = branching
+        self.root_team = slots[0][2]
+        self.transpositions = {}
+        self.horizon_cache = {}
+        self.undo_tokens = []
+        self.deadline = None
+        self.nodes = 0
+
+    def run(self, num_suggestions=DEFAULT_BRANCHING):
+        """Runs iterative deepening until the time limit and returns the root suggestions ranked by search value."""
+        self.deadline = time.perf_counter() + self.time_limit
+        root_moves = self._moves(0)
+        if not root_moves:
+            return []
+
+        ranked = [(move, value, suggestion, None) for move, value, suggestion in root_moves]
+        depth_reached = 0
+
+        for depth in range(1, len(self.slots) + 1):
+            try:
+                iteration = []
+                for move, value, suggestion, _ in ranked:
+                    self._apply(move)
+                    try:
+                        child_value = self._search(1, depth - 1, -math.inf, math.inf)
+                    finally:
+                        self._undo(move)
+                    iteration.append((move, value, suggestion, value + child_value))
+            except _SearchTimeout:
+                break
+
+            # ✅ Best line of the last finished iteration seeds the move order of the next one
+            ranked = sorted(iteration, key=lambda x: x[3], reverse=True)
+            depth_reached = depth
+
+        if depth_reached == 0:
+            return [suggestion for _, _, suggestion, _ in ranked[:num_suggestions]]
+
+        return [
+            suggestion[:-1] + (f"{suggestion[-1]}, Search Value: {search_value:+.2f} (depth {depth_reached}, {self.nodes} nodes)",)
+            for _, _, suggestion, search_value in ranked[:num_suggestions]
+        ]
+
+    def _search(self, index, depth, alpha, beta):
+        if time.perf_counter() > self.deadline:
+            raise _SearchTimeout()
+        self.nodes += 1
+
+        if index >= len(self.slots):
+            return 0.0
+        if depth == 0:
+            return self._horizon(index)
+
+        key = (index, self._state_key())
+        entry = self.transpositions.get(key)
+        best_move_key = None
+        if entry is not None:
+            entry_depth, entry_value, entry_flag, best_move_key = entry
+            if entry_depth >= depth:
+                if entry_flag == EXACT:
+                    return entry_value
+                if entry_flag == LOWER_BOUND and entry_value >= beta:
+                    return entry_value
+                if entry_flag == UPPER_BOUND and entry_value <= alpha:
+                    return entry_value
+
+        moves = self._moves(index)
+        if not moves:
+            # ✅ Nothing to ban or pick for this team, the slot is skipped
+            return self._search(index + 1, depth, alpha, beta)
+
+        if best_move_key is not None:
+            moves.sort(key=lambda m: m[0] != best_move_key)
+
+        maximizing = self.slots[index][2] == self.root_team
+        original_alpha, original_beta = alpha, beta
+        best_value = -math.inf if maximizing else math.inf
+        best_move = None
+
+        for move, value, _ in moves:
+            signed_value = value if maximizing else -value
+            self._apply(move)
+            try:
+                child_value = signed_value + self._search(index + 1, depth - 1, alpha - signed_value, beta - signed_value)
+            finally:
+                self._undo(move)
+
+            if maximizing:
+                if child_value > best_value:
+                    best_value, best_move = child_value, move
+                alpha = max(alpha, best_value)
+            else:
+                if child_value < best_value:
+                    best_value, best_move = child_value, move
+                beta = min(beta, best_value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.transpositions[key] = (depth, best_value, flag, best_move)
+        return best_value
+
+    def _moves(self, index):
+        return candidate_moves(self.DRAFT_DATA, self.slots[index], self.branching)
+
+    def _horizon(self, index):
+        """Estimates the rest of the draft by the next greedy pick of each team."""
+        key = (index, self._state_key())
+        if key in self.horizon_cache:
+            return self.horizon_cache[key]
+
+        estimate = 0.0
+        seen_teams = set()
+        for draft_type, order, team_name in self.slots[index:]:
+            if draft_type != "Pick" or team_name in seen_teams:
+                continue
+            seen_teams.add(team_name)
+            try:
+                best_score = pick.select_best_pick_with_reason(self.DRAFT_DATA, team_name, order)[0][1]
+            except ValueError:
+                continue
+            estimate += best_score if team_name == self.root_team else -best_score
+
+        self.horizon_cache[key] = estimate
+        return estimate
+
+    def _state_key(self):
+        return state_key(self.DRAFT_DATA)
+
+    def _apply(self, move):
+        self.undo_tokens.append(apply_move(self.DRAFT_DATA, move))
+
+    def _undo(self, move):
+        undo_move(self.DRAFT_DATA, move, self.undo_tokens.pop())
+
+
+def candidate_moves(DRAFT_DATA, slot, branching=DEFAULT_BRANCHING):
+    """Returns (move, value, suggestion) tuples for a (draft_type, order, team_name) slot, in greedy order."""
+    draft_type, order, team_name = slot
+    moves = []
+
+    if draft_type == "Ban":
+        seen = set()
+        for suggestion in ban.get_ban_suggestions(DRAFT_DATA, team_name, num_suggestions=branching):
+            hero = suggestion[2]
+            if hero not in seen:
+                seen.add(hero)
+                moves.append((("Ban", team_name, hero, None, None), 0.0, suggestion))
+    else:
+        try:
+            suggestions = pick.select_best_pick_with_reason(DRAFT_DATA, team_name, order, num_suggestions=branching)
+        except ValueError:
+            suggestions = []
+        for suggestion in suggestions:
+            _, best_score, player, hero, role, _ = suggestion
+            moves.append((("Pick", team_name, hero, player, role), best_score, suggestion))
+
+    return moves
+
+
+def as_draft_state(DRAFT_DATA):
+    """Returns DRAFT_DATA as a DraftState, converting a DRAFT_DATA dict into a new one."""
+    if isinstance(DRAFT_DATA, draft_state.DraftState):
+        return DRAFT_DATA
+    return draft_state.DraftState.from_draft_data(DRAFT_DATA)
+
+
+def state_key(DRAFT_DATA):
+    """Returns a hashable key of the picks and bans made so far."""
+    if isinstance(DRAFT_DATA, draft_state.DraftState):
+        return DRAFT_DATA.hash
+    return (
+        frozenset(DRAFT_DATA["team_1_picked_heroes"].items()),
+        frozenset(DRAFT_DATA["team_2_picked_heroes"].items()),
+        frozenset(DRAFT_DATA["banned_heroes"])
+    )
+
+
+def apply_move(DRAFT_DATA, move):
+    """Applies a search move to DRAFT_DATA in place and returns the token `undo_move` needs."""
+    if isinstance(DRAFT_DATA, draft_state.DraftState):
+        DRAFT_DATA.apply(move)
+        return None
+
+    draft_type, team_name, hero, player, role = move
+    DRAFT_DATA["available_heroes"].remove(hero)
+
+    if draft_type == "Ban":
+        DRAFT_DATA["banned_heroes"].add(hero)
+        return None
+
+    side = "team_1" if team_name == DRAFT_DATA["team_1_name"] else "team_2"
+    roster = DRAFT_DATA[f"available_players_{side}"]
+    position = roster.index(player)
+    del roster[position]
+    DRAFT_DATA["picked_heroes"].add(hero)
+    DRAFT_DATA[f"{side}_picked_heroes"][player] = hero
+    if role in DRAFT_DATA["required_roles"]:
+        DRAFT_DATA["team_roles"][team_name][role] += 1
+    return position
+
+
+def undo_move(DRAFT_DATA, move, token):
+    """Reverts `apply_move`."""
+    if isinstance(DRAFT_DATA, draft_state.DraftState):
+        DRAFT_DATA.undo()
+        return
+
+    draft_type, team_name, hero, player, role = move
+    DRAFT_DATA["available_heroes"].add(hero)
+
+    if draft_type == "Ban":
+        DRAFT_DATA["banned_heroes"].remove(hero)
+        return
+
+    side = "team_1" if team_name == DRAFT_DATA["team_1_name"] else "team_2"
+    # ✅ Restore the player at their roster position so iteration order stays the same
+    DRAFT_DATA[f"available_players_{side}"].insert(token, player)
+    DRAFT_DATA["picked_heroes"].remove(hero)
+    del DRAFT_DATA[f"{side}_picked_heroes"][player]
+    if role in DRAFT_DATA["required_roles"]:
+        DRAFT_DATA["team_roles"][team_name][role] -= 1
+
+
+def search_suggestions(DRAFT_DATA, slots, time_limit=DEFAULT_TIME_LIMIT, num_suggestions=DEFAULT_BRANCHING):
+    """
+    Returns suggestions for the first of `slots`, ranked by an alpha-beta lookahead over all of them.
+
+    `slots` is the remaining draft order as (draft_type, order, team_name) tuples. The returned tuples
+    have the same shape as the greedy pick/ban suggestions, with the search value added to the reason.
+    """
+    search = AlphaBetaSearch(DRAFT_DATA, slots, time_limit)
+    return search.run(num_suggestions)
+
+
+def process_pool(max_workers):
+    """
+    Returns the process pool of `max_workers` workers shared by the parallel backends, reused across
+    draft slots. Pools of another size are kept rather than shut down, since another thread may
+    still be submitting to them.
+    """
+    with _process_pools_lock:
+        if max_workers not in _process_pools:
+            from concurrent.futures import ProcessPoolExecutor  # ✅ multiprocessing is only imported once a pool is needed
+            _process_pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+        return _process_pools[max_workers]
@@ -0,0 +1,173 @@
+import argparse
+import contextlib
+import json
+import os
+import time
+
+import load_data
+import utils
+import draft
+import instrumentation
+import search
+
+# Per-process cache of loaded (patch_data, team_data, scoring_engine), keyed by timeframe
+_loaded = {}
+
+
+def simulate_draft(draft_data, first_pick_team=1, backend="greedy", time_limit=search.DEFAULT_TIME_LIMIT):
+    """Runs one fully automated draft on an initialized DRAFT_DATA without printing and returns its result row."""
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        decision_times = draft.execute_draft_phase(draft_data, False, backend, time_limit, first_pick_team)
+
+    engine = draft_data["scoring_engine"]
+    bans, picks = [], []
+    for entry in draft_data["draft_log"]:
+        if entry[1] == "Ban":
+            order, _, team_name, hero, score, _ = entry
+            bans.append([order, team_name, hero, round(score, 2)])
+        else:
+            order, _, team_name, player, hero, score, _ = entry
+            role = engine.roles[engine.role_codes[engine.hero_index[hero]]]
+            picks.append([order, team_name, player, hero, role, round(score, 2)])
+
+    row = {
+        "map": draft_data["map_name"],
+        "first_pick_team": first_pick_team,
+        "backend": backend,
+        "bans": bans,
+        "picks": picks,
+        "role_coverage": draft_data["team_roles"],
+        "missing_roles": {
+            team_name: sorted(role for role, count in role_counts.items() if count == 0)
+            for team_name, role_counts in draft_data["team_roles"].items()
+        },
+        "decision_times": {order: round(seconds, 4) for order, seconds in decision_times.items()},
+        "draft_time": round(time.perf_counter() - start, 4),
+    }
+    if "step_timings" in draft_data:
+        row["step_timings"] = draft_data["step_timings"]
+    return row
+
+
+def _load(timeframe_type, timeframe, use_snapshot):
+    """Loads the patch and team data for a timeframe once per process."""
+    team_config = utils.config_module("team_config")
+
+    key = (timeframe_type, timeframe)
+    if key not in _loaded:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            team_data = load_data.load_team_data(team_config.team_1_tags, team_config.team_2_tags)
+            patch_data = load_data.load_patch_data(timeframe_type, timeframe, use_snapshot=use_snapshot)
+        _loaded[key] = [patch_data, team_data, None]
+    return _loaded[key]
+
+
+def run_job(job):
+    """Process pool entry point: initializes and simulates the draft described by `job`, never raising."""
+    team_config = utils.config_module("team_config")
+
+    row = {"timeframe_type": job["timeframe_type"], "timeframe": job["timeframe"], "repeat": job["repeat"]}
+    if job.get("profile"):
+        # ✅ Allocation tracing would distort the decision times of every draft in this worker
+        instrumentation.enable(allocations=False)
+    try:
+        loaded = _load(job["timeframe_type"], job["timeframe"], job["use_snapshot"])
+        patch_data, team_data, scoring_engine = loaded
+        draft_data = load_data.initialize_draft(
+            patch_data, team_data, job["map_name"], team_config.team_1_name, team_config.team_2_name, scoring_engine
+        )
+        # ✅ The engine doesn't depend on the map, later drafts of this timeframe reuse it
+        loaded[2] = draft_data["scoring_engine"]
+        row.update(simulate_draft(draft_data, job["first_pick_team"], job["backend"], job["time_limit"]))
+    except Exception as e:
+        row.update({"map": job["map_name"], "first_pick_team": job["first_pick_team"], "backend": job["backend"], "error": f"{type(e).__name__}: {e}"})
+    return row
+
+
+def build_jobs(timeframes, maps_by_timeframe, first_pick_teams, backend, time_limit, repeat, use_snapshot, profile=False):
+    return [
+        {
+            "timeframe_type": timeframe_type, "timeframe": timeframe, "map_name": map_name,
+            "first_pick_team": first_pick_team, "backend": backend, "time_limit": time_limit,
+            "repeat": repetition, "use_snapshot": use_snapshot, "profile": profile,
+        }
+        for timeframe_type, timeframe in timeframes
+        for map_name in maps_by_timeframe[(timeframe_type, timeframe)]
+        for first_pick_team in first_pick_teams
+        for repetition in range(repeat)
+    ]
+
+
+def run_simulations(jobs, output_path, max_workers=None):
+    """Runs `jobs` across a process pool, appending one JSON line per draft to `output_path`. Returns a summary."""
+    from concurrent.futures import ProcessPoolExecutor  # ✅ multiprocessing is only imported when simulations run
+    max_workers = max_workers or os.cpu_count() or 1
+    completed = errors = 0
+    decision_time_total = decisions = 0.0
+    start = time.perf_counter()
+
+    with open(output_path, "a") as f, ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for row in executor.map(run_job, jobs, chunksize=max(1, len(jobs) // (max_workers * 8))):
+            f.write(json.dumps(row, separators=(",", ":")) + "\n")
+            completed += 1
+            if "error" in row:
+                errors += 1
+            else:
+                decision_time_total += sum(row["decision_times"].values())
+                decisions += len(row["decision_times"])
+            if completed % 100 == 0:
+                print(f"{completed}/{len(jobs)} drafts simulated")
+
+    return {
+        "drafts": completed,
+        "errors": errors,
+        "mean_decision_time": decision_time_total / decisions if decisions else 0.0,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def parse_timeframe(value):
+    timeframe_type, _, timeframe = value.partition(":")
+    if not timeframe:
+        raise argparse.ArgumentTypeError(f"expected TYPE:TIMEFRAME, e.g. major:2.55, got '{value}'")
+    return timeframe_type, timeframe
+
+
+def main(argv=None):
+    team_config = utils.config_module("team_config")
+
+    parser = argparse.ArgumentParser(description="Run fully automated mock drafts in parallel and write one JSON line per draft.")
+    parser.add_argument("--timeframe", action="append", type=parse_timeframe, help="TYPE:TIMEFRAME, repeatable (default: major:2.55)")
+    parser.add_argument("--maps", nargs="+", help="Maps to draft on (default: every map in the patch data)")
+    parser.add_argument("--first-pick", nargs="+", type=int, choices=[1, 2], default=[1, 2], help="First pick teams to simulate")
+    parser.add_argument("--backend", choices=sorted(draft.SUGGESTION_BACKENDS), default="greedy")
+    parser.add_argument("--time-limit", type=float, default=search.DEFAULT_TIME_LIMIT, help="Per-slot budget of the search backends in seconds")
+    parser.add_argument("--repeat", type=int, default=1, help="Drafts per map, first pick team and timeframe")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-snapshot", action="store_true", help="Load patch data from the API cache instead of the snapshot")
+    parser.add_argument("--profile", action="store_true", help="Add per-step component timings to every row")
+    parser.add_argument("--output", help="JSON lines output file (default: data/simulation_<timestamp>.jsonl)")
+    args = parser.parse_args(argv)
+
+    timeframes = args.timeframe or [("major", "2.55")]
+    output_path = args.output or utils.data_path(f"simulation_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+
+    # ✅ Load everything once up front so the workers only read the cache and snapshots
+    maps_by_timeframe = {}
+    for timeframe_type, timeframe in timeframes:
+        patch_data = load_data.load_patch_data(timeframe_type, timeframe, use_snapshot=not args.no_snapshot)
+        maps_by_timeframe[(timeframe_type, timeframe)] = args.maps or sorted(patch_data["hero_winrates_by_map"])
+    load_data.load_team_data(team_config.team_1_tags, team_config.team_2_tags)
+
+    jobs = build_jobs(timeframes, maps_by_timeframe, args.first_pick, args.backend, args.time_limit, args.repeat, not args.no_snapshot, args.profile)
+    print(f"Simulating {len(jobs)} drafts with the {args.backend} backend...")
+    summary = run_simulations(jobs, output_path, args.workers)
+
+    print(f"✅ {summary['drafts']} drafts ({summary['errors']} failed) in {summary['elapsed']:.1f}s, "
+          f"{summary['mean_decision_time'] * 1000:.1f} ms per decision. Results: {output_path}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
+import cache_store
+import utils
+
+FORMAT_VERSION = 1
+MAGIC = b"HOTSSNAP"
+ALIGNMENT = 64
+
+
+def snapshot_path(timeframe_type, timeframe):
+    return utils.data_path(f"snapshot_{timeframe_type}_{timeframe}.bin")
+
+
+def source_hash(timeframe_type, timeframe, hero_list):
+    """
+    Hash of everything a snapshot is built from: the format version, the hero role config and the
+    fetch time of every cached API response it used. Returns None if any response isn't cached.
+    """
+    hero_config = utils.config_module("hero_config")
+
+    keys = [cache_store.cache_key("Heroes"), cache_store.cache_key(*utils.hero_winrates_by_map_request(timeframe_type, timeframe))]
+    keys += [cache_store.cache_key(*utils.hero_matchup_request(hero, timeframe_type, timeframe)) for hero in hero_list]
+    fetched_at = utils.get_cache_store().fetched_at_many(keys)
+    if len(fetched_at) < len(set(keys)):
+        return None
+
+    source = {
+        "format_version": FORMAT_VERSION,
+        "timeframe": [timeframe_type, timeframe],
+        "additional_hero_roles": hero_config.additional_hero_roles,
+        "fetched_at": sorted(fetched_at.items()),
+    }
+    return hashlib.sha256(json.dumps(source, sort_keys=True).encode()).hexdigest()
+
+
+def build_snapshot(timeframe_type, timeframe, max_workers=None):
+    """Fetches (or reads from cache) the patch data for a timeframe and writes it as one binary snapshot file."""
+    hero_list = list(utils.get_heroes_list())
+    hero_roles = utils.get_hero_roles()
+    hero_winrates_by_map = utils.get_hero_winrates_by_map(timeframe_type, timeframe)
+    hero_matchup_data = {}
+    for matchup_data in utils.get_hero_matchup_data_bulk(hero_list, timeframe_type, timeframe, max_workers).values():
+        if matchup_data:
+            hero_matchup_data.update(matchup_data)
+
+    heroes = set(hero_list) | set(hero_roles)
+    for hero, matchups in hero_matchup_data.items():
+        heroes.add(hero)
+        heroes.update(matchups)
+    for map_winrates in hero_winrates_by_map.values():
+        heroes.update(map_winrates)
+    heroes = sorted(heroes)
+    hero_index = {hero: idx for idx, hero in enumerate(heroes)}
+    maps = list(hero_winrates_by_map)
+
+    # ✅ Raw win rates are stored as read, NaN marks a missing value
+    map_win_rates = np.full((len(maps), len(heroes)), np.nan)
+    for map_idx, map_name in enumerate(maps):
+        for hero, stats in hero_winrates_by_map[map_name].items():
+            if "win_rate" in stats:
+                map_win_rates[map_idx, hero_index[hero]] = stats["win_rate"]
+
+    ally_win_rates = np.full((len(heroes), len(heroes)), np.nan)
+    enemy_win_rates = np.full((len(heroes), len(heroes)), np.nan)
+    has_matchup = np.zeros((len(heroes), len(heroes)), dtype=np.uint8)
+    for hero, matchups in hero_matchup_data.items():
+        row = hero_index[hero]
+        for other_hero, matchup in matchups.items():
+            col = hero_index[other_hero]
+            has_matchup[row, col] = 1
+            if "win_rate_as_ally" in matchup.get("ally", {}):
+                ally_win_rates[row, col] = float(matchup["ally"]["win_rate_as_ally"])
+            if "win_rate_against" in matchup.get("enemy", {}):
+                enemy_win_rates[row, col] = float(matchup["enemy"]["win_rate_against"])
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source_hash": source_hash(timeframe_type, timeframe, hero_list),
+        "timeframe_type": timeframe_type,
+        "timeframe": timeframe,
+        "hero_list": hero_list,
+        "heroes": heroes,
+        "hero_roles": hero_roles,
+        "maps": maps,
+    }
+    arrays = {
+        "map_win_rates": map_win_rates,
+        "ally_win_rates": ally_win_rates,
+        "enemy_win_rates": enemy_win_rates,
+        "has_matchup": has_matchup,
+    }
+
+    path = snapshot_path(timeframe_type, timeframe)
+    _write(path, header, arrays)
+    return Snapshot(path)
+
+
+def _write(path, header, arrays):
+    """Writes MAGIC, the header length, a JSON header and 64-byte aligned raw arrays; replaces `path` atomically."""
+    # The header size depends on the offsets it lists, so lay the arrays out after a generous estimate
+    layout = {name: {"dtype": array.dtype.str, "shape": list(array.shape)} for name, array in arrays.items()}
+    data_start = _align(len(MAGIC) + 8 + len(json.dumps({**header, "arrays": layout}).encode()) + 64 * len(arrays) + ALIGNMENT)
+    offset = data_start
+    for name, array in arrays.items():
+        layout[name]["offset"] = offset
+        offset = _align(offset + array.nbytes)
+
+    header_bytes = json.dumps({**header, "arrays": layout}).encode()
+    assert len(MAGIC) + 8 + len(header_bytes) <= data_start
+
+    temp_path = f"{path}.tmp{os.getpid()}"
+    with open(temp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(layout[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(offset)
+    os.replace(temp_path, path)
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped patch data for one timeframe.
+
+    Arrays are `numpy.memmap` views of the file, so opening is a header read and processes that open
+    the same snapshot share its pages. Pickles as its path, so worker processes reopen the mapping
+    instead of copying the arrays.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"❌ Error: '{path}' is not a draft data snapshot.")
+            header_length, = struct.unpack("<Q", f.read(8))
+            self.header = json.loads(f.read(header_length))
+
+        self.format_version = self.header["format_version"]
+        self.source_hash = self.header["source_hash"]
+        self.hero_list = self.header["hero_list"]
+        self.heroes = self.header["heroes"]
+        self.hero_index = {hero: idx for idx, hero in enumerate(self.heroes)}
+        self.hero_roles = self.header["hero_roles"]
+        self.maps = self.header["maps"]
+
+        for name, spec in self.header["arrays"].items():
+            setattr(self, name, np.memmap(path, dtype=np.dtype(spec["dtype"]), mode="r", offset=spec["offset"], shape=tuple(spec["shape"])))
+
+    def __reduce__(self):
+        return Snapshot, (self.path,)
+
+    def is_current(self):
+        """True if the snapshot was built by this format version from the currently cached API responses."""
+        return (
+            self.format_version == FORMAT_VERSION
+            and self.source_hash is not None
+            and self.source_hash == source_hash(self.header["timeframe_type"], self.header["timeframe"], self.hero_list)
+        )
+
+    def hero_winrates_by_map(self):
+        """Returns the map win rates in the API's {map: {hero: {"win_rate": ...}}} shape."""
+        return {
+            map_name: {hero: {"win_rate": win_rate} for hero, win_rate in zip(self.heroes, self.map_win_rates[map_idx].tolist()) if win_rate == win_rate}
+            for map_idx, map_name in enumerate(self.maps)
+        }
+
+    def hero_matchup_data(self):
+        return MatchupView(self)
+
+
+class MatchupView(Mapping):
+    """Read-only {hero: {other_hero: {"ally": {...}, "enemy": {...}}}} view over a snapshot's matchup arrays."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self._rows = np.flatnonzero(snapshot.has_matchup.any(axis=1)).tolist()
+
+    def __getitem__(self, hero):
+        idx = self.snapshot.hero_index.get(hero)
+        if idx is None or not self.snapshot.has_matchup[idx].any():
+            raise KeyError(hero)
+        return _MatchupRow(self.snapshot, idx)
+
+    def __iter__(self):
+        return (self.snapshot.heroes[idx] for idx in self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def dense_matrices(self):
+        """Returns (heroes, ally win rate - 50, enemy win rate - 50) with 0 where a matchup is missing."""
+        ally = np.nan_to_num(np.asarray(self.snapshot.ally_win_rates) - 50)
+        enemy = np.nan_to_num(np.asarray(self.snapshot.enemy_win_rates) - 50)
+        return self.snapshot.heroes, ally, enemy
+
+
+class _MatchupRow(Mapping):
+
+    def __init__(self, snapshot, idx):
+        self.snapshot = snapshot
+        self.idx = idx
+
+    def __getitem__(self, other_hero):
+        col = self.snapshot.hero_index.get(other_hero)
+        if col is None or not self.snapshot.has_matchup[self.idx, col]:
+            raise KeyError(other_hero)
+        matchup = {"ally": {}, "enemy": {}}
+        ally = self.snapshot.ally_win_rates[self.idx, col]
+        enemy = self.snapshot.enemy_win_rates[self.idx, col]
+        if ally == ally:
+            matchup["ally"]["win_rate_as_ally"] = float(ally)
+        if enemy == enemy:
+            matchup["enemy"]["win_rate_against"] = float(enemy)
+        return matchup
+
+    def __iter__(self):
+        return (self.snapshot.heroes[col] for col in np.flatnonzero(self.snapshot.has_matchup[self.idx]).tolist())
+
+    def __len__(self):
+        return int(self.snapshot.has_matchup[self.idx].sum())
+
+
+def current_snapshot(timeframe_type, timeframe):
+    """Opens the snapshot for a timeframe if it exists and is current, otherwise returns None."""
+    path = snapshot_path(timeframe_type, timeframe)
+    if os.path.exists(path):
+        try:
+            snapshot = Snapshot(path)
+            if snapshot.is_current():
+                print(f"Loaded draft data snapshot {os.path.basename(path)}")
+                return snapshot
+            print(f"Draft data snapshot {os.path.basename(path)} is stale.")
+        except (ValueError, KeyError, OSError):
+            print(f"Draft data snapshot {os.path.basename(path)} is unreadable.")
+    return None
+
+
+def load_snapshot(timeframe_type, timeframe, max_workers=None):
+    """Opens the snapshot for a timeframe, rebuilding it first if it is missing, from an older format, or stale."""
+    snapshot = current_snapshot(timeframe_type, timeframe)
+    if snapshot is None:
+        print(f"Building draft data snapshot {os.path.basename(snapshot_path(timeframe_type, timeframe))}...")
+        snapshot = build_snapshot(timeframe_type, timeframe, max_workers)
+    return snapshot
@@ -0,0 +1,62 @@
+"""
+Reproducible synthetic HeroesProfile API responses.
+
+Generates every response a draft load requests, for made-up heroes and two made-up teams, so the
+draft can run without the real API: mock_server serves them by default, and the tests and
+benchmarks load drafts from them.
+"""
+import random
+
+import utils
+
+NUM_HEROES = 90
+HEROES_PER_PLAYER = 65
+ROLES = ["Tank", "Bruiser", "Healer", "Support", "Ranged Assassin", "Melee Assassin"]
+MAPS = [
+    "Alterac Pass", "Battlefield of Eternity", "Blackheart's Bay", "Braxis Holdout", "Cursed Hollow",
+    "Dragon Shire", "Garden of Terror", "Hanamura Temple", "Haunted Mines", "Infernal Shrines",
+    "Sky Temple", "Tomb of the Spider Queen", "Towers of Doom", "Volskaya Foundry", "Warhead Junction",
+]
+TEAM_1_NAME = "Synthetic Allies"
+TEAM_2_NAME = "Synthetic Enemies"
+TEAM_1_TAGS = [f"Ally{i}#1{i:03d}" for i in range(5)]
+TEAM_2_TAGS = [f"Enemy{i}#2{i:03d}" for i in range(5)]
+
+
+def hero_names(num_heroes=NUM_HEROES):
+    return [f"Hero{i:02d}" for i in range(num_heroes)]
+
+
+def generate_api_responses(seed=0, num_heroes=NUM_HEROES, heroes_per_player=HEROES_PER_PLAYER,
+                           timeframe_type="major", timeframe="2.55", team_1_tags=TEAM_1_TAGS, team_2_tags=TEAM_2_TAGS):
+    """
+    Returns reproducible (endpoint, params, response) tuples shaped like the HeroesProfile API answers
+    for every request a draft load makes: heroes, map win rates for every map, one matchup table per
+    hero and the NGS profile and hero MMR data of every player.
+    """
+    rng = random.Random(seed)
+    heroes = hero_names(num_heroes)
+    responses = [("Heroes", None, {hero: {"name": hero, "new_role": rng.choice(ROLES)} for hero in heroes})]
+
+    hero_winrates_by_map = {map_name: {hero: {"win_rate": round(rng.uniform(42, 58), 2)} for hero in heroes} for map_name in MAPS}
+    responses.append(utils.hero_winrates_by_map_request(timeframe_type, timeframe) + (hero_winrates_by_map,))
+
+    for hero in heroes:
+        matchups = {
+            other: {
+                "ally": {"win_rate_as_ally": f"{rng.uniform(40, 60):.2f}"},
+                "enemy": {"win_rate_against": f"{rng.uniform(40, 60):.2f}"},
+            }
+            for other in heroes if other != hero
+        }
+        responses.append(utils.hero_matchup_request(hero, timeframe_type, timeframe) + ({hero: matchups},))
+
+    for tag in list(team_1_tags) + list(team_2_tags):
+        responses.append(utils.ngs_profile_request(tag) + ({"battletag": tag, "division": rng.choice("ABCDE")},))
+        hero_data = {
+            hero: {"mmr": round(rng.uniform(2000, 3400), 3), "games_played": rng.randint(1, 150)}
+            for hero in rng.sample(heroes, heroes_per_player)
+        }
+        responses.append(utils.player_hero_request(tag) + ({"Storm League": hero_data},))
+
+    return responses
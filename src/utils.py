@@ -1,24 +1,73 @@
+import importlib.util
 import pickle
-import requests
 import json
-from dotenv import load_dotenv
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-# Load environment variables
-load_dotenv()
+import cache_store
+import http_client
+import instrumentation
 
-API_KEY = os.getenv('HEROES_PROFILE_API_KEY')
-BASE_URL = "https://api.heroesprofile.com/api"
+DEFAULT_BASE_URL = "https://api.heroesprofile.com/api"
+API_KEY = None  # ✅ Resolved from the environment (and .env) on first use, see load_environment
+BASE_URL = None
 DATA_DIR = "../data"
+CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../config"))
+CACHE_FILE = "api_cache.sqlite3"
+NEGATIVE_CACHE_TTL = 24 * 3600  # Seconds a "no data" answer is remembered
 
-# Ensure data directory exists
-os.makedirs(DATA_DIR, exist_ok=True)
+_cache_store = None
+_refresh_executor = None
+_refreshing = set()
+_refresh_lock = threading.Lock()
+_environment_loaded = False
+
+
+def load_environment():
+    """
+    Loads .env into the environment once, then fills API_KEY and BASE_URL unless they were set
+    already. Importing this module has no side effects; everything that needs the settings calls this.
+    """
+    global _environment_loaded, API_KEY, BASE_URL
+    if not _environment_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _environment_loaded = True
+        instrumentation.enable_if_requested()
+    if API_KEY is None:
+        API_KEY = os.getenv("HEROES_PROFILE_API_KEY")
+    if BASE_URL is None:
+        BASE_URL = os.getenv("HEROES_PROFILE_BASE_URL", DEFAULT_BASE_URL)
+
+
+def data_path(filename):
+    """Returns the path of `filename` in DATA_DIR, creating the directory on first use."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, filename)
+
+
+def config_module(name):
+    """
+    Returns the config/<name>.py module, importing it on first use without adding config/ to
+    sys.path. A module already in sys.modules (e.g. a test's team_config) takes precedence.
+    """
+    if name not in sys.modules:
+        path = os.path.join(CONFIG_DIR, f"{name}.py")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"❌ Error: Configuration file '{path}' not found.")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+    return sys.modules[name]
 
 
 def save_to_pickle(data, filename):
     """Saves data to a pickle file."""
-    with open(os.path.join(DATA_DIR, filename), "wb") as f:
+    with open(data_path(filename), "wb") as f:
         pickle.dump(data, f)
 
 
@@ -54,7 +103,7 @@ def load_team_config(config_file="../config/team_config.json"):
 
 
 def get_hero_roles():
-    import hero_config
+    hero_config = config_module("hero_config")
     hero_roles_response = fetch_api_data("Heroes")
     if not hero_roles_response:
         raise ValueError("❌ Error: Failed to retrieve hero roles from API.")
@@ -83,7 +132,77 @@ def get_hero_player_pool_sizes(DRAFT_DATA, team_name, mmr_threshold=2700):
     return player_hero_pools
 
 
-def fetch_api_data(endpoint, params=None, cache=True):
+def default_cache_ttl():
+    """Returns the configured cache TTL in seconds (HEROES_PROFILE_CACHE_TTL_HOURS), or None to keep responses forever."""
+    load_environment()
+    hours = os.getenv("HEROES_PROFILE_CACHE_TTL_HOURS")
+    return float(hours) * 3600 if hours else None
+
+
+def get_cache_store():
+    """Returns the shared API cache in DATA_DIR, opening it on first use (size cap: HEROES_PROFILE_CACHE_MAX_MB)."""
+    global _cache_store
+    if _cache_store is None:
+        load_environment()
+        max_mb = os.getenv("HEROES_PROFILE_CACHE_MAX_MB")
+        max_bytes = int(max_mb) * 1024 * 1024 if max_mb else cache_store.DEFAULT_MAX_BYTES
+        _cache_store = cache_store.CacheStore(data_path(CACHE_FILE), max_bytes)
+    return _cache_store
+
+
+def request_api_data(endpoint, params=None):
+    """Performs a single uncached HeroesProfile API request. Raises http_client.HeroesProfileError on failure."""
+    load_environment()
+    params = dict(params or {})
+    params["api_token"] = API_KEY  # Ensure API token is always included
+
+    # Construct the full query string manually
+    query_string = "&".join(f"{key}={value}" for key, value in params.items())
+
+    url = f"{BASE_URL}/{endpoint}?{query_string}"
+
+    print(f"Executing API call: {url}")  # Debugging output
+
+    try:
+        with instrumentation.span("api_request"):
+            return http_client.get_json(url)
+    except http_client.QuotaExhaustedError:
+        print("❌ Error: Could not parse JSON response. It looks like you've run out of API calls with your subscription.")
+        raise
+    except http_client.HeroesProfileError as e:
+        print(f"❌ Failed API request: {endpoint} | {e}")
+        raise
+
+
+def cache_negative_result(key, error):
+    """Remembers a 404 for NEGATIVE_CACHE_TTL seconds so missing data isn't requested on every run."""
+    if isinstance(error, http_client.NotFoundError):
+        get_cache_store().put(key, None, NEGATIVE_CACHE_TTL)
+
+
+def _refresh_in_background(key, endpoint, params, ttl):
+    """Refetches an expired entry on a background thread, at most once at a time per key."""
+    global _refresh_executor
+    with _refresh_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+
+    def refresh():
+        try:
+            get_cache_store().put(key, request_api_data(endpoint, params), ttl)
+        except http_client.HeroesProfileError as e:
+            cache_negative_result(key, e)
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(key)
+
+    _refresh_executor.submit(refresh)
+
+
+def fetch_api_data(endpoint, params=None, cache=True, ttl=None):
     """
     Generalized API request function for HeroesProfile.
 
@@ -91,101 +210,136 @@ def fetch_api_data(endpoint, params=None, cache=True):
         endpoint (str): API endpoint path, excluding BASE_URL.
         params (dict, optional): Query parameters for the request.
         cache (bool, optional): Whether to use caching. Default is True.
+        ttl (float, optional): Seconds before a cached response is refreshed. Default is
+            HEROES_PROFILE_CACHE_TTL_HOURS, or never when that isn't set. An expired response
+            is still returned while a background refresh runs.
 
     Returns:
         dict: JSON response data if successful.
-        Exits program on failure.
+        Raises http_client.NotFoundError when the API (or the cached negative result) has no data,
+        and another http_client.HeroesProfileError for any other failure.
     """
-    params = params or {}
-    params["api_token"] = API_KEY  # Ensure API token is always included
+    key = cache_store.cache_key(endpoint, params)
+    ttl = ttl if ttl is not None else default_cache_ttl()
 
-    # Construct the full query string manually
-    query_string = "&".join(f"{key}={value}" for key, value in params.items())
-
-    url = f"{BASE_URL}/{endpoint}?{query_string}"
-
-    # Remove API key from cache filename
-    cache_params = {k: v for k, v in params.items() if k != "api_token"}
-    cache_file = f"{endpoint.replace('/', '_')}_{'_'.join(map(str, cache_params.values()))}.pkl"
+    if cache:
+        with instrumentation.span("cache_lookup"):
+            entry = get_cache_store().get(key, allow_expired=True)
+        expired = entry is not None and entry.expires_at is not None and entry.expires_at <= time.time()
+        if entry is not None and entry.value is None and expired:
+            entry = None  # ✅ An expired "no data" answer is a miss: the data may exist by now
+        if entry is not None:
+            if entry.value is None:
+                raise http_client.NotFoundError(f"No data for {key} (cached)", 404)
+            if expired:
+                print(f"Serving stale cached data for {key} while it refreshes")
+                _refresh_in_background(key, endpoint, params, ttl)
+            else:
+                print(f"Loaded cached data for {key}")
+            return entry.value
+
+    try:
+        data = request_api_data(endpoint, params)
+    except http_client.HeroesProfileError as e:
+        if cache:
+            cache_negative_result(key, e)
+        raise
 
     if cache:
-        cached_data = load_from_pickle(cache_file)
-        if cached_data:
-            print(f"Loaded cached data for {endpoint} with query: {query_string}")
-            return cached_data
+        get_cache_store().put(key, data, ttl)
+    return data
 
-    print(f"Executing API call: {url}")  # Debugging output
 
-    response = requests.get(url)
+def fetch_api_data_bulk(api_requests, max_workers=None, ttl=None, missing_ok=False):
+    """
+    Fetches many (endpoint, params) requests with one cache lookup and one cache write.
 
-    if response.status_code == 200:
+    Cache misses and expired 404s are requested concurrently; other expired entries are served stale
+    while they refresh in the background. With `missing_ok`, a failed request yields None instead of raising.
+    Returns the responses in request order.
+    """
+    store = get_cache_store()
+    ttl = ttl if ttl is not None else default_cache_ttl()
+    keys = [cache_store.cache_key(endpoint, params) for endpoint, params in api_requests]
+    with instrumentation.span("cache_lookup"):
+        cached = store.get_many(keys, allow_expired=True)
+    now = time.time()
+    # ✅ An expired "no data" answer is a miss, as in fetch_api_data: the data may exist by now
+    cached = {key: entry for key, entry in cached.items()
+              if not (entry.value is None and entry.expires_at is not None and entry.expires_at <= now)}
+    missing = {key: request for key, request in zip(keys, api_requests) if key not in cached}
+
+    if cached:
+        print(f"Loaded {len(cached)} cached responses")
+
+    for key, request in zip(keys, api_requests):
+        entry = cached.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+            _refresh_in_background(key, request[0], request[1], ttl)
+
+    def request(api_request):
         try:
-            data = response.json()
-        except json.decoder.JSONDecodeError:
-            print(
-                "❌ Error: Could not parse JSON response. It looks like you've run out of API calls with your subscription.")
-            print("Response text:", response.text)
-            sys.exit(1)
-        if cache:
-            save_to_pickle(data, cache_file)
-        return data
-
-    print(f"❌ Failed API request: {url} | Status Code: {response.status_code} | Response: {response.text}")
-    sys.exit(1)  # Exit the program on failure
+            return request_api_data(*api_request), None
+        except http_client.HeroesProfileError as e:
+            return None, e
+
+    fetched = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers or http_client.max_concurrency()) as executor:
+            fetched = dict(zip(missing, executor.map(request, missing.values())))
+        store.put_many({key: data for key, (data, error) in fetched.items() if error is None}, ttl)
+
+    results = []
+    for key in keys:
+        if key in cached:
+            data = cached[key].value
+            if data is None and not missing_ok:
+                raise http_client.NotFoundError(f"No data for {key} (cached)", 404)
+        else:
+            data, error = fetched[key]
+            if error is not None:
+                cache_negative_result(key, error)
+                if not missing_ok:
+                    raise error
+        results.append(data)
+    return results
+
+
+def ngs_profile_request(battle_tag):
+    """Returns the (endpoint, params) request for a player's NGS profile."""
+    return "NGS/Player/Profile", {"battletag": battle_tag.replace("#", "%23")}
+
+
+def player_hero_request(battle_tag, region=1, game_type="Storm League"):
+    """Returns the (endpoint, params) request for a player's hero MMR data."""
+    return "Player/Hero/All", {
+        "battletag": battle_tag.replace("#", "%23"),
+        "region": region,   # ✅ Now correctly passing region
+        "game_type": game_type  # ✅ Now correctly passing game_type
+    }
 
 
 def get_ngs_profile_data(battle_tags):
     """Fetches and caches NGS profile data for a list of players."""
-    team_data = {}
-
-    for tag in battle_tags:
-        cache_file = f"{tag.replace('#', '_')}_NGS.pkl"
-        cached_data = load_from_pickle(cache_file)
-
-        if cached_data:
-            print(f"Loaded cached NGS profile data for {tag}")
-            team_data[tag] = cached_data
-            continue
-
-        try:
-            print(f"Fetching NGS profile data for {tag} from API...")
-            player_data = fetch_api_data("NGS/Player/Profile", {"battletag": tag.replace("#", "%23")})
-        except:
-            print(f"No NGS profile found for {tag}.")
-            player_data = None
+    battle_tags = list(battle_tags)
+    responses = fetch_api_data_bulk([ngs_profile_request(tag) for tag in battle_tags], missing_ok=True)
 
+    team_data = {}
+    for tag, player_data in zip(battle_tags, responses):
         if player_data:
             team_data[tag] = player_data
-            save_to_pickle(player_data, cache_file)
+        else:
+            print(f"No NGS profile found for {tag}.")
 
     return team_data
 
 
 def get_player_hero_data(battle_tags, region=1, game_type="Storm League"):
     """Fetches and caches hero-specific data for a list of players."""
-    team_data = {}
-
-    for tag in battle_tags:
-        cache_file = f"{tag.replace('#', '_')}_Profile.pkl"
-        cached_data = load_from_pickle(cache_file)
+    battle_tags = list(battle_tags)
+    responses = fetch_api_data_bulk([player_hero_request(tag, region, game_type) for tag in battle_tags])
 
-        if cached_data:
-            print(f"Loaded cached hero data for {tag}")
-            team_data[tag] = cached_data
-            continue
-
-        print(f"Fetching hero data for {tag} from API...")
-        player_data = fetch_api_data("Player/Hero/All", {
-            "battletag": tag.replace("#", "%23"),
-            "region": region,   # ✅ Now correctly passing region
-            "game_type": game_type  # ✅ Now correctly passing game_type
-        })
-
-        if player_data:
-            team_data[tag] = player_data
-            save_to_pickle(player_data, cache_file)
-
-    return team_data
+    return {tag: player_data for tag, player_data in zip(battle_tags, responses) if player_data}
 
 
 def get_hero_stats(hero_name, game_type="Storm League", region=1):
@@ -198,22 +352,14 @@ def get_hero_stats(hero_name, game_type="Storm League", region=1):
         region (int): The region code (default: 1 for NA).
 
     Returns:
-        dict: Hero stats if successful, otherwise None.
+        dict: Hero stats if successful, None if the hero name is missing.
+        Raises http_client.HeroesProfileError if the API call fails.
     """
     if not hero_name or hero_name == "None":
         print("❌ Error: Hero name is missing.")
         return None
 
-    url = f"https://api.heroesprofile.com/api/Hero/Stats?hero={hero_name}&game_type={game_type}&region={region}&api_token={API_KEY}"
-
-    print(f"🔍 Executing API Call: {url}")  # Debugging
-    response = requests.get(url)
-
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ Failed API request: {url} | Status Code: {response.status_code} | Response: {response.text}")
-        sys.exit(1)  # Terminate program if API call fails
+    return request_api_data("Hero/Stats", {"hero": hero_name, "game_type": game_type, "region": region})
 
 
 def get_heroes_stats(timeframe_type="major", timeframe="2.47", game_type="Storm League", group_by_map=False):
@@ -241,39 +387,54 @@ def get_heroes_stats(timeframe_type="major", timeframe="2.47", game_type="Storm
     return hero_stats
 
 
-def get_hero_winrates_by_map(timeframe_type, timeframe):
-    """Fetches hero win rates by map from Heroes Profile API."""
-    return fetch_api_data("Heroes/Stats", params={
+def hero_winrates_by_map_request(timeframe_type, timeframe):
+    """Returns the (endpoint, params) request for hero win rates by map."""
+    return "Heroes/Stats", {
         "timeframe_type": timeframe_type,
         "timeframe": timeframe,
         "game_type": "Storm League",
         "group_by_map": "true"
-    })
+    }
+
+
+def get_hero_winrates_by_map(timeframe_type, timeframe):
+    """Fetches hero win rates by map from Heroes Profile API."""
+    return fetch_api_data(*hero_winrates_by_map_request(timeframe_type, timeframe))
 
 
 def get_player_hero_mmr(battletag):
     """Fetches hero-specific MMR data for a given player."""
-    formatted_tag = battletag.replace("#", "%23")
-    return fetch_api_data("Player/Hero/All", params={
-        "battletag": formatted_tag,
-        "region": "1",
-        "game_type": "Storm League"
-    })
+    return fetch_api_data(*player_hero_request(battletag))
 
 
-def get_hero_matchup_data(hero, timeframe_type, timeframe):
-    """Fetches matchup data for a specific hero."""
-    return fetch_api_data("Heroes/Matchups", params={
+def hero_matchup_request(hero, timeframe_type, timeframe):
+    """Returns the (endpoint, params) request for a hero's matchup data."""
+    return "Heroes/Matchups", {
         "timeframe_type": timeframe_type,
         "timeframe": timeframe,
         "game_type": "Storm League",
         "hero": hero
-    })
+    }
+
+
+def get_hero_matchup_data(hero, timeframe_type, timeframe):
+    """Fetches matchup data for a specific hero."""
+    return fetch_api_data(*hero_matchup_request(hero, timeframe_type, timeframe))
+
+
+def get_hero_matchup_data_bulk(heroes, timeframe_type, timeframe, max_workers=None, missing_ok=False):
+    """
+    Fetches matchup data for many heroes with one cache pass, returning {hero: matchup data} in input
+    order. With `missing_ok`, heroes whose request failed map to None.
+    """
+    heroes = list(heroes)
+    responses = fetch_api_data_bulk([hero_matchup_request(hero, timeframe_type, timeframe) for hero in heroes], max_workers, missing_ok=missing_ok)
+    return dict(zip(heroes, responses))
 
 
 def calculate_allied_synergy_score(DRAFT_DATA, hero, team_name):
     hero_matchup_data = DRAFT_DATA['hero_matchup_data']
-    ally_picked_heroes = DRAFT_DATA['team_1_picked_heroes'].values() if team_name == DRAFT_DATA['team_1_name'] else DRAFT_DATA['team_2_picked_heroes']
+    ally_picked_heroes = DRAFT_DATA['team_1_picked_heroes'].values() if team_name == DRAFT_DATA['team_1_name'] else DRAFT_DATA['team_2_picked_heroes'].values()
     ally_synergy = sum(
         float(hero_matchup_data.get(hero, {}).get(ally_hero, {}).get("ally", {}).get("win_rate_as_ally", 50)) - 50
         for ally_hero in ally_picked_heroes if ally_hero in hero_matchup_data.get(hero, {})
@@ -284,7 +445,7 @@ def calculate_allied_synergy_score(DRAFT_DATA, hero, team_name):
 
 def calculate_enemy_countering_score(DRAFT_DATA, hero, team_name):
     hero_matchup_data = DRAFT_DATA['hero_matchup_data']
-    enemy_picked_heroes = DRAFT_DATA['team_2_picked_heroes'].values() if team_name == DRAFT_DATA['team_1_name'] else DRAFT_DATA['team_1_picked_heroes']
+    enemy_picked_heroes = DRAFT_DATA['team_2_picked_heroes'].values() if team_name == DRAFT_DATA['team_1_name'] else DRAFT_DATA['team_1_picked_heroes'].values()
 
     enemy_counter = sum(
         float(hero_matchup_data.get(hero, {}).get(enemy_hero, {}).get("enemy", {}).get("win_rate_against", 50)) - 50
@@ -296,21 +457,11 @@ def calculate_enemy_countering_score(DRAFT_DATA, hero, team_name):
 
 def fetch_match_data_for_draft(match_id):
     """Fetches and caches match data for drafting."""
-    cache_file = f"match_{match_id}.pkl"
-    file_path = os.path.join(DATA_DIR, cache_file)
-
-    if os.path.exists(file_path):
-        print(f"Loaded cached match data for {match_id}")
-        return pickle.load(open(file_path, "rb"))
-
-    match_data = fetch_api_data(f"matches/{match_id}")
-
-    if not match_data:
+    try:
+        return fetch_api_data(f"matches/{match_id}") or None
+    except http_client.NotFoundError:
         return None
 
-    save_to_pickle(match_data, cache_file)
-    return match_data
-
 
 def get_heroes_list():
     """Fetches the complete list of heroes from the API."""
@@ -375,4 +526,10 @@ def print_final_draft(DRAFT_DATA, user_input_enabled):
 
     print("=" * 120)
 
+    # ✅ Profile of the draft when instrumentation is enabled
+    if instrumentation.is_enabled():
+        instrumentation.print_summary(DRAFT_DATA.get("step_timings"))
+        folded_path = instrumentation.write_folded(data_path(f"profile_{DRAFT_DATA['map_name'].replace(' ', '_')}_{time.strftime('%Y%m%d_%H%M%S')}.folded"))
+        print(f"Flame graph stacks written to {folded_path}")
+
 
@@ -0,0 +1,139 @@
+"""
+Bulk cache warm-up for a whole division.
+
+`load_data.load_and_initialize_draft` loads one team_config per process. Before match night this
+warms everything the drafts of many teams need in one run: every player's hero data and NGS
+profile, plus the heroes, map win rates and matchups of each timeframe. Requests are deduplicated
+across teams (a player on two rosters or a timeframe listed twice is fetched once), cached
+responses are skipped, and the rest run concurrently through the HTTP client's process-wide rate
+limit. Each timeframe's snapshot is then built from the warm cache.
+
+    python warm_cache.py                                   # team_config's two teams
+    python warm_cache.py --team-config a.py --team-config b.py
+    python warm_cache.py --rosters division_a.json --timeframe major:2.55
+
+A rosters file is a JSON object of {team name: [BattleTag, ...]}. Rosters are kept as a list of
+(team name, tags), so two files using the same team name both count.
+"""
+import argparse
+import importlib.util
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import cache_store
+import http_client
+import snapshot
+import utils
+
+PROGRESS_STEPS = 20  # Progress lines printed per warm-up
+
+
+def read_team_config(path):
+    """Returns [(team name, tags)] for both teams of a team_config.py file."""
+    spec = importlib.util.spec_from_file_location("team_config", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [(module.team_1_name, list(module.team_1_tags)), (module.team_2_name, list(module.team_2_tags))]
+
+
+def read_rosters(path):
+    """Returns [(team name, tags)] from a JSON rosters file."""
+    with open(path, encoding="utf-8") as f:
+        return [(team_name, list(tags)) for team_name, tags in json.load(f).items()]
+
+
+def player_requests(rosters, region=1, game_type="Storm League"):
+    """Returns the hero data and NGS profile requests of every player on any roster, each player once."""
+    battle_tags = dict.fromkeys(tag for _, tags in rosters for tag in tags)
+    api_requests = [utils.player_hero_request(tag, region, game_type) for tag in battle_tags]
+    return api_requests + [utils.ngs_profile_request(tag) for tag in battle_tags]
+
+
+def patch_requests(timeframes, heroes):
+    """Returns the map win rate and matchup requests of every timeframe."""
+    api_requests = []
+    for timeframe_type, timeframe in dict.fromkeys(timeframes):
+        api_requests.append(utils.hero_winrates_by_map_request(timeframe_type, timeframe))
+        api_requests += [utils.hero_matchup_request(hero, timeframe_type, timeframe) for hero in heroes]
+    return api_requests
+
+
+def warm(api_requests, max_workers=None, ttl=None):
+    """
+    Fetches every (endpoint, params) request that isn't cached yet, concurrently, and stores the
+    responses. Returns {"requests", "cached", "fetched", "failed"} counts plus the failed cache keys.
+    """
+    store = utils.get_cache_store()
+    ttl = ttl if ttl is not None else utils.default_cache_ttl()
+    requests_by_key = {cache_store.cache_key(endpoint, params): (endpoint, params) for endpoint, params in api_requests}
+    fresh = store.fresh_keys(requests_by_key)
+    missing = {key: request for key, request in requests_by_key.items() if key not in fresh}
+    print(f"Warming {len(requests_by_key)} responses: {len(fresh)} cached, {len(missing)} to fetch")
+
+    failed = []
+    step = max(1, len(missing) // PROGRESS_STEPS)
+    with ThreadPoolExecutor(max_workers=max_workers or http_client.max_concurrency()) as executor:
+        futures = {executor.submit(utils.request_api_data, *request): key for key, request in missing.items()}
+        for done, future in enumerate(as_completed(futures), 1):
+            key = futures[future]
+            try:
+                store.put(key, future.result(), ttl)
+            except http_client.HeroesProfileError as e:
+                utils.cache_negative_result(key, e)
+                failed.append(key)
+            if done % step == 0 or done == len(missing):
+                print(f"⏳ {done}/{len(missing)} fetched ({len(failed)} failed)")
+
+    return {"requests": len(requests_by_key), "cached": len(fresh), "fetched": len(missing) - len(failed), "failed": failed}
+
+
+def warm_division(rosters, timeframes=(("major", "2.55"),), max_workers=None, build_snapshots=True):
+    """
+    Warms the player and patch data of every roster and timeframe, then builds each timeframe's
+    snapshot. Returns the summary of `warm` with the elapsed time and the number of players.
+    """
+    start = time.perf_counter()
+    heroes = utils.get_heroes_list()  # ✅ The matchup requests depend on the hero list
+    summary = warm(player_requests(rosters) + patch_requests(timeframes, heroes), max_workers)
+
+    if build_snapshots:
+        for timeframe_type, timeframe in dict.fromkeys(timeframes):
+            snapshot.load_snapshot(timeframe_type, timeframe, max_workers)
+
+    summary["players"] = len({tag for _, tags in rosters for tag in tags})
+    summary["elapsed"] = time.perf_counter() - start
+    return summary
+
+
+def main(argv=None):
+    import simulate
+
+    parser = argparse.ArgumentParser(description="Warm the API cache and snapshots for the drafts of many teams in one run.")
+    parser.add_argument("--team-config", action="append", default=[], help="team_config.py file, repeatable")
+    parser.add_argument("--rosters", action="append", default=[], help="JSON file of {team name: [BattleTag, ...]}, repeatable")
+    parser.add_argument("--timeframe", action="append", type=simulate.parse_timeframe, help="TYPE:TIMEFRAME, repeatable (default: major:2.55)")
+    parser.add_argument("--workers", type=int, help="Concurrent requests (default: HEROES_PROFILE_MAX_CONCURRENCY)")
+    parser.add_argument("--no-snapshot", action="store_true", help="Only warm the API cache")
+    args = parser.parse_args(argv)
+
+    rosters = []
+    for path in args.team_config:
+        rosters += read_team_config(path)
+    for path in args.rosters:
+        rosters += read_rosters(path)
+    if not args.team_config and not args.rosters:
+        team_config = utils.config_module("team_config")
+        rosters = [(team_config.team_1_name, list(team_config.team_1_tags)), (team_config.team_2_name, list(team_config.team_2_tags))]
+
+    summary = warm_division(rosters, args.timeframe or [("major", "2.55")], args.workers, not args.no_snapshot)
+    print(f"✅ {len(rosters)} teams, {summary['players']} players: {summary['requests']} responses, "
+          f"{summary['cached']} already cached, {summary['fetched']} fetched, {len(summary['failed'])} failed "
+          f"in {summary['elapsed']:.1f}s")
+    for key in summary["failed"]:
+        print(f"❌ {key}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
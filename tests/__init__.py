@@ -0,0 +1,5 @@
+import os
+import sys
+
+# ✅ Test modules import shared fixtures such as synthetic_data by name, also when collected as a package
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,77 @@
+import contextlib
+import sys
+import tempfile
+import types
+
+import cache_store
+import http_client
+import load_data
+import mock_server
+import utils
+from synthetic_api import (  # ✅ The generator ships with mock_server; the test harness re-exports it
+    HEROES_PER_PLAYER, MAPS, NUM_HEROES, ROLES, TEAM_1_NAME, TEAM_1_TAGS, TEAM_2_NAME, TEAM_2_TAGS,
+    generate_api_responses, hero_names,
+)
+
+
+def populate_cache(store, responses):
+    """Stores generated responses in a CacheStore under the keys the fetch layer looks them up by."""
+    store.put_many({cache_store.cache_key(endpoint, params): response for endpoint, params, response in responses})
+
+
+def team_config_module(map_name="Towers of Doom", team_1_tags=TEAM_1_TAGS, team_2_tags=TEAM_2_TAGS):
+    """Returns a module with the attributes of config/team_config.py for the synthetic teams."""
+    module = types.ModuleType("team_config")
+    module.team_1_name, module.team_1_tags = TEAM_1_NAME, list(team_1_tags)
+    module.team_2_name, module.team_2_tags = TEAM_2_NAME, list(team_2_tags)
+    module.map_name = map_name
+    return module
+
+
+@contextlib.contextmanager
+def synthetic_environment(seed=0, map_name="Towers of Doom", warm=True, **kwargs):
+    """
+    Points the data directory and API cache at a temporary directory holding a warm cache of
+    generated responses and installs a matching team_config, so the real load path runs offline.
+    With `warm=False` the cache starts empty (e.g. to load from mock_server). Keyword arguments are
+    passed to `generate_api_responses`.
+    """
+    saved = utils.DATA_DIR, utils._cache_store, sys.modules.get("team_config")
+    with tempfile.TemporaryDirectory() as data_dir:
+        utils.DATA_DIR, utils._cache_store = data_dir, None
+        sys.modules["team_config"] = team_config_module(map_name)
+        try:
+            if warm:
+                populate_cache(utils.get_cache_store(), generate_api_responses(seed, **kwargs))
+            yield data_dir
+        finally:
+            utils.get_cache_store().close()
+            utils.DATA_DIR, utils._cache_store = saved[0], saved[1]
+            if saved[2] is None:
+                sys.modules.pop("team_config", None)
+            else:
+                sys.modules["team_config"] = saved[2]
+
+
+@contextlib.contextmanager
+def mock_api(responses=None, **options):
+    """
+    Starts a mock_server with `responses` (default: generated) and points utils.BASE_URL at it, with
+    a rate limit high enough not to slow tests down. Yields the server; keyword arguments are passed
+    to `mock_server.start_server`.
+    """
+    saved = utils.BASE_URL, http_client._rate_limiter
+    server = mock_server.start_server(responses, **options)
+    utils.BASE_URL, http_client._rate_limiter = server.url, http_client.TokenBucket(1000, 1000)
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        utils.BASE_URL, http_client._rate_limiter = saved
+
+
+def build_draft_data(seed=0, map_name="Towers of Doom", **kwargs):
+    """Returns a fully initialized DRAFT_DATA for generated data, loaded through `load_data` without a snapshot."""
+    with synthetic_environment(seed, map_name, **kwargs):
+        return load_data.load_and_initialize_draft(use_snapshot=False)
@@ -0,0 +1,117 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import itertools
+import json
+import time
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import assignment
+import ban
+import draft
+import draft_server
+import pick
+import scoring
+import search
+import synthetic_data
+
+
+def brute_force(problem, engine, state, team_name):
+    """Best (roles covered, total) over every combination of each player's full valid hero list."""
+    side = "team_1" if team_name == state["team_1_name"] else "team_2"
+    tables = engine.teams[side]
+    timing = assignment._timing_classes(engine)
+    unavailable = set(state["picked_heroes"]) | set(state["banned_heroes"]) | set(state["forbidden_heroes"])
+    options = []
+    for player in problem.players:
+        row = tables.player_index[player]
+        options.append([None] + [idx for idx, hero in enumerate(engine.heroes)
+                                 if tables.played[row, idx] and hero in state["available_heroes"] and hero not in unavailable])
+
+    _, synergy, counter = engine.hero_scores(state, team_name)
+    scores = engine.base_scores(side, state["map_name"]) + synergy * 25 + counter * 25
+    late_slots = sum(order >= scoring.LATE_PICK_ORDER for order in problem.orders)
+    middle_slots = sum(order >= scoring.MIDDLE_PICK_ORDER for order in problem.orders)
+    limits = {engine.roles.index(role): limit for role, limit in state["role_limits"].items() if role in engine.roles}
+
+    best = (-1, float("-inf"))
+    for heroes in itertools.product(*options):
+        picked = [hero for hero in heroes if hero is not None]
+        if len(set(picked)) < len(picked):
+            continue
+        roles = [engine.role_codes[hero] for hero in picked]
+        if any(problem.role_used[code] + roles.count(code) > limit for code, limit in limits.items()):
+            continue
+        if sum(timing[hero] == 2 for hero in picked) > late_slots or sum(timing[hero] >= 1 for hero in picked) > middle_slots:
+            continue
+        total = sum(scores[tables.player_index[player], hero] for player, hero in zip(problem.players, heroes) if hero is not None)
+        best = max(best, (len(problem.missing_roles & set(roles)), total))
+    return best
+
+
+class TestAssignment(unittest.TestCase):
+
+    def setUp(self):
+        self.suggestions = []
+
+    def play(self, draft_data, slots, backend=None):
+        """Plays `slots` automatically, with assignment suggestions for the picks when `backend` is set; returns the slowest decision."""
+        slowest = 0.0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for index, (draft_type, order, team_name) in enumerate(slots):
+                start = time.perf_counter()
+                suggestions = backend(draft_data, slots[index:]) if backend else None
+                slowest = max(slowest, time.perf_counter() - start)
+                self.suggestions += suggestions or []
+                if draft_type == "Ban":
+                    ban.execute_ban_phase(order, team_name, False, draft_data)
+                else:
+                    pick.execute_pick_phase(order, team_name, False, draft_data, suggestions)
+        return slowest
+
+    def test_completion_is_optimal(self):
+        """With two and three players left, the pruned branch and bound finds the same best completion as full enumeration."""
+        draft_data = synthetic_data.build_draft_data(seed=3)
+        slots = draft.get_draft_slots(draft_data)
+        self.play(draft_data, slots[:11])
+
+        for team_name in (draft_data["team_1_name"], draft_data["team_2_name"]):
+            orders = [order for draft_type, order, slot_team in slots[11:] if slot_team == team_name]
+            problem = assignment.completion_problem(search.as_draft_state(draft_data), team_name, orders)
+            self.assertEqual(len(orders), len(problem.players))
+            value, completion = assignment.solve(problem)
+
+            expected = brute_force(problem, draft_data["scoring_engine"], draft_data, team_name)
+            self.assertEqual(expected[0], value[0])
+            self.assertAlmostEqual(expected[1], value[1], places=6)
+            self.assertEqual(len(completion), len({candidate[1] for _, candidate in completion}))
+
+    def test_backend_drafts_within_limits(self):
+        """Whole drafts with the assignment backend respect role limits, cover the required roles and stay far below 100 ms per slot."""
+        for seed in (1, 5):
+            draft_data = synthetic_data.build_draft_data(seed=seed)
+            slots = draft.get_draft_slots(draft_data)
+            self.assertIsNone(assignment.assignment_suggestions(draft_data, slots))
+
+            slowest = self.play(draft_data, slots, assignment.assignment_suggestions)
+            self.assertLess(slowest, 0.1)
+            for team_name in (draft_data["team_1_name"], draft_data["team_2_name"]):
+                roles = draft_data["team_roles"][team_name]
+                self.assertTrue(all(roles[role] >= 1 for role in draft_data["required_roles"]), roles)
+                self.assertTrue(all(roles.get(role, 0) <= limit for role, limit in draft_data["role_limits"].items()), roles)
+            self.assertEqual(10, len(draft_data["picked_heroes"]))
+
+        # ✅ Alternatives that miss a required role report it in their own field, and serve as strict JSON
+        self.assertTrue(any(suggestion.missed_roles for suggestion in self.suggestions))
+        for suggestion in self.suggestions:
+            self.assertEqual(suggestion.missed_roles > 0, suggestion.loss is None)
+        fields = [draft_server.suggestion_fields(draft_server.PICK_FIELDS, suggestion) for suggestion in self.suggestions]
+        self.assertEqual(fields, json.loads(json.dumps(fields, allow_nan=False)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import cache_store
+
+
+class TestCacheStore(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "api_cache.sqlite3")
+
+    def open(self, **kwargs):
+        store = cache_store.CacheStore(self.path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_keys_and_expiry(self):
+        """Keys ignore param order and the API token; expired entries are misses unless asked for, and purging drops them."""
+        self.assertEqual(cache_store.cache_key("Heroes/Matchups", {"timeframe": "2.55", "hero": "Abathur", "api_token": "secret"}),
+                         cache_store.cache_key("Heroes/Matchups", {"hero": "Abathur", "timeframe": 2.55}))
+        self.assertEqual("Heroes", cache_store.cache_key("Heroes", {"api_token": "secret"}))
+
+        store = self.open()
+        store.put("fresh", {"a": 1}, ttl=60)
+        store.put("stale", {"b": 2}, ttl=60, fetched_at=time.time() - 120)
+        store.put("forever", [3])
+
+        self.assertEqual({"a": 1}, store.get("fresh").value)
+        self.assertIsNone(store.get("stale"))
+        self.assertEqual({"b": 2}, store.get("stale", allow_expired=True).value)
+        self.assertIsNone(store.get("forever").expires_at)
+        self.assertEqual({"fresh", "forever"}, store.fresh_keys(["fresh", "stale", "forever", "missing"]))
+
+        store.purge_expired()
+        self.assertEqual(["forever", "fresh"], sorted(store.keys()))
+
+    def test_lru_eviction_and_chunked_bulk_access(self):
+        """Past max_bytes the least recently read entries go first; bulk reads and writes work past the 500 key chunks."""
+        store = self.open(max_bytes=1000)
+        payload = os.urandom(300)  # ✅ Incompressible, so each entry is a bit over 300 bytes
+        for key in ("a", "b", "c"):
+            store.put(key, payload)
+            time.sleep(0.01)
+        store.get("a")  # "b" is now the least recently read
+        time.sleep(0.01)
+        store.put("d", payload)
+
+        self.assertEqual(["a", "c", "d"], sorted(store.keys()))
+        self.assertLessEqual(store.total_size(), 1000)
+
+        store = self.open(max_bytes=cache_store.DEFAULT_MAX_BYTES)
+        items = {f"key{i:04d}": i for i in range(1201)}
+        store.put_many(items, ttl=60)
+        entries = store.get_many(list(items) + ["missing"])
+        self.assertEqual(items, {key: entry.value for key, entry in entries.items()})
+        self.assertEqual(set(items), set(store.fetched_at_many(items)))
+        self.assertEqual(set(items), store.fresh_keys(items))
+
+
+if __name__ == '__main__':
+    unittest.main()
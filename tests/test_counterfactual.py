@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import counterfactual
+import draft
+import search
+import synthetic_data
+
+
+class TestCounterfactual(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.draft_data = synthetic_data.build_draft_data(seed=4)
+        cls.slots = draft.get_draft_slots(cls.draft_data)
+
+    def test_ban_line_matches_full_replay(self):
+        """Reusing the baseline up to the first affected pick gives the same line as replaying everything."""
+        state = search.as_draft_state(self.draft_data)
+        team_name = self.slots[0][2]
+        pick_slots = counterfactual.pick_slots_of(self.slots)
+        baseline = counterfactual.greedy_line(state, pick_slots)
+
+        for hero in sorted(state["available_heroes"]):
+            state.apply(("Ban", team_name, hero))
+            replayed = counterfactual.greedy_line(state, pick_slots)
+            state.undo()
+            line = counterfactual.ban_line(state, team_name, hero, pick_slots, baseline)
+            self.assertEqual([step[:5] for step in replayed], [step[:5] for step in line], hero)
+
+    def test_suggestions(self):
+        """Ban slots get ranked ban tuples, pick slots fall back to greedy and DRAFT_DATA is left alone."""
+        available_heroes = set(self.draft_data["available_heroes"])
+        suggestions = counterfactual.counterfactual_suggestions(self.draft_data, self.slots, num_suggestions=3)
+
+        self.assertEqual(3, len(suggestions))
+        self.assertEqual(sorted((s[0] for s in suggestions), reverse=True), [s[0] for s in suggestions])
+        self.assertTrue(all(s[2] in available_heroes for s in suggestions))
+        self.assertIn("Swing", suggestions[0][8])
+        self.assertEqual(available_heroes, self.draft_data["available_heroes"])
+        self.assertIsNone(counterfactual.counterfactual_suggestions(self.draft_data, self.slots[4:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
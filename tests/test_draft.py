@@ -1,117 +1,86 @@
-## WIP, doesn't work now.
-
 import unittest
 import sys
 import os
-from unittest.mock import patch
 
 # ✅ Ensure src directory is in sys.path so tests can import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
+import ban
 import draft  # ✅ Import draft as a package
-import utils  # ✅ Import utils as a package
 import load_data  # ✅ Import load_data as a package
+import pick
+import synthetic_data
+import utils  # ✅ Import utils as a package
 
 
 class TestDraftFunctions(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Load hero configuration for all tests."""
-        cls.hero_config = utils.load_hero_config()  # ✅ Now calling from utils
+        """Load one generated draft for all tests."""
+        cls.base_draft_data = synthetic_data.build_draft_data(seed=1)
 
     def setUp(self):
-        """Set up sample draft data for tests."""
-        self.draft_data = {
-            "team_1_name": "Came From Behind",
-            "team_2_name": "Fancy Flightless Fowl",
-            "available_players_team_1": ["HuckIt#1840", "topgun707#1875"],
-            "available_players_team_2": ["Alfie#1948", "Silverbell#11333"],
-            "available_heroes": {"Greymane", "Lucio", "Diablo", "Muradin"},
-            "picked_heroes": set(),
-            "banned_heroes": set(),
-            "team_1_picked_heroes": {},
-            "team_2_picked_heroes": {},
-            "hero_winrates_by_map": {"Towers of Doom": {"Greymane": {"win_rate": 52.0}, "Lucio": {"win_rate": 54.0}}},
-            "hero_matchup_data": {"Greymane": {"Diablo": {"win_rate_as_ally": 50.0, "win_rate_against": 48.0}}},
-            "friendly_player_mmr_data": {"HuckIt#1840": {"Storm League": {"Greymane": {"mmr": 3000}}}},
-            "enemy_player_mmr_data": {"Alfie#1948": {"Storm League": {"Lucio": {"mmr": 2900}}}},
-            "map_name": "Towers of Doom"
-        }
-
-    def test_load_hero_config(self):
-        """Test if hero configuration loads correctly."""
-        config = utils.load_hero_config()  # ✅ Call from utils
-        self.assertIn("hero_roles", config, "Config should contain hero_roles.")
+        """Fresh draft state per test, sharing the loaded data."""
+        self.draft_data = dict(self.base_draft_data)
+        for key in ("available_heroes", "banned_heroes", "picked_heroes"):
+            self.draft_data[key] = set(self.base_draft_data[key])
+        for key in ("available_players_team_1", "available_players_team_2", "draft_log"):
+            self.draft_data[key] = list(self.base_draft_data[key])
+        self.draft_data["team_1_picked_heroes"], self.draft_data["team_2_picked_heroes"] = {}, {}
+        self.draft_data["team_roles"] = {team: dict(roles) for team, roles in self.base_draft_data["team_roles"].items()}
 
     def test_get_hero_roles(self):
-        """Test if hero roles are fetched correctly."""
-        hero_roles = utils.get_hero_roles()  # ✅ Call from utils
+        """Hero roles come from the API with the config overrides applied."""
+        with synthetic_data.synthetic_environment(seed=1):
+            hero_roles = utils.get_hero_roles()  # ✅ Call from utils
         self.assertIn("Uther", hero_roles, "Uther should be in hero roles config.")
+        self.assertEqual(["Tank", "Healer"], hero_roles["Uther"])
+        self.assertTrue(set(synthetic_data.hero_names()) <= set(hero_roles))
 
     def test_execute_draft_phase(self):
-        """Test if execute_draft_phase runs without errors and produces valid logs."""
-        draft.execute_draft_phase(self.draft_data)  # ✅ Call from draft
-        self.assertTrue(len(self.draft_data["draft_log"]) > 0, "Draft log should not be empty after execution.")
+        """A fully automated draft fills every slot with distinct heroes and covers the required roles."""
+        draft.execute_draft_phase(self.draft_data, user_input_enabled=False)  # ✅ Call from draft
+
+        self.assertEqual(len(draft.DRAFT_ORDER), len(self.draft_data["draft_log"]))
+        heroes = [entry[4] if entry[1] == "Pick" else entry[3] for entry in self.draft_data["draft_log"]]
+        self.assertEqual(len(heroes), len(set(heroes)), "No hero should be picked or banned twice.")
+        self.assertEqual(5, len(self.draft_data["team_1_picked_heroes"]))
+        self.assertEqual(5, len(self.draft_data["team_2_picked_heroes"]))
+        for team_roles in self.draft_data["team_roles"].values():
+            self.assertTrue(all(count > 0 for count in team_roles.values()), f"Missing role in {team_roles}")
 
     def test_select_best_pick_with_reason(self):
-        """Test if a pick is correctly chosen based on priority roles."""
-        team_roles = {"Tank": 0, "Offlaner": 0, "Healer": 0}
-        enemy_has_offlaner = False
-        picks, _, _, _, team_roles = draft.select_best_pick_with_reason(
-            self.draft_data["available_players_team_1"],
-            self.draft_data["friendly_player_mmr_data"],
-            self.draft_data["available_heroes"],
-            self.draft_data["picked_heroes"],
-            self.draft_data["banned_heroes"],
-            self.draft_data["hero_winrates_by_map"],
-            self.draft_data["hero_matchup_data"],
-            self.draft_data["map_name"],
-            set(),
-            set(),
-            5,
-            team_roles,
-            self.hero_config,
-            enemy_has_offlaner
-        )
+        """The suggested pick is an available hero for an available player."""
+        picks = pick.select_best_pick_with_reason(self.draft_data, self.draft_data["team_1_name"], 5, num_suggestions=3)
         self.assertTrue(picks, "Should return a valid pick.")
-        self.assertIn(picks[0][1], self.draft_data["available_heroes"], "Pick should be from available heroes.")
-
-    def test_select_best_ban_with_reason(self):
-        """Test if the best ban is chosen based on enemy MMR drop and hero strength."""
-        ally_picked_heroes = set()
-        enemy_picked_heroes = set()
-        suggested_ban, ban_reason, _, _ = draft.select_best_ban_with_reason(
-            self.draft_data["enemy_player_mmr_data"],
-            self.draft_data["hero_winrates_by_map"],
-            self.draft_data["hero_matchup_data"],
-            self.draft_data["banned_heroes"],
-            self.draft_data["available_heroes"],
-            {},
-            self.draft_data["map_name"],
-            ally_picked_heroes,
-            enemy_picked_heroes
-        )
-        self.assertTrue(suggested_ban, "Should return a valid ban hero.")
-
-    def test_calculate_matchup_advantage(self):
-        """Test matchup advantage calculation based on picked heroes."""
-        matchup_advantage = utils.calculate_matchup_advantage("Greymane", self.draft_data["hero_matchup_data"], {"Diablo"}, set())
-        self.assertIsInstance(matchup_advantage, float, "Matchup advantage should be a float value.")
-
-    def test_get_enemy_top_mmr_drop(self):
-        """Test if enemy MMR drop calculation correctly identifies the top MMR player and their fallback hero."""
-        best_player, best_mmr, mmr_drop = utils.get_enemy_top_mmr_drop("Lucio", self.draft_data["enemy_player_mmr_data"], set())
-        self.assertEqual(best_player, "Alfie#1948", "Should correctly identify the player with the highest Lucio MMR.")
-        self.assertGreaterEqual(mmr_drop, 0, "MMR drop should be a non-negative value.")
-
-    @patch('utils.fetch_api_data')
-    def test_load_draft_data(self, mock_fetch_api_data):
-        """Test if load_draft_data correctly fetches and loads data."""
-        mock_fetch_api_data.return_value = {"Greymane": {"win_rate": 52.0}, "Lucio": {"win_rate": 54.0}}
-        draft_data = load_data.load_draft_data(["HuckIt#1840"], ["Alfie#1948"], 1, "Towers of Doom")
+        _, _, player, hero, _, _ = picks[0]
+        self.assertIn(hero, self.draft_data["available_heroes"], "Pick should be from available heroes.")
+        self.assertIn(player, self.draft_data["available_players_team_1"])
+
+    def test_get_ban_suggestions(self):
+        """The suggested ban targets an available hero of an enemy player."""
+        suggestions = ban.get_ban_suggestions(self.draft_data, self.draft_data["team_1_name"], num_suggestions=3)
+        self.assertEqual(3, len(suggestions))
+        self.assertIn(suggestions[0][2], self.draft_data["available_heroes"])
+        self.assertIn(suggestions[0][3], self.draft_data["available_players_team_2"])
+
+    def test_calculate_allied_synergy_score(self):
+        """Synergy is zero before any ally pick and a float after one."""
+        team_name = self.draft_data["team_1_name"]
+        self.assertEqual(0, utils.calculate_allied_synergy_score(self.draft_data, "Hero01", team_name))
+        self.draft_data["team_1_picked_heroes"]["Ally0#1000"] = "Hero02"
+        self.assertIsInstance(utils.calculate_allied_synergy_score(self.draft_data, "Hero01", team_name), float)
+
+    def test_load_and_initialize_draft(self):
+        """Loading from a warm cache builds a complete draft structure for the requested map."""
+        with synthetic_data.synthetic_environment(seed=1):
+            draft_data = load_data.load_and_initialize_draft(map_name="Cursed Hollow")
+        self.assertEqual("Cursed Hollow", draft_data["map_name"])
         self.assertIn("team_1", draft_data, "Draft data should contain 'team_1'.")
-        self.assertIn("hero_winrates_by_map", draft_data, "Draft data should contain 'hero_winrates_by_map'.")
+        self.assertIn("Cursed Hollow", draft_data["hero_winrates_by_map"])
+        self.assertEqual(set(synthetic_data.TEAM_2_TAGS), set(draft_data["team_2_player_mmr_data"]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import draft
+import draft_server
+import synthetic_data
+
+
+def call(url, method="GET", body=None):
+    """Sends a JSON request and returns (status, decoded body)."""
+    data = None if body is None else json.dumps(body).encode()
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestDraftServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with synthetic_data.synthetic_environment(seed=7):
+            cls.server = draft_server.start_server(use_snapshot=False)
+
+        expected = synthetic_data.build_draft_data(seed=7)
+        draft.execute_draft_phase(expected, user_input_enabled=False)
+        cls.expected_heroes = [entry[3] if entry[1] == "Ban" else list(entry[3:5]) for entry in expected["draft_log"]]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def run_session(self, _=None):
+        """Drafts a whole session through the API, always selecting the top suggestion, and returns its final view."""
+        status, session = call(f"{self.server.url}/sessions", "POST", {})
+        self.assertEqual(201, status)
+        session_url = f"{self.server.url}/sessions/{session['session_id']}"
+        while session["next"]:
+            status, suggestions = call(f"{session_url}/suggestions?num=3")
+            self.assertEqual(200, status)
+            self.assertEqual(session["next"]["order"], suggestions["order"])
+            status, session = call(f"{session_url}/select", "POST", {"hero": suggestions["suggestions"][0]["hero"]})
+            self.assertEqual(200, status)
+        return session
+
+    def test_concurrent_sessions_draft_like_automated_draft(self):
+        """Sessions drafted concurrently from warm data each reproduce the automated greedy draft."""
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            sessions = list(executor.map(self.run_session, range(6)))
+
+        self.assertEqual(6, len({session["session_id"] for session in sessions}))
+        for session in sessions:
+            self.assertEqual(self.expected_heroes, [entry[3] if entry[1] == "Ban" else entry[3:5] for entry in session["draft_log"]])
+
+    def test_manual_selection_and_errors(self):
+        """Manual picks need a player, unavailable heroes and unknown sessions are refused, malformed bodies get a 500, closed sessions are gone."""
+        status, session = call(f"{self.server.url}/sessions", "POST", {"first_pick_team": 2})
+        session_url = f"{self.server.url}/sessions/{session['session_id']}"
+        self.assertEqual(synthetic_data.TEAM_2_NAME, session["next"]["team"])
+
+        _, suggestions = call(f"{session_url}/suggestions")
+        suggested_ban = suggestions["suggestions"][1]
+        _, session = call(f"{session_url}/select", "POST", {"hero": suggested_ban["hero"]})
+        self.assertEqual(suggested_ban["reason"], session["draft_log"][0][5])
+        self.assertEqual(409, call(f"{session_url}/select", "POST", {"hero": suggested_ban["hero"]})[0])
+
+        for _ in range(3):
+            _, suggestions = call(f"{session_url}/suggestions")
+            call(f"{session_url}/select", "POST", {"hero": suggestions["suggestions"][0]["hero"]})
+        _, session = call(session_url)
+        _, suggestions = call(f"{session_url}/suggestions?num=5")
+        suggested = {suggestion["hero"] for suggestion in suggestions["suggestions"]}
+        hero = next(hero for hero in synthetic_data.hero_names() if hero not in suggested and hero not in session["banned_heroes"])
+        self.assertEqual(400, call(f"{session_url}/select", "POST", {"hero": hero})[0])
+        status, session = call(f"{session_url}/select", "POST", {"hero": hero, "player": synthetic_data.TEAM_2_TAGS[0][:7]})
+        self.assertEqual(200, status)
+        self.assertEqual(hero, session["team_2_picked_heroes"][synthetic_data.TEAM_2_TAGS[0]])
+
+        self.assertEqual(400, call(f"{self.server.url}/sessions", "POST", {"map_name": "Nowhere"})[0])
+        with self.assertLogs("draft_server", "ERROR"):
+            status, body = call(f"{session_url}/select", "POST", {"hero": ["X"]})
+        self.assertEqual(500, status)
+        self.assertIn("Internal server error", body["error"])
+        self.assertEqual(200, call(session_url, "DELETE")[0])
+        self.assertEqual(404, call(session_url)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import pickle
+import sys
+import os
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import ban
+import pick
+import scoring
+from draft_state import DraftState
+from test_scoring import DRAFT_STEPS, build_draft_data
+
+DYNAMIC_KEYS = [
+    "available_heroes", "picked_heroes", "banned_heroes", "team_1_picked_heroes", "team_2_picked_heroes",
+    "available_players_team_1", "available_players_team_2", "team_roles"
+]
+
+
+class TestDraftState(unittest.TestCase):
+
+    def setUp(self):
+        self.draft_data = build_draft_data(3)
+        self.draft_data["scoring_engine"] = scoring.ScoringEngine(self.draft_data)
+
+    def test_state_drafts_like_dict(self):
+        """Running the same draft on a DraftState and on the dict gives the same suggestions and the same views."""
+        state = DraftState.from_draft_data(self.draft_data)
+
+        for draft_type, order, team in DRAFT_STEPS:
+            team_name = self.draft_data[f"team_{team}_name"]
+            if draft_type == "Ban":
+                self.assertEqual(ban.get_ban_suggestions(self.draft_data, team_name, 5), ban.get_ban_suggestions(state, team_name, 5))
+                ban.execute_ban_phase(order, team_name, False, self.draft_data)
+                ban.execute_ban_phase(order, team_name, False, state)
+            else:
+                self.assertEqual(
+                    pick.select_best_pick_with_reason(self.draft_data, team_name, order, 5),
+                    pick.select_best_pick_with_reason(state, team_name, order, 5)
+                )
+                pick.execute_pick_phase(order, team_name, False, self.draft_data)
+                pick.execute_pick_phase(order, team_name, False, state)
+
+            for key in DYNAMIC_KEYS:
+                self.assertEqual(self.draft_data[key], state[key], key)
+        self.assertEqual(self.draft_data["draft_log"], state["draft_log"])
+
+    def test_undo_restores_state_and_hash(self):
+        state = DraftState.from_draft_data(self.draft_data)
+        views = {key: state[key] for key in DYNAMIC_KEYS}
+        initial_hash = state.hash
+
+        state.apply(("Ban", "Team One", "Hero03"))
+        state.apply(("Pick", "Team Two", "Hero00", "Enemy2#2002", "Tank"))
+        self.assertEqual({"Enemy2#2002": "Hero00"}, state["team_2_picked_heroes"])
+        self.assertEqual(1, state["team_roles"]["Team Two"]["Tank"])
+        state.undo()
+        state.undo()
+
+        self.assertEqual(initial_hash, state.hash)
+        self.assertEqual(views, {key: state[key] for key in DYNAMIC_KEYS})
+
+    def test_hash_is_order_independent_and_copies_are_independent(self):
+        state = DraftState.from_draft_data(self.draft_data)
+        other = state.copy()
+
+        state.apply(("Ban", "Team One", "Hero03"))
+        state.apply(("Ban", "Team Two", "Hero04"))
+        other.apply(("Ban", "Team Two", "Hero04"))
+        self.assertNotEqual(state.hash, other.hash)
+        other.apply(("Ban", "Team One", "Hero03"))
+
+        self.assertEqual(state, other)
+        self.assertEqual(state.hash, pickle.loads(pickle.dumps(state)).hash)
+
+
+if __name__ == '__main__':
+    unittest.main()
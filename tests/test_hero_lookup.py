@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+from unittest import mock
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import ban
+import hero_lookup
+import synthetic_data
+
+HEROES = ["Anub'arak", "E.T.C.", "Jaina", "Johanna", "Kel'Thuzad", "Li Li", "Li-Ming", "Lúcio", "Malfurion", "Malthael", "The Butcher"]
+ROLES = {"Anub'arak": ["Tank"], "E.T.C.": ["Tank"], "Johanna": ["Tank"], "Lúcio": ["Healer"], "Malfurion": ["Healer"], "Li Li": ["Healer"]}
+
+
+class TestHeroLookup(unittest.TestCase):
+
+    def test_lookup(self):
+        """Codes, names, aliases, unique prefixes and typos resolve to available heroes; ambiguous input lists candidates."""
+        lookup = hero_lookup.HeroLookup(HEROES, ROLES, {"KT": "Kel'Thuzad", "Butcher": "The Butcher", "Ghost": "Nova"})
+        available = set(HEROES)
+
+        self.assertEqual("E.T.C.", lookup.lookup("T2", available)[0])
+        self.assertEqual("E.T.C.", lookup.lookup("etc", available)[0])
+        self.assertEqual("Lúcio", lookup.lookup("lucio", available)[0])
+        self.assertEqual("Kel'Thuzad", lookup.lookup("KT", available)[0])
+        self.assertEqual("The Butcher", lookup.lookup("butch", available)[0])
+        self.assertEqual("Li-Ming", lookup.lookup("ming", available)[0])
+        self.assertEqual("Johanna", lookup.lookup("johana", available)[0])
+        self.assertEqual("Kel'Thuzad", lookup.lookup("kelthuzd", available)[0])
+
+        hero, candidates = lookup.lookup("mal", available)
+        self.assertIsNone(hero)
+        self.assertEqual(["Malthael", "Malfurion"], candidates)
+
+        # ✅ Unavailable heroes are never returned, and ambiguity resolves once they are gone
+        available -= {"Malthael", "E.T.C."}
+        self.assertEqual((None, []), lookup.lookup("T2", available))
+        self.assertEqual("Malfurion", lookup.lookup("mal", available)[0])
+        self.assertEqual((None, []), lookup.lookup("zzzz", available))
+
+    def test_interactive_ban_records_selected_suggestion(self):
+        """Choosing the second suggested ban records that ban with its own score and reason."""
+        draft_data = synthetic_data.build_draft_data(seed=8)
+        team_name = draft_data["team_1_name"]
+        suggestions = ban.get_ban_suggestions(draft_data, team_name, num_suggestions=5)
+
+        with mock.patch("builtins.input", return_value=suggestions[1][2]), contextlib.redirect_stdout(io.StringIO()):
+            ban.execute_ban_phase(1, team_name, True, draft_data)
+
+        self.assertEqual((1, "Ban", team_name, suggestions[1][2], suggestions[1][0], suggestions[1][8]), draft_data["draft_log"][0])
+        self.assertIs(draft_data["hero_lookup"], hero_lookup.for_draft(draft_data))
+
+
+if __name__ == '__main__':
+    unittest.main()
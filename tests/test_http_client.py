@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import time
+from unittest import mock
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import http_client
+import mock_server
+import synthetic_data
+import utils
+
+
+class FakeClock:
+    """Clock whose sleeps advance it instantly, recording every sleep."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def test_token_bucket_burst_and_refill(self):
+        """A full bucket lets `capacity` requests through at once, then one per 1 / rate seconds, and never stores more than `capacity`."""
+        clock = FakeClock()
+        bucket = http_client.TokenBucket(rate=4, capacity=8, clock=clock, sleep=clock.sleep)
+        for _ in range(8):
+            bucket.acquire()
+        self.assertEqual([], clock.sleeps)
+
+        for _ in range(4):
+            bucket.acquire()
+        self.assertEqual([0.25] * 4, clock.sleeps)
+        self.assertEqual(101.0, clock.now)
+
+        clock.now += 60  # ✅ A long idle time refills the burst, not more
+        clock.sleeps.clear()
+        for _ in range(9):
+            bucket.acquire()
+        self.assertEqual([0.25], clock.sleeps)
+
+    def test_retries_server_errors_and_throttling(self):
+        """5xx answers are retried `retries` times; 429s wait at least the Retry-After before giving up as RateLimitError."""
+        with mock.patch.object(http_client, "BACKOFF_BASE", 0.01):
+            with synthetic_data.mock_api(error_rate=1.0) as server:
+                with self.assertRaises(http_client.ApiResponseError) as raised:
+                    http_client.get_json(f"{utils.BASE_URL}/Heroes", retries=2)
+                self.assertEqual(500, raised.exception.status_code)
+                self.assertEqual(3, server.snapshot_stats()["server_errors"])
+
+            with synthetic_data.mock_api(throttle_rate=1.0) as server:
+                start = time.perf_counter()
+                with self.assertRaises(http_client.RateLimitError):
+                    http_client.get_json(f"{utils.BASE_URL}/Heroes", retries=1)
+                self.assertGreaterEqual(time.perf_counter() - start, 1.0)
+                self.assertEqual(2, server.snapshot_stats()["throttled"])
+
+    def test_expired_negative_cache_is_refetched(self):
+        """A cached 404 is served without a request until NEGATIVE_CACHE_TTL passes, then the data is fetched again."""
+        endpoint, params = utils.player_hero_request("Late#1234")
+        with synthetic_data.mock_api() as server, synthetic_data.synthetic_environment(warm=False), \
+                mock.patch.object(utils, "NEGATIVE_CACHE_TTL", 0.5), contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(2):
+                with self.assertRaises(http_client.NotFoundError):
+                    utils.fetch_api_data(endpoint, params)
+            self.assertEqual(1, server.snapshot_stats()["requests"])
+
+            server.responses[mock_server.normalized_key(endpoint, params)] = {"Storm League": {}}
+            time.sleep(0.6)
+            self.assertEqual({"Storm League": {}}, utils.fetch_api_data(endpoint, params))
+            self.assertEqual(2, server.snapshot_stats()["requests"])
+
+    def test_bulk_refetches_expired_negative_cache(self):
+        """fetch_api_data_bulk also treats an expired 404 as a miss and fetches it before answering."""
+        endpoint, params = utils.player_hero_request("Late#1234")
+        with synthetic_data.mock_api() as server, synthetic_data.synthetic_environment(warm=False), \
+                mock.patch.object(utils, "NEGATIVE_CACHE_TTL", 0.5), contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual([None, None], utils.fetch_api_data_bulk([(endpoint, params)] * 2, missing_ok=True))
+            self.assertEqual([None], utils.fetch_api_data_bulk([(endpoint, params)], missing_ok=True))
+            self.assertEqual(1, server.snapshot_stats()["requests"])
+
+            server.responses[mock_server.normalized_key(endpoint, params)] = {"Storm League": {}}
+            time.sleep(0.6)
+            self.assertEqual([{"Storm League": {}}], utils.fetch_api_data_bulk([(endpoint, params)]))
+            self.assertEqual(2, server.snapshot_stats()["requests"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import draft
+import instrumentation
+import synthetic_data
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_records_nothing(self):
+        """Spans are shared no-ops while instrumentation is off."""
+        with instrumentation.span("synergy"), instrumentation.step("Pick 5") as timings:
+            pass
+        self.assertIsNone(timings)
+        self.assertEqual([], instrumentation.summary())
+
+    def test_profiled_draft(self):
+        """A profiled draft attaches component timings to every step and writes folded stacks."""
+        draft_data = synthetic_data.build_draft_data(seed=2)
+        instrumentation.enable(allocations=False)
+        draft.execute_draft_phase(draft_data, user_input_enabled=False)
+
+        step_timings = draft_data["step_timings"]
+        self.assertEqual([order for _, order in draft.DRAFT_ORDER], sorted(step_timings))
+        self.assertIn("synergy", step_timings[5]["components"])
+        self.assertIn("pool_sizes", step_timings[1]["components"])
+        self.assertGreater(step_timings[5]["components"]["counter"]["calls"], 0)
+
+        names = {row[0] for row in instrumentation.summary()}
+        self.assertTrue({"draft", "map_bonus", "synergy", "counter", "pool_sizes", "sorting"} <= names)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = instrumentation.write_folded(os.path.join(directory, "draft.folded"))
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertTrue(lines)
+        self.assertTrue(all(line.startswith("draft") and line.rsplit(" ", 1)[1].isdigit() for line in lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+import queue
+import tempfile
+import time
+from types import SimpleNamespace
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import live_monitor
+import synthetic_data
+
+LOBBY_TAGS = synthetic_data.TEAM_1_TAGS + synthetic_data.TEAM_2_TAGS
+
+
+def file_event(event_type, path):
+    return SimpleNamespace(event_type=event_type, src_path=path, is_directory=False)
+
+
+class TestLiveMonitor(unittest.TestCase):
+
+    def test_debounced_events_queue_one_lobby(self):
+        """A burst of write events is read once after it settles; the same lobby seen again is not queued twice."""
+        with tempfile.TemporaryDirectory() as lobby_dir:
+            monitor = live_monitor.LiveMonitor(battle_lobby_path=lobby_dir, storm_save_path=lobby_dir, debounce=0.05)
+            path = os.path.join(lobby_dir, "replay.server.battlelobby")
+
+            with open(path, "wb") as f:
+                monitor.battle_lobby_handler.dispatch(file_event("created", path))
+                for tag in LOBBY_TAGS:
+                    f.write(b"\x00\x17" + tag.encode() + b"\x04\x00")
+                    f.flush()
+                    monitor.battle_lobby_handler.dispatch(file_event("modified", path))
+            monitor.battle_lobby_handler.dispatch(file_event("modified", os.path.join(lobby_dir, "ignored.txt")))
+
+            lobby = monitor.lobby_queue.get(timeout=5)
+            self.assertEqual(LOBBY_TAGS, lobby.battletags)
+            self.assertEqual("battlelobby", lobby.source)
+
+            monitor.storm_save_handler.dispatch(file_event("created", path.replace(".battlelobby", ".StormSave")))
+            monitor.battle_lobby_handler.dispatch(file_event("modified", path))
+            time.sleep(0.2)
+            self.assertTrue(monitor.lobby_queue.empty())
+
+    def test_prefetcher_prepares_draft(self):
+        """A detected lobby becomes an initialized draft of the lobby's two teams."""
+        expected = synthetic_data.build_draft_data(seed=9)
+        with synthetic_data.synthetic_environment(seed=9):
+            lobby_queue = queue.Queue()
+            prefetcher = live_monitor.LobbyPrefetcher(lobby_queue).start()
+            lobby_queue.put(live_monitor.LobbyDetected("lobby.battlelobby", "battlelobby", LOBBY_TAGS))
+            draft_data = prefetcher.ready_queue.get(timeout=30)
+            prefetcher.close()
+
+        self.assertEqual(expected["available_players_team_1"], draft_data["available_players_team_1"])
+        self.assertEqual(expected["team_2_player_mmr_data"], draft_data["team_2_player_mmr_data"])
+        self.assertEqual(expected["map_name"], draft_data["map_name"])
+
+    def test_prefetcher_needs_a_team_split(self):
+        """Tags on neither team_config roster are only split into teams by confirm_teams."""
+        expected = synthetic_data.build_draft_data(seed=9)
+        with synthetic_data.synthetic_environment(seed=9):
+            sys.modules["team_config"] = synthetic_data.team_config_module(team_1_tags=[], team_2_tags=[])
+            prefetcher = live_monitor.LobbyPrefetcher(queue.Queue())
+            with self.assertRaises(ValueError):
+                prefetcher.prepare(LOBBY_TAGS)
+
+            asked = []
+            prefetcher.confirm_teams = lambda tags: asked.append(tags) or (tags[:5], tags[5:])
+            draft_data = prefetcher.prepare(LOBBY_TAGS)
+            prefetcher.close()
+
+        self.assertEqual([LOBBY_TAGS], asked)
+        self.assertEqual(expected["available_players_team_1"], draft_data["available_players_team_1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
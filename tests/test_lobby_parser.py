@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import lobby_parser
+
+# ✅ Synthetic: tags planted among random bytes in an assumed layout, not a captured lobby file, so it
+# checks the scanner but not where a real file keeps its players
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "ranked.battlelobby")
+TEAM_1 = ["Ally0#1000", "Ally1#1001", "Ally2#1002", "Ally3#1003", "Ally4#1004"]
+TEAM_2 = ["Enemy0#2000", "Enemy1#2001", "Jõgi#21345", "Enemy3#2003", "Enemy4#2004"]
+
+
+class TestLobbyParser(unittest.TestCase):
+
+    def test_parse_fixture(self):
+        """The fixture's length-prefixed tags come back once each, in file order, without noise; rosters split them into teams."""
+        players = lobby_parser.parse_battletags(FIXTURE)
+        self.assertEqual(list(range(10)), [player.index for player in players])
+        battletags = [player.battletag for player in players]
+        self.assertEqual(TEAM_1 + TEAM_2, battletags)
+        self.assertEqual((TEAM_1[::-1], TEAM_2[::-1]), lobby_parser.team_tags(battletags[::-1], TEAM_1, TEAM_2))
+        with self.assertRaises(ValueError):
+            lobby_parser.team_tags(battletags, TEAM_1, TEAM_2[1:])
+
+        start = time.perf_counter()
+        for _ in range(10):
+            lobby_parser.parse_battletags(FIXTURE)
+        self.assertLess((time.perf_counter() - start) / 10, 0.01)
+
+    def test_unframed_tags_and_empty_files(self):
+        """Without length prefixes every well formed tag counts; malformed tags never do; empty files have no players."""
+        data = b"\x00Ally0#1000\x00\xffx#1234\x00Ab#12\x009Digit#1234\x00Ally1#1001\x00Ally0#1000\x00Tag#1234567\x00"
+        self.assertEqual(["Ally0#1000", "Ally1#1001"], lobby_parser.scan_battletags(data))
+
+        # ✅ One length-prefixed noise tag doesn't hide the unframed ones; repeated tags outrank single ones
+        real = TEAM_1 + TEAM_2
+        data = b"\x00".join(tag.encode() for tag in real * 2) + b"\x00Stray#5555\x00\x0bNoise1#2345\x00"
+        self.assertEqual(["Ally0#1000", "Ally1#1001", "Ally2#1002", "Ally3#1003", "Ally4#1004", "Enemy0#2000",
+                          "Enemy1#2001", "Jõgi#21345", "Enemy3#2003", "Noise1#2345"], lobby_parser.scan_battletags(data))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "empty.battlelobby")
+            open(path, "wb").close()
+            self.assertEqual([], lobby_parser.parse_battletags(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
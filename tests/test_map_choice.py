@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import load_data
+import map_choice
+import pick
+import synthetic_data
+
+
+class TestMapChoice(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.draft_data = synthetic_data.build_draft_data(seed=5)
+
+    def test_switch_map_matches_fresh_load(self):
+        """A switched draft suggests exactly what a draft loaded for that map suggests."""
+        switched = load_data.switch_map(self.draft_data, "Cursed Hollow")
+        fresh = synthetic_data.build_draft_data(seed=5, map_name="Cursed Hollow")
+
+        self.assertIs(self.draft_data["scoring_engine"], switched["scoring_engine"])
+        self.assertEqual("Towers of Doom", self.draft_data["map_name"])
+        self.assertEqual(
+            pick.select_best_pick_with_reason(fresh, fresh["team_1_name"], 5, num_suggestions=5),
+            pick.select_best_pick_with_reason(switched, switched["team_1_name"], 5, num_suggestions=5)
+        )
+
+    def test_compare_maps(self):
+        """Every map of the patch is ranked, best draft advantage first."""
+        rows = map_choice.compare_maps(self.draft_data)
+        self.assertEqual(set(synthetic_data.MAPS), {row["map"] for row in rows})
+        advantages = [row["draft_advantage"] for row in rows]
+        self.assertEqual(sorted(advantages, reverse=True), advantages)
+        self.assertEqual(3, len(rows[0]["top_heroes"]))
+
+        rows = map_choice.compare_maps(self.draft_data, self.draft_data["team_2_name"], mock_drafts=False)
+        self.assertIsNone(rows[0]["draft_advantage"])
+        self.assertGreaterEqual(rows[0]["roster_advantage"], rows[-1]["roster_advantage"])
+
+
+if __name__ == '__main__':
+    unittest.main()
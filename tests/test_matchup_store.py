@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+import pickle
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import cache_store
+import draft
+import load_data
+import matchup_store
+import mock_server
+import synthetic_data
+import utils
+
+
+class TestLazyMatchupStore(unittest.TestCase):
+
+    def test_rows_load_on_access(self):
+        """Rows load on first access, heroes without data read as missing, pickling keeps the loaded rows."""
+        with synthetic_data.synthetic_environment(seed=6, num_heroes=20, heroes_per_player=10):
+            heroes = synthetic_data.hero_names(20)
+            # ✅ A cached 404, as the fetch layer stores it
+            utils.get_cache_store().put(cache_store.cache_key(*utils.hero_matchup_request("Missing Hero", "major", "2.55")), None)
+            store = matchup_store.LazyMatchupStore(heroes + ["Missing Hero"], "major", "2.55")
+            self.assertEqual(0, store.loaded_count())
+
+            self.assertIn("Hero02", store["Hero01"])
+            self.assertEqual(1, store.loaded_count())
+            self.assertEqual({}, store.get("Missing Hero", {}))
+            self.assertNotIn("Unknown Hero", store)
+
+            restored = pickle.loads(pickle.dumps(store))
+            self.assertEqual(2, restored.loaded_count())
+            self.assertEqual(store["Hero01"], restored["Hero01"])
+            self.assertEqual(20, len(restored))
+
+    def test_lazy_draft_matches_eager_draft(self):
+        """A cold lazy load suggests immediately, requests every matchup once and drafts exactly like an eager load."""
+        eager = synthetic_data.build_draft_data(seed=6)
+        draft.execute_draft_phase(eager, user_input_enabled=False)
+
+        with synthetic_data.mock_api(mock_server.generated_responses(seed=6)) as server, synthetic_data.synthetic_environment(warm=False):
+            lazy = load_data.load_and_initialize_draft(use_snapshot=False, lazy_matchups=True)
+            self.assertIsInstance(lazy["hero_matchup_data"], matchup_store.LazyMatchupStore)
+            draft.execute_draft_phase(lazy, user_input_enabled=False)
+            lazy["hero_matchup_data"].wait()
+            stats = server.snapshot_stats()
+
+        self.assertEqual(eager["draft_log"], lazy["draft_log"])
+        self.assertEqual(len(synthetic_data.hero_names()), stats["by_endpoint"]["Heroes/Matchups"])
+
+
+if __name__ == '__main__':
+    unittest.main()
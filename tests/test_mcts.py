@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+import re
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import draft
+import mcts
+import search
+import synthetic_data
+
+
+class EmptySlotSearch(mcts.MonteCarloTreeSearch):
+    """MCTS where the second slot has nothing to ban or pick."""
+
+    def _moves(self, index):
+        return [] if index == 1 else super()._moves(index)
+
+
+class TestMonteCarloTreeSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.draft_data = synthetic_data.build_draft_data(seed=2)
+        self.slots = draft.get_draft_slots(self.draft_data)
+
+    def test_tree_moves_match_their_slot(self):
+        """Every tree node's moves belong to its slot, also below an empty slot, and the backend only suggests legal moves."""
+        tree = EmptySlotSearch(self.draft_data, self.slots, seed=3)
+        tree.run(0.3)
+
+        nodes = [tree.root]
+        while nodes:
+            node = nodes.pop()
+            for child in node.children:
+                self.assertNotEqual(1, node.slot)
+                draft_type, _, team_name = self.slots[node.slot]
+                self.assertEqual((draft_type, team_name), child.move[:2])
+            nodes += node.children
+        self.assertTrue(any(child.children for child in tree.root.children))
+
+        slots = self.slots[4:]
+        legal = {suggestion for _, _, suggestion in search.candidate_moves(search.as_draft_state(self.draft_data), slots[0])}
+        suggestions = mcts.mcts_suggestions(self.draft_data, slots, time_limit=0.3, max_workers=2)
+        self.assertTrue(suggestions)
+        for suggestion in suggestions:
+            self.assertIn(suggestion[:-1], {move[:-1] for move in legal})
+
+    def test_statistics_merge_by_move(self):
+        """Root statistics of independent trees are summed per move."""
+        trees = [mcts.MonteCarloTreeSearch(self.draft_data, self.slots[4:], seed=seed).run(0.2) for seed in (0, 1)]
+        merged = mcts.merge_statistics(trees)
+
+        self.assertEqual(set(trees[0]) | set(trees[1]), set(merged))
+        for move, (visits, total_value) in merged.items():
+            self.assertEqual(sum(tree.get(move, (0, 0.0))[0] for tree in trees), visits)
+            self.assertAlmostEqual(sum(tree.get(move, (0, 0.0))[1] for tree in trees), total_value)
+
+    def test_reason_reports_visits_and_mean_value(self):
+        """Suggestions are ranked by merged visits, and each reason ends with its visits and mean value."""
+        suggestions = mcts.mcts_suggestions(self.draft_data, self.slots[4:], time_limit=0.3, max_workers=2)
+        statistics = [re.search(r", MCTS Visits: (\d+), Mean Value: ([+-]\d+\.\d{2})$", suggestion[-1]) for suggestion in suggestions]
+        self.assertTrue(all(statistics), [suggestion[-1] for suggestion in suggestions])
+
+        visits = [int(match.group(1)) for match in statistics]
+        self.assertEqual(sorted(visits, reverse=True), visits)
+        self.assertGreater(visits[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
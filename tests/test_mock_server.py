@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import http_client
+import load_data
+import synthetic_data
+import utils
+
+
+class TestMockServer(unittest.TestCase):
+
+    def test_cold_load_through_server(self):
+        """A cold load requests every response once from the server, a second load is served from the cache."""
+        with synthetic_data.mock_api() as server, synthetic_data.synthetic_environment(warm=False):
+            draft_data = load_data.load_and_initialize_draft(use_snapshot=False)
+            requests_after_cold_load = server.snapshot_stats()["requests"]
+            load_data.load_and_initialize_draft(use_snapshot=False)
+            stats = server.snapshot_stats()
+
+        expected = synthetic_data.build_draft_data()
+        self.assertEqual(expected["hero_winrates_by_map"], draft_data["hero_winrates_by_map"])
+        self.assertEqual(expected["team_1_player_mmr_data"], draft_data["team_1_player_mmr_data"])
+        self.assertEqual(requests_after_cold_load, stats["requests"])
+        self.assertEqual(len(synthetic_data.hero_names()), stats["by_endpoint"]["Heroes/Matchups"])
+
+    def test_quota_and_errors(self):
+        """Exhausted quota, server errors and unknown resources surface as the typed API errors."""
+        with synthetic_data.mock_api(quota=1) as server:
+            utils.request_api_data("Heroes")
+            with self.assertRaises(http_client.QuotaExhaustedError):
+                utils.request_api_data("Heroes")
+            self.assertEqual(1, server.snapshot_stats()["quota_exhausted"])
+
+        with synthetic_data.mock_api(error_rate=1.0):
+            with self.assertRaises(http_client.ApiResponseError):
+                http_client.get_json(f"{utils.BASE_URL}/Heroes", retries=0)
+
+        with synthetic_data.mock_api():
+            with self.assertRaises(http_client.NotFoundError):
+                utils.request_api_data("matches/12345")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+import importlib.util
+import threading
+import time
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import draft_screen_scraper
+import ocr_pipeline
+
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+
+class TestOcrPipeline(unittest.TestCase):
+
+    def test_regions_and_tag_parsing(self):
+        """Blue team slots get a label region inside the image, uncalibrated red ones none; OCR noise around a BattleTag is tolerated."""
+        self.assertEqual(10, len(ocr_pipeline.PLAYER_REGIONS))
+        self.assertEqual([None] * 5, ocr_pipeline.PLAYER_REGIONS[5:])
+        for left, top, right, bottom in ocr_pipeline.PLAYER_REGIONS[:5]:
+            self.assertTrue(0 <= left < right <= 1 and 0 <= top < bottom <= 1)
+        self.assertEqual((0, 0, 192, 108), ocr_pipeline.crop_box((1920, 1080), (0.0, 0.0, 0.1, 0.1)))
+
+        self.assertEqual("Ally0#1000", ocr_pipeline.parse_battletag("| Ally0 # 1000\n"))
+        self.assertEqual("Jõgi#21345", ocr_pipeline.parse_battletag("Jõgi#21345"))
+        self.assertIsNone(ocr_pipeline.parse_battletag("Ally0#1234567"))
+        self.assertIsNone(ocr_pipeline.parse_battletag(""))
+
+    @unittest.skipUnless(HAS_PIL, "Pillow is not installed")
+    def test_parallel_cached_ocr(self):
+        """All ten given regions are OCRed concurrently, once; the same screen again is answered from the cache."""
+        from PIL import Image, ImageDraw
+
+        # ✅ Stand-in for calibrated regions; these only check the pipeline, not where labels really are
+        regions = [ocr_pipeline.label_region(x, y) for x, y in draft_screen_scraper.PLAYER_POSITIONS]
+        image = Image.new("RGB", (640, 360), (20, 20, 40))
+        draw = ImageDraw.Draw(image)
+        for slot, region in enumerate(regions):
+            left, top, right, bottom = ocr_pipeline.crop_box(image.size, region)
+            draw.rectangle((left + 2, top + 2, left + 6 + 3 * slot, bottom - 2), fill=(230, 230, 230))
+
+        pipeline = ocr_pipeline.OcrPipeline(regions, ocr=lambda crop: None)
+        slots = {ocr_pipeline.image_hash(crop): slot for slot, crop in enumerate(pipeline.crops(image))}
+        self.assertEqual(10, len(slots))
+
+        calls, active, peak = [], [0], [0]
+        lock = threading.Lock()
+
+        def fake_ocr(crop):
+            with lock:
+                calls.append(crop)
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return f"Player{slots[ocr_pipeline.image_hash(crop)]} #{1000 + slots[ocr_pipeline.image_hash(crop)]}"
+
+        pipeline.ocr = fake_ocr
+        expected = [f"Player{slot}#{1000 + slot}" for slot in range(10)]
+        self.assertEqual(expected, pipeline.battletags(image))
+        self.assertEqual(10, len(calls))
+        self.assertGreater(peak[0], 1)
+
+        self.assertEqual((expected[:5], expected[5:]), pipeline.team_tags(image.copy()))
+        self.assertEqual(10, len(calls))
+        pipeline.close()
+
+        default = ocr_pipeline.OcrPipeline(ocr=fake_ocr)
+        self.assertEqual(expected[:5] + [None] * 5, default.battletags(image))
+        self.assertEqual((expected[:5], []), default.team_tags(image))
+        default.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import time
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import cache_store
+import mock_server
+import player_refresh
+import synthetic_data
+import utils
+
+TAGS = synthetic_data.TEAM_1_TAGS + synthetic_data.TEAM_2_TAGS
+DAY = 24 * 3600
+
+
+class TestPlayerRefresh(unittest.TestCase):
+
+    def test_merge_hero_data(self):
+        """Fresh stats overwrite stored ones, heroes missing from the response are kept, and only real changes are reported."""
+        old = {"Storm League": {"Abathur": {"mmr": 2500, "games_played": 10}, "Alarak": {"mmr": 2600, "games_played": 5}}}
+        new = {"Storm League": {"Abathur": {"mmr": 2550, "games_played": 12}, "Alarak": {"mmr": 2600, "games_played": 5},
+                                "Ana": {"mmr": 2400, "games_played": 1}}}
+        merged, changes = player_refresh.merge_hero_data(old, new)
+
+        self.assertEqual({"Abathur": {"mmr": 2550, "games_played": 12}, "Alarak": {"mmr": 2600, "games_played": 5},
+                          "Ana": {"mmr": 2400, "games_played": 1}}, merged["Storm League"])
+        self.assertEqual([player_refresh.HeroChange("Abathur", 2500, 2550, 10, 12), player_refresh.HeroChange("Ana", None, 2400, None, 1)], changes)
+
+        merged, changes = player_refresh.merge_hero_data(old, {"Storm League": {}})
+        self.assertEqual(old, merged)
+        self.assertEqual([], changes)
+
+    def test_refreshes_only_stale_players(self):
+        """Only players older than the max age are refetched; their new MMRs are merged into the cache and reported."""
+        with synthetic_data.mock_api(mock_server.generated_responses(seed=1)) as server, synthetic_data.synthetic_environment(seed=0):
+            store = utils.get_cache_store()
+            old_requests = [utils.player_hero_request(tag) for tag in synthetic_data.TEAM_1_TAGS]
+            old_data = {tag: store.get(cache_store.cache_key(*request)).value for tag, request in zip(synthetic_data.TEAM_1_TAGS, old_requests)}
+            store.put_many({cache_store.cache_key(*request): old_data[tag] for tag, request in zip(synthetic_data.TEAM_1_TAGS, old_requests)},
+                           fetched_at=time.time() - 3 * DAY)
+
+            self.assertEqual(synthetic_data.TEAM_1_TAGS, player_refresh.stale_players(TAGS, max_age=DAY))
+            results = player_refresh.refresh_players(TAGS, max_age=DAY)
+
+            self.assertEqual(["refreshed"] * 5 + ["fresh"] * 5, [result.status for result in results])
+            self.assertEqual(10, server.snapshot_stats()["requests"])
+            self.assertEqual([], player_refresh.stale_players(TAGS, max_age=DAY))
+
+            tag = synthetic_data.TEAM_1_TAGS[0]
+            new_data = utils.get_player_hero_data([tag])[tag]["Storm League"]
+            fetched = server.responses[mock_server.normalized_key(*utils.player_hero_request(tag))]["Storm League"]
+            self.assertEqual({**old_data[tag]["Storm League"], **fetched}, new_data)
+            self.assertTrue(results[0].changes)
+            self.assertIn(f"✅ {tag}: refreshed", player_refresh.format_report(results))
+
+    def test_failed_hero_data_keeps_the_profile(self):
+        """When a player's hero data request fails, their freshly fetched profile is still stored."""
+        tag = synthetic_data.TEAM_1_TAGS[0]
+        responses = mock_server.generated_responses(seed=1)
+        del responses[mock_server.normalized_key(*utils.player_hero_request(tag))]
+        with synthetic_data.mock_api(responses), synthetic_data.synthetic_environment(seed=0):
+            store = utils.get_cache_store()
+            hero_key = cache_store.cache_key(*utils.player_hero_request(tag))
+            profile_key = cache_store.cache_key(*utils.ngs_profile_request(tag))
+            store.put_many({hero_key: store.get(hero_key).value, profile_key: store.get(profile_key).value}, fetched_at=time.time() - 3 * DAY)
+
+            result, = player_refresh.refresh_players([tag], max_age=DAY)
+            self.assertEqual("failed", result.status)
+            self.assertEqual(responses[mock_server.normalized_key(*utils.ngs_profile_request(tag))], store.get(profile_key).value)
+            self.assertGreater(store.fetched_at_many([profile_key])[profile_key], time.time() - DAY)
+
+
+if __name__ == '__main__':
+    unittest.main()
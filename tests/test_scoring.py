@@ -0,0 +1,124 @@
+import unittest
+import random
+import sys
+import os
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import ban
+import pick
+import scoring
+
+DRAFT_STEPS = [
+    ("Ban", 1, 1), ("Ban", 2, 2), ("Ban", 3, 1), ("Ban", 4, 2),
+    ("Pick", 5, 1), ("Pick", 6, 2), ("Pick", 7, 2), ("Pick", 8, 1), ("Pick", 9, 1),
+    ("Ban", 10, 2), ("Ban", 11, 1),
+    ("Pick", 12, 2), ("Pick", 13, 2), ("Pick", 14, 1), ("Pick", 15, 1), ("Pick", 16, 2)
+]
+
+
+def build_draft_data(seed):
+    """Builds a random but fully populated DRAFT_DATA dict."""
+    rng = random.Random(seed)
+    roles = ["Tank", "Healer", "Bruiser", "Ranged Assassin", "Melee Assassin", "Support"]
+    heroes = [f"Hero{i:02d}" for i in range(40)]
+    hero_roles = {hero: [roles[i % len(roles)]] for i, hero in enumerate(heroes)}
+    hero_roles["Hero05"] = ["Tank", "Healer"]
+
+    hero_matchup_data = {
+        hero: {
+            other: {
+                "ally": {"win_rate_as_ally": f"{rng.uniform(40, 60):.2f}"},
+                "enemy": {"win_rate_against": f"{rng.uniform(40, 60):.2f}"}
+            }
+            for other in heroes if other != hero and rng.random() < 0.8
+        }
+        for hero in heroes
+    }
+    hero_winrates_by_map = {"Towers of Doom": {hero: {"win_rate": round(rng.uniform(42, 58), 2)} for hero in heroes}}
+
+    def player_mmr_data(tags):
+        return {
+            tag: {"Storm League": {hero: {"mmr": round(rng.uniform(2000, 3400), 3), "games_played": rng.randint(1, 90)}
+                                   for hero in rng.sample(heroes, 25)}}
+            for tag in tags
+        }
+
+    team_1_tags = [f"Ally{i}#100{i}" for i in range(5)]
+    team_2_tags = [f"Enemy{i}#200{i}" for i in range(5)]
+    required_roles = ["Tank", "Healer", "Offlaner"]
+
+    return {
+        "map_name": "Towers of Doom",
+        "hero_matchup_data": hero_matchup_data,
+        "hero_winrates_by_map": hero_winrates_by_map,
+        "team_1_player_mmr_data": player_mmr_data(team_1_tags),
+        "team_2_player_mmr_data": player_mmr_data(team_2_tags),
+        "available_heroes": set(heroes) - {"Hero39"},
+        "team_1_name": "Team One",
+        "team_2_name": "Team Two",
+        "available_players_team_1": team_1_tags[:],
+        "available_players_team_2": team_2_tags[:],
+        "draft_log": [],
+        "banned_heroes": set(),
+        "picked_heroes": set(),
+        "team_1_picked_heroes": {},
+        "team_2_picked_heroes": {},
+        "hero_roles": hero_roles,
+        "forbidden_heroes": {"Hero39"},
+        "required_roles": set(required_roles),
+        "role_limits": {"Tank": 1, "Healer": 1},
+        "role_pick_restrictions": {"Offlaner": "late"},
+        "hero_pick_restrictions": {"Hero01": "middle", "Hero07": "late"},
+        "team_roles": {
+            "Team One": {role: 0 for role in required_roles},
+            "Team Two": {role: 0 for role in required_roles}
+        }
+    }
+
+
+class TestScoringEngine(unittest.TestCase):
+
+    def test_suggestions_match_dict_scoring(self):
+        """Engine suggestions must be identical to the dict-based scoring at every step of a draft."""
+        for seed in range(5):
+            draft_data = build_draft_data(seed)
+            engine = scoring.ScoringEngine(draft_data)
+
+            for draft_type, order, team in DRAFT_STEPS:
+                team_name = draft_data[f"team_{team}_name"]
+
+                if draft_type == "Ban":
+                    expected = ban.get_ban_suggestions(draft_data, team_name, num_suggestions=5)
+                    actual = engine.ban_suggestions(draft_data, team_name, num_suggestions=5)
+                    self.assertEqual(expected, actual)
+                    ban.execute_ban_phase(order, team_name, False, draft_data)
+                else:
+                    expected = pick.select_best_pick_with_reason(draft_data, team_name, order, num_suggestions=5)
+                    actual = engine.pick_suggestions(draft_data, team_name, order, num_suggestions=5)
+                    self.assertEqual(expected, actual)
+                    pick.execute_pick_phase(order, team_name, False, draft_data)
+
+    def test_engine_is_used_when_present(self):
+        """select_best_pick_with_reason delegates to the engine stored in DRAFT_DATA."""
+        draft_data = build_draft_data(7)
+        expected = pick.select_best_pick_with_reason(draft_data, "Team One", 5, num_suggestions=3)
+        draft_data["scoring_engine"] = scoring.ScoringEngine(draft_data)
+        self.assertEqual(expected, pick.select_best_pick_with_reason(draft_data, "Team One", 5, num_suggestions=3))
+
+    def test_matchup_totals_extend_previous_picks(self):
+        """Running totals add one row per pick and equal a sum over the picked heroes in pick order."""
+        engine = scoring.ScoringEngine(build_draft_data(2))
+        picked = ["Hero04", "Hero11", "Hero20"]
+
+        total, rounded = engine.matchup_totals(engine.ally_rows, picked)
+        expected = sum((engine.ally_matrix[:, engine.hero_index[hero]] for hero in picked), start=[0.0] * len(engine.heroes))
+        self.assertEqual(list(expected), total.tolist())
+        self.assertEqual([round(value, 2) for value in expected], rounded.tolist())
+        self.assertIs(engine.matchup_totals(engine.ally_rows, picked[:2])[0], engine._matchup_totals[(True, tuple(picked[:2]))][0])
+        self.assertEqual(4, len(engine._matchup_totals))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import ban
+import draft
+import pick
+import search
+import synthetic_data
+
+BRANCHING = 3
+
+
+def minimax(state, slots, index, root_team):
+    """Plain minimax over every candidate move of `slots[index:]`, without pruning or a transposition table."""
+    if index >= len(slots):
+        return 0.0
+    moves = search.candidate_moves(state, slots[index], BRANCHING)
+    if not moves:
+        return minimax(state, slots, index + 1, root_team)
+
+    maximizing = slots[index][2] == root_team
+    values = []
+    for move, value, _ in moves:
+        token = search.apply_move(state, move)
+        try:
+            values.append((value if maximizing else -value) + minimax(state, slots, index + 1, root_team))
+        finally:
+            search.undo_move(state, move, token)
+    return max(values) if maximizing else min(values)
+
+
+class TestAlphaBetaSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.draft_data = synthetic_data.build_draft_data(seed=2)
+        slots = draft.get_draft_slots(self.draft_data)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for draft_type, order, team_name in slots[:6]:
+                if draft_type == "Ban":
+                    ban.execute_ban_phase(order, team_name, False, self.draft_data)
+                else:
+                    pick.execute_pick_phase(order, team_name, False, self.draft_data)
+        self.slots = slots[6:]
+
+    def test_matches_minimax(self):
+        """With time to search every slot, each root move's value equals plain minimax, so pruning and the table's bounds lose nothing."""
+        suggestions = search.AlphaBetaSearch(self.draft_data, self.slots, time_limit=60, branching=BRANCHING).run()
+        self.assertTrue(suggestions)
+
+        state = search.as_draft_state(self.draft_data)
+        expected = {}
+        for move, value, suggestion in search.candidate_moves(state, self.slots[0], BRANCHING):
+            token = search.apply_move(state, move)
+            try:
+                expected[suggestion[:-1]] = value + minimax(state, self.slots, 1, self.slots[0][2])
+            finally:
+                search.undo_move(state, move, token)
+
+        for suggestion in suggestions:
+            match = re.search(r"Search Value: ([+-]\d+\.\d{2}) \(depth (\d+),", suggestion[-1])
+            self.assertEqual(len(self.slots), int(match.group(2)))
+            self.assertAlmostEqual(expected[suggestion[:-1]], float(match.group(1)), delta=0.006)
+        values = [expected[suggestion[:-1]] for suggestion in suggestions]
+        self.assertEqual(sorted(values, reverse=True), values)
+
+    def test_transposition_bounds(self):
+        """Narrow windows fail soft on the right side of the minimax value, and their stored bounds never pass for exact values."""
+        exact = minimax(search.as_draft_state(self.draft_data), self.slots, 0, self.slots[0][2])
+        alpha_beta = search.AlphaBetaSearch(self.draft_data, self.slots, branching=BRANCHING)
+        alpha_beta.deadline = math.inf
+
+        # ✅ One instance for every window, so later searches start from the bounds stored by earlier ones
+        for alpha, beta in ((exact + 10, exact + 20), (exact - 20, exact - 10), (exact - 5, exact + 5), (-math.inf, math.inf)):
+            value = alpha_beta._search(0, len(self.slots), alpha, beta)
+            if value <= alpha:
+                self.assertLessEqual(exact, value + 1e-6)
+            elif value >= beta:
+                self.assertGreaterEqual(exact, value - 1e-6)
+            else:
+                self.assertAlmostEqual(exact, value, places=6)
+            self.assertEqual(alpha < exact < beta, alpha < value < beta)
+
+    def test_no_time_falls_back_to_greedy(self):
+        """Without time for one full iteration, the greedy suggestions come back unchanged."""
+        greedy = [suggestion for _, _, suggestion in search.candidate_moves(search.as_draft_state(self.draft_data), self.slots[0])]
+        self.assertEqual(greedy, search.AlphaBetaSearch(self.draft_data, self.slots, time_limit=0).run())
+        self.assertEqual(greedy[:2], search.search_suggestions(self.draft_data, self.slots, time_limit=0, num_suggestions=2))
+
+
+    def test_process_pool_is_shared(self):
+        """Threads asking for a pool of one size at once all get the same one; another size gets its own."""
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            pools = list(threads.map(search.process_pool, [2] * 16))
+        self.assertTrue(all(pool is pools[0] for pool in pools))
+        self.assertIsNot(pools[0], search.process_pool(3))
+        self.assertIs(pools[0], search.process_pool(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
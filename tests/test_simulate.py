@@ -0,0 +1,41 @@
+import unittest
+import json
+import sys
+import os
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import draft
+import scoring
+import simulate
+from test_scoring import build_draft_data
+
+
+class TestSimulate(unittest.TestCase):
+
+    def test_simulated_draft_row(self):
+        """A headless draft fills every slot and records one decision time per slot."""
+        draft_data = build_draft_data(4)
+        draft_data["scoring_engine"] = scoring.ScoringEngine(draft_data)
+
+        row = simulate.simulate_draft(draft_data, first_pick_team=2)
+
+        self.assertEqual(6, len(row["bans"]))
+        self.assertEqual(10, len(row["picks"]))
+        self.assertEqual([order for _, order in draft.DRAFT_ORDER], list(row["decision_times"]))
+        self.assertEqual("Team Two", row["bans"][0][1])
+        self.assertEqual(row["role_coverage"], draft_data["team_roles"])
+        json.dumps(row)
+
+    def test_first_pick_team_is_a_parameter(self):
+        draft_data = build_draft_data(4)
+        team_1_slots = [order for _, order, team_name in draft.get_draft_slots(draft_data, 1) if team_name == "Team One"]
+        team_2_slots = [order for _, order, team_name in draft.get_draft_slots(draft_data, 2) if team_name == "Team Two"]
+        self.assertEqual(sorted(draft.FIRST_PICK_SLOTS), team_1_slots)
+        self.assertEqual(team_1_slots, team_2_slots)
+
+
+if __name__ == '__main__':
+    unittest.main()
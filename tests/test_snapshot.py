@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import pickle
+import time
+from unittest import mock
+
+import numpy as np
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import cache_store
+import load_data
+import snapshot
+import synthetic_data
+import utils
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_round_trip_matches_dict_data(self):
+        """A reopened snapshot holds the same heroes and map win rates, and its matrices equal the dict-built engine's."""
+        expected = synthetic_data.build_draft_data()
+        with synthetic_data.synthetic_environment(), contextlib.redirect_stdout(io.StringIO()):
+            path = snapshot.build_snapshot("major", "2.55").path
+            reopened = snapshot.Snapshot(path)
+            self.assertTrue(reopened.is_current())
+            draft_data = load_data.load_and_initialize_draft(use_snapshot=True)
+
+        self.assertIsInstance(draft_data["hero_matchup_data"], snapshot.MatchupView)
+        self.assertEqual(expected["hero_winrates_by_map"], reopened.hero_winrates_by_map())
+        self.assertEqual(set(expected["hero_matchup_data"]), set(reopened.hero_matchup_data()))
+
+        engine, dict_engine = draft_data["scoring_engine"], expected["scoring_engine"]
+        self.assertEqual(dict_engine.heroes, engine.heroes)
+        np.testing.assert_array_equal(dict_engine.ally_matrix, engine.ally_matrix)
+        np.testing.assert_array_equal(dict_engine.enemy_matrix, engine.enemy_matrix)
+        heroes, ally, enemy = reopened.hero_matchup_data().dense_matrices()
+        positions = [dict_engine.hero_index[hero] for hero in heroes]
+        np.testing.assert_array_equal(dict_engine.ally_matrix[np.ix_(positions, positions)], ally)
+        np.testing.assert_array_equal(dict_engine.enemy_matrix[np.ix_(positions, positions)], enemy)
+
+    def test_stale_or_old_snapshots_are_rebuilt(self):
+        """A refetched API response or another format version makes the snapshot stale, and loading rebuilds it."""
+        with synthetic_data.synthetic_environment(), contextlib.redirect_stdout(io.StringIO()):
+            built = snapshot.load_snapshot("major", "2.55")
+            self.assertEqual(built.source_hash, snapshot.load_snapshot("major", "2.55").source_hash)
+
+            store = utils.get_cache_store()
+            key = cache_store.cache_key(*utils.hero_matchup_request("Hero01", "major", "2.55"))
+            store.put(key, store.get(key).value, fetched_at=time.time() + 60)
+            self.assertFalse(built.is_current())
+            self.assertIsNone(snapshot.current_snapshot("major", "2.55"))
+            rebuilt = snapshot.load_snapshot("major", "2.55")
+            self.assertNotEqual(built.source_hash, rebuilt.source_hash)
+            self.assertTrue(rebuilt.is_current())
+
+            with mock.patch.object(snapshot, "FORMAT_VERSION", snapshot.FORMAT_VERSION + 1):
+                self.assertIsNone(snapshot.current_snapshot("major", "2.55"))
+                upgraded = snapshot.load_snapshot("major", "2.55")
+                self.assertEqual(snapshot.FORMAT_VERSION, upgraded.format_version)
+                self.assertTrue(upgraded.is_current())
+
+    def test_pickles_as_memmap(self):
+        """A pickled snapshot reopens the file as memory maps instead of carrying the arrays."""
+        with synthetic_data.synthetic_environment(), contextlib.redirect_stdout(io.StringIO()):
+            built = snapshot.build_snapshot("major", "2.55")
+            payload = pickle.dumps(built)
+            restored = pickle.loads(payload)
+
+            self.assertLess(len(payload), 1024)
+            self.assertIsInstance(restored.ally_win_rates, np.memmap)
+            np.testing.assert_array_equal(built.ally_win_rates, restored.ally_win_rates)
+            self.assertEqual(built.hero_winrates_by_map(), restored.hero_winrates_by_map())
+            self.assertTrue(restored.is_current())
+
+
+if __name__ == '__main__':
+    unittest.main()
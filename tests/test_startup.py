@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.insert(0, SRC_DIR)
+
+import utils
+
+HEAVY_MODULES = ["requests", "dotenv", "watchdog", "pyautogui", "pytesseract", "PIL", "multiprocessing"]
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_imports_are_side_effect_free(self):
+        """Importing every entry module loads no heavy dependency, creates no data directory and leaves sys.path alone."""
+        with tempfile.TemporaryDirectory() as root:
+            cwd = os.path.join(root, "src")
+            os.makedirs(cwd)
+            code = (
+                "import json, sys; path = list(sys.path); "
+                "import draft, simulate, map_choice, live_monitor, draft_screen_scraper; "
+                f"print(json.dumps([[m for m in {HEAVY_MODULES!r} if m in sys.modules], sys.path == path]))"
+            )
+            completed = subprocess.run(
+                [sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONPATH": SRC_DIR}
+            )
+            heavy, path_unchanged = json.loads(completed.stdout)
+
+            self.assertEqual([], heavy)
+            self.assertTrue(path_unchanged)
+            self.assertEqual(["src"], os.listdir(root))
+
+    def test_config_module(self):
+        """Config modules load from config/ on first use without touching sys.path; a missing one fails clearly."""
+        path = list(sys.path)
+        hero_config = utils.config_module("hero_config")
+        self.assertIn("Tank", hero_config.required_roles)
+        self.assertIs(hero_config, utils.config_module("hero_config"))
+        self.assertEqual(path, sys.path)
+
+        with self.assertRaises(FileNotFoundError):
+            utils.config_module("missing_config")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import json
+
+# ✅ Ensure src directory is in sys.path so tests can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import load_data
+import synthetic_data
+import warm_cache
+
+ROSTERS = [
+    (synthetic_data.TEAM_1_NAME, synthetic_data.TEAM_1_TAGS),
+    (synthetic_data.TEAM_2_NAME, synthetic_data.TEAM_2_TAGS),
+    ("Mixed", synthetic_data.TEAM_1_TAGS[:3] + ["Missing#9999"]),
+]
+
+
+class TestWarmCache(unittest.TestCase):
+
+    def test_warm_division_then_draft_offline(self):
+        """Every response is fetched once across overlapping rosters and timeframes; drafts then load without requests."""
+        with synthetic_data.mock_api() as server, synthetic_data.synthetic_environment(warm=False), contextlib.redirect_stdout(io.StringIO()):
+            summary = warm_cache.warm_division(ROSTERS, [("major", "2.55"), ("major", "2.55")])
+            requests = server.snapshot_stats()["requests"]
+
+            self.assertEqual(11, summary["players"])
+            self.assertEqual(1 + 1 + synthetic_data.NUM_HEROES + 11 * 2, requests)
+            self.assertEqual(2, len(summary["failed"]))
+
+            again = warm_cache.warm_division(ROSTERS, [("major", "2.55")])
+            self.assertEqual(again["requests"], again["cached"])
+            draft_data = load_data.load_and_initialize_draft()
+            self.assertEqual(requests, server.snapshot_stats()["requests"])
+
+        self.assertEqual(synthetic_data.build_draft_data()["team_2_player_mmr_data"], draft_data["team_2_player_mmr_data"])
+
+    def test_cli_reads_team_configs_and_rosters(self):
+        """Team configs and rosters files are merged into one deduplicated warm-up, even when team names repeat."""
+        with synthetic_data.mock_api() as server, synthetic_data.synthetic_environment(warm=False) as data_dir, \
+                contextlib.redirect_stdout(io.StringIO()):
+            config_path = os.path.join(data_dir, "team_a.py")
+            with open(config_path, "w") as f:
+                f.write(f"team_1_name = 'A'\nteam_1_tags = {synthetic_data.TEAM_1_TAGS!r}\n"
+                        f"team_2_name = 'B'\nteam_2_tags = {synthetic_data.TEAM_2_TAGS!r}\nmap_name = 'Towers of Doom'\n")
+            rosters_path = os.path.join(data_dir, "division.json")
+            with open(rosters_path, "w") as f:
+                json.dump({"A": ["Other#3000"]}, f)  # ✅ Another division's team with the same name
+
+            summary = warm_cache.main(["--team-config", config_path, "--rosters", rosters_path, "--no-snapshot"])
+            requests = server.snapshot_stats()["requests"]
+
+        self.assertEqual(11, summary["players"])
+        self.assertEqual(1 + 1 + synthetic_data.NUM_HEROES + 11 * 2, requests)
+        self.assertEqual(2, len(summary["failed"]))
+
+
+if __name__ == '__main__':
+    unittest.main()